@@ -3,9 +3,65 @@ import boto3
 import requests
 from bs4 import BeautifulSoup
 
-# Version 1.1 - Added HTML-based category extraction from post-meta div
+# Version 1.2 - Read publisher text sidecar before falling back to HTML parsing
 s3 = boto3.client('s3')
 
+# Map display names to internal format
+CATEGORY_MAP = {
+    'Parenting & Custody': 'parenting',
+    'Legal Procedures': 'legal',
+    'Child Support': 'child_support',
+    'Family Violence': 'family_violence',
+    'Property Settlement': 'property_settlement',
+    'Mental Health': 'mental_health',
+    'Conflict Resolution': 'conflict_resolution'
+}
+
+def fetch_sidecar(article_url):
+    """Fetch the text sidecar (articles/<name>.json) written when the article was published"""
+    if not article_url.endswith('.html'):
+        return None
+    try:
+        response = requests.get(article_url[:-len('.html')] + '.json', timeout=10)
+        if response.status_code != 200:
+            return None
+        sidecar = response.json()
+    except Exception:
+        return None
+    if not sidecar.get('content'):
+        return None
+    return sidecar
+
+def parse_article_html(article_url):
+    """Download and parse the published article HTML"""
+    response = requests.get(article_url, timeout=30)
+    response.raise_for_status()
+    
+    soup = BeautifulSoup(response.content, 'html.parser')
+    
+    title_element = soup.find('h1', class_='post-title')
+    title = title_element.get_text().strip() if title_element else 'DadAssist Article'
+    
+    content_element = soup.find('div', class_='post-content')
+    if content_element:
+        content = content_element.get_text()
+    else:
+        paragraphs = soup.find_all('p')
+        content = '\n'.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
+    
+    content = content.replace('\n\n\n', '\n\n').strip()
+    
+    # Extract category from post-meta div
+    category = ''
+    meta_element = soup.find('div', class_='post-meta')
+    if meta_element:
+        meta_text = meta_element.get_text()
+        if 'Category:' in meta_text:
+            category_text = meta_text.split('Category:')[1].split('|')[0].strip()
+            category = CATEGORY_MAP.get(category_text, 'legal')
+    
+    return title, content, category
+
 def lambda_handler(event, context):
     article_url = event.get('article_url', '')
     
@@ -13,42 +69,14 @@ def lambda_handler(event, context):
         return {'statusCode': 400, 'body': json.dumps({'error': 'No article_url provided'})}
     
     try:
-        response = requests.get(article_url, timeout=30)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        title_element = soup.find('h1', class_='post-title')
-        title = title_element.get_text().strip() if title_element else 'DadAssist Article'
-        
-        content_element = soup.find('div', class_='post-content')
-        if content_element:
-            content = content_element.get_text()
+        # Prefer the publisher's text sidecar; fall back to parsing the HTML
+        sidecar = fetch_sidecar(article_url)
+        if sidecar:
+            title = sidecar.get('title') or 'DadAssist Article'
+            content = sidecar['content']
+            category = CATEGORY_MAP.get(sidecar.get('category', ''), 'legal')
         else:
-            paragraphs = soup.find_all('p')
-            content = '\n'.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-        
-        content = content.replace('\n\n\n', '\n\n').strip()
-        
-        # Extract category from post-meta div
-        category = ''
-        meta_element = soup.find('div', class_='post-meta')
-        if meta_element:
-            meta_text = meta_element.get_text()
-            if 'Category:' in meta_text:
-                category_text = meta_text.split('Category:')[1].split('|')[0].strip()
-                
-                # Map display names to internal format
-                category_map = {
-                    'Parenting & Custody': 'parenting',
-                    'Legal Procedures': 'legal',
-                    'Child Support': 'child_support',
-                    'Family Violence': 'family_violence',
-                    'Property Settlement': 'property_settlement',
-                    'Mental Health': 'mental_health',
-                    'Conflict Resolution': 'conflict_resolution'
-                }
-                category = category_map.get(category_text, 'legal')
+            title, content, category = parse_article_html(article_url)
         
         import uuid
         execution_id = str(uuid.uuid4())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+DadAssist Content Summarizer
+Token-aware chunking and parallel map-reduce summarization of long source content,
+so prompts stay within a bounded size without cutting text mid-sentence.
+"""
+
+import re
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+# Rough Claude tokenizer ratio for English prose (~4 characters per token)
+CHARS_PER_TOKEN = 4
+
+DEFAULT_MODEL_ID = 'anthropic.claude-3-haiku-20240307-v1:0'
+
+MAP_PROMPT = '''Summarise this excerpt from a legal article for Australian fathers.
+Keep every fact, figure, deadline, legal term and practical step. Drop repetition and filler.
+Write plain prose of at most {target_words} words. Return only the summary.
+
+Excerpt {part} of {total}:
+{chunk}'''
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+def estimate_tokens(text):
+    """Estimate the number of model tokens in text"""
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def _split_sentences(paragraph):
+    """Split a paragraph into sentences"""
+    return [s.strip() for s in _SENTENCE_END.split(paragraph) if s.strip()]
+
+def _split_words(sentence, max_tokens):
+    """Split an over-long sentence on word boundaries"""
+    pieces = []
+    current = []
+    current_tokens = 0
+
+    for word in sentence.split():
+        word_tokens = estimate_tokens(word) + 1
+        if current and current_tokens + word_tokens > max_tokens:
+            pieces.append(' '.join(current))
+            current = []
+            current_tokens = 0
+        current.append(word)
+        current_tokens += word_tokens
+
+    if current:
+        pieces.append(' '.join(current))
+    return pieces
+
+def chunk_text(text, max_tokens=1500):
+    """Split text into chunks of at most max_tokens, breaking on paragraph then sentence boundaries"""
+    if not text:
+        return []
+
+    # Break into units no larger than the budget, preferring whole paragraphs
+    units = []
+    for paragraph in re.split(r'\n\s*\n', text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if estimate_tokens(paragraph) <= max_tokens:
+            units.append(paragraph)
+            continue
+        for sentence in _split_sentences(paragraph):
+            if estimate_tokens(sentence) <= max_tokens:
+                units.append(sentence)
+            else:
+                units.extend(_split_words(sentence, max_tokens))
+
+    # Greedily pack units into chunks
+    chunks = []
+    current = []
+    current_tokens = 0
+
+    for unit in units:
+        unit_tokens = estimate_tokens(unit) + 1
+        if current and current_tokens + unit_tokens > max_tokens:
+            chunks.append('\n\n'.join(current))
+            current = []
+            current_tokens = 0
+        current.append(unit)
+        current_tokens += unit_tokens
+
+    if current:
+        chunks.append('\n\n'.join(current))
+
+    return chunks
+
+def trim_to_tokens(text, max_tokens):
+    """Trim text to at most max_tokens, ending on a sentence boundary where possible"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    chunks = chunk_text(text, max_tokens)
+    if not chunks:
+        return ''
+
+    trimmed = chunks[0]
+    if estimate_tokens(trimmed) > max_tokens:
+        trimmed = trimmed[:max_tokens * CHARS_PER_TOKEN]
+    return trimmed
+
+def bedrock_invoker(bedrock, model_id=DEFAULT_MODEL_ID):
+    """Build a prompt -> text callable backed by a Bedrock runtime client"""
+
+    def invoke(prompt, max_tokens):
+        response = bedrock.invoke_model(
+            modelId=model_id,
+            body=json.dumps({
+                'anthropic_version': 'bedrock-2023-05-31',
+                'max_tokens': max_tokens,
+                'messages': [{'role': 'user', 'content': prompt}]
+            })
+        )
+        response_body = json.loads(response['body'].read())
+        return response_body['content'][0]['text']
+
+    return invoke
+
+def _summarize_chunks(chunks, invoke, target_tokens, max_workers):
+    """Map step: summarise every chunk concurrently, preserving order"""
+    target_words = max(30, int(target_tokens * 0.75))
+
+    def summarize(indexed_chunk):
+        index, chunk = indexed_chunk
+        prompt = MAP_PROMPT.format(
+            target_words=target_words,
+            part=index + 1,
+            total=len(chunks),
+            chunk=chunk
+        )
+        try:
+            return invoke(prompt, target_tokens * 2).strip()
+        except Exception as e:
+            print(f"  ⚠️  Chunk {index + 1} summary failed, keeping leading text: {e}")
+            return trim_to_tokens(chunk, target_tokens)
+
+    workers = max(1, min(max_workers, len(chunks)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(summarize, enumerate(chunks)))
+
+def condense_content(text, invoke=None, max_tokens=750, chunk_tokens=1500, max_workers=4, max_rounds=3):
+    """
+    Condense text to fit within max_tokens.
+
+    Short text is returned unchanged. Longer text is chunked and each chunk is
+    summarised concurrently (map); the summaries are joined (reduce) and the
+    process repeats until the result fits. Without an invoke callable, or if the
+    rounds run out, the text is trimmed on a sentence boundary instead.
+    """
+    text = (text or '').strip()
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    if invoke is None:
+        return trim_to_tokens(text, max_tokens)
+
+    for round_number in range(1, max_rounds + 1):
+        chunks = chunk_text(text, chunk_tokens)
+        # Give each chunk an equal share of the final budget
+        target_tokens = max(50, max_tokens // len(chunks))
+
+        print(f"  🧩 Condensing {estimate_tokens(text)} tokens in {len(chunks)} chunks (round {round_number})")
+        summaries = _summarize_chunks(chunks, invoke, target_tokens, max_workers)
+        text = '\n\n'.join(s for s in summaries if s)
+
+        if estimate_tokens(text) <= max_tokens:
+            return text
+
+    return trim_to_tokens(text, max_tokens)
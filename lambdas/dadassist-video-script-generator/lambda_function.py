@@ -1,5 +1,6 @@
 import json
 import boto3
+from content_summarizer import condense_content, bedrock_invoker
 
 s3 = boto3.client("s3")
 bedrock = boto3.client("bedrock-runtime", region_name="us-east-1")
@@ -30,10 +31,12 @@ def lambda_handler(event, context):
         if not category:
             category = article_data.get("category", "")
         
+        article_content = condense_content(article_data["content"], invoke=bedrock_invoker(bedrock), max_tokens=750)
+        
         prompt = f"""Transform this legal article into an engaging video script for Australian fathers.
 
 Article Title: {article_data["title"]}
-Article Content: {article_data["content"][:3000]}...
+Article Content: {article_content}
 
 CRITICAL REQUIREMENTS - DO NOT EXCEED WORD LIMIT:
 1. Total script MAXIMUM 200 words - DO NOT EXCEED THIS UNDER ANY CIRCUMSTANCES
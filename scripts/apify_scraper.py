@@ -11,6 +11,8 @@ import random
 from datetime import datetime
 from apify_client import ApifyClient
 
+from state_store import StateStore
+
 def load_config():
     """Load scraping configuration"""
     with open('config/apify_config.json', 'r') as f:
@@ -18,43 +20,11 @@ def load_config():
 
 def load_scraped_urls():
     """Load previously scraped URLs from exclusion list"""
-    try:
-        with open('config/scraped_urls.json', 'r') as f:
-            data = json.load(f)
-            return set(data.get('scraped_urls', []))
-    except FileNotFoundError:
-        print("⚠️  No scraped_urls.json found - creating new file")
-        initial_data = {
-            "scraped_urls": [],
-            "last_updated": datetime.now().isoformat(),
-            "total_scraped": 0
-        }
-        os.makedirs('config', exist_ok=True)
-        with open('config/scraped_urls.json', 'w') as f:
-            json.dump(initial_data, f, indent=2)
-        return set()
+    return StateStore().scraped_urls()
 
 def add_to_scraped_urls(urls):
     """Add URLs to exclusion list"""
-    try:
-        with open('config/scraped_urls.json', 'r') as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        data = {"scraped_urls": [], "total_scraped": 0}
-    
-    added_count = 0
-    for url in urls:
-        if url not in data['scraped_urls']:
-            data['scraped_urls'].append(url)
-            added_count += 1
-    
-    data['last_updated'] = datetime.now().isoformat()
-    data['total_scraped'] = len(data['scraped_urls'])
-    
-    with open('config/scraped_urls.json', 'w') as f:
-        json.dump(data, f, indent=2)
-    
-    return added_count
+    return StateStore().add_scraped_urls(urls)
 
 def run_google_search_scraper(client, config):
     """Run Google Search Results Scraper with cycling search queries"""
@@ -183,13 +153,12 @@ def save_results_simple(filtered_urls, config):
     if not filtered_urls:
         print("⚠️  No new URLs to save")
         # Save empty run info
-        with open('downloads/latest_run.json', 'w') as f:
-            json.dump({
-                'success': False,
-                'new_url_count': 0,
-                'timestamp': datetime.now().isoformat(),
-                'message': 'No new URLs found - all already scraped'
-            }, f, indent=2)
+        StateStore().save_latest_run({
+            'success': False,
+            'new_url_count': 0,
+            'timestamp': datetime.now().isoformat(),
+            'message': 'No new URLs found - all already scraped'
+        })
         return None, 0
     
     # Randomize selection from available URLs
@@ -235,8 +204,7 @@ def save_results_simple(filtered_urls, config):
         'timestamp': timestamp,
         'results_dir': results_dir
     }
-    with open('downloads/latest_run.json', 'w') as f:
-        json.dump(latest_run, f, indent=2)
+    StateStore().save_latest_run(latest_run)
     
     print(f"✅ Saved {len(selected_urls)} URLs to {results_dir}")
     return results_dir, new_url_count
@@ -356,8 +324,7 @@ def run_scraping(client, config, search_query):
             "new_url_count": new_url_count
         }
         
-        with open("downloads/latest_run.json", 'w') as f:
-            json.dump(run_info, f, indent=2)
+        StateStore().save_latest_run(run_info)
         
         # Update search rotation for next run
         update_search_rotation(config)
@@ -374,9 +341,7 @@ def run_scraping(client, config, search_query):
             "error": str(e)
         }
         
-        os.makedirs("downloads", exist_ok=True)
-        with open("downloads/latest_run.json", 'w') as f:
-            json.dump(error_info, f, indent=2)
+        StateStore().save_latest_run(error_info)
         
         return False
 
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+DadAssist Article Catalog Client
+Reads the posts/index.json catalog feed published alongside posts/index.html.
+Uses a conditional GET (ETag / Last-Modified) so unchanged catalogs cost one 304.
+"""
+
+import json
+import os
+import requests
+
+CATALOG_URL = 'https://dadassist.com.au/posts/index.json'
+CACHE_DIR = os.getenv('DADASSIST_CACHE_DIR', os.path.expanduser('~/.cache/dadassist'))
+CACHE_FILE = os.path.join(CACHE_DIR, 'article_catalog.json')
+
+def load_cached_catalog(cache_file=CACHE_FILE):
+    """Load the last catalog response and its validators"""
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading cached catalog: {e}")
+    return None
+
+def save_cached_catalog(cached, cache_file=CACHE_FILE):
+    os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+    with open(cache_file, 'w') as f:
+        json.dump(cached, f)
+
+def fetch_catalog(catalog_url=CATALOG_URL, cache_file=CACHE_FILE, timeout=10):
+    """
+    Return the list of catalog entries, or None if no catalog is published.
+
+    Entries have filename, title, description, category, updated and content_hash.
+    """
+    cached = load_cached_catalog(cache_file)
+
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    response = requests.get(catalog_url, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and cached:
+        print(f"📋 Catalog unchanged since last fetch ({len(cached['catalog']['articles'])} articles)")
+        return cached['catalog']['articles']
+
+    if response.status_code == 404:
+        print(f"⚠️ No catalog published at {catalog_url}")
+        return None
+
+    response.raise_for_status()
+    catalog = response.json()
+
+    save_cached_catalog({
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'catalog': catalog
+    }, cache_file)
+
+    print(f"📋 Fetched catalog with {len(catalog['articles'])} articles")
+    return catalog['articles']
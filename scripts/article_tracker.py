@@ -6,74 +6,136 @@ Tracks which articles have been posted to which platforms and when
 
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
+
+from state_store import StateStore
+
+DEFAULT_PLATFORMS = ['twitter', 'facebook', 'instagram']
+REPORT_PLATFORMS = ['twitter', 'facebook', 'instagram', 'tiktok']
+RECENT_DAYS = 7
 
 class ArticleTracker:
-    def __init__(self):
-        self.tracking_file = 'social-media/posted_articles_tracking.json'
-        self.previous_articles_file = 'social-media/previous_articles.json'
-        
+    """
+    Tracks posting state in memory.
+
+    Posting state is read from the state store once on first use and indexed
+    by article; changes are kept in memory and written back in one
+    transaction by flush(), or on leaving a `with ArticleTracker() as tracker:` block.
+
+    generate_posting_report never loads the history: counters come from a
+    GROUP BY in the state store and recent posts from its posted_date index.
+    """
+
+    def __init__(self, store=None):
+        self.store = store or StateStore()
+        self._tracking_data = None
+        self._posted_platforms = {}
+        self._pending = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+        return False
+
+    @property
+    def tracking_data(self):
+        """Tracking data, loaded lazily on first access"""
+        self._ensure_loaded()
+        return self._tracking_data
+
+    def _ensure_loaded(self):
+        if self._tracking_data is None:
+            self._index(self.store.tracking_data())
+
+    def _index(self, tracking_data):
+        self._tracking_data = tracking_data
+        self._posted_platforms = {
+            filename: set(data.get('platforms', {}))
+            for filename, data in tracking_data.items()
+        }
+
     def load_tracking_data(self):
         """Load existing tracking data"""
-        if os.path.exists(self.tracking_file):
-            try:
-                with open(self.tracking_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"⚠️ Error loading tracking data: {e}")
-                return {}
-        return {}
-    
+        return self.tracking_data
+
     def save_tracking_data(self, tracking_data):
-        """Save tracking data to file"""
-        os.makedirs('social-media', exist_ok=True)
-        with open(self.tracking_file, 'w') as f:
-            json.dump(tracking_data, f, indent=2)
-    
+        """Replace tracking data and write it to the state store"""
+        self._index(tracking_data)
+        self._pending = {
+            (filename, platform): details
+            for filename, data in tracking_data.items()
+            for platform, details in data.get('platforms', {}).items()
+        }
+        self.flush()
+
+    def flush(self):
+        """Write pending changes to the state store in one transaction"""
+        if not self._pending:
+            return
+
+        self.store.record_posts([
+            (filename, platform, details)
+            for (filename, platform), details in self._pending.items()
+        ])
+        self._pending = {}
+
     def mark_article_posted(self, article_filename, platform, post_result):
         """Mark an article as posted to a specific platform"""
-        tracking_data = self.load_tracking_data()
-        
+        tracking_data = self.tracking_data
+        now = datetime.now().isoformat()
+
         if article_filename not in tracking_data:
             tracking_data[article_filename] = {
-                'first_posted': datetime.now().isoformat(),
+                'first_posted': now,
                 'platforms': {}
             }
-        
+
         # Record platform-specific posting details
-        tracking_data[article_filename]['platforms'][platform] = {
-            'posted_date': datetime.now().isoformat(),
+        tracking_data[article_filename]['platforms'][platform] = details = {
+            'posted_date': now,
             'success': post_result.get('success', False),
             'post_id': post_result.get('post_id', ''),
             'url': post_result.get('url', ''),
             'message': post_result.get('message', ''),
             'error': post_result.get('error', '')
         }
-        
+
         # Update last posted date
-        tracking_data[article_filename]['last_posted'] = datetime.now().isoformat()
-        
-        self.save_tracking_data(tracking_data)
+        tracking_data[article_filename]['last_posted'] = now
+
+        self._posted_platforms.setdefault(article_filename, set()).add(platform)
+        self._pending[(article_filename, platform)] = details
         print(f"📝 Tracked: {article_filename} posted to {platform}")
-    
+
     def is_article_posted(self, article_filename, platform=None):
         """Check if article has been posted to a platform"""
-        tracking_data = self.load_tracking_data()
-        
-        if article_filename not in tracking_data:
+        self._ensure_loaded()
+        posted = self._posted_platforms.get(article_filename)
+
+        if not posted:
             return False
-        
+
         if platform:
             # Check specific platform
-            return platform in tracking_data[article_filename]['platforms']
-        else:
-            # Check if posted to any platform
-            return len(tracking_data[article_filename]['platforms']) > 0
-    
+            return platform in posted
+        # Check if posted to any platform
+        return True
+
+    def missing_platforms(self, article_filenames, platforms=DEFAULT_PLATFORMS):
+        """Batch query: {filename: [platforms not yet posted]} for each filename"""
+        self._ensure_loaded()
+        empty = set()
+        return {
+            filename: [p for p in platforms if p not in self._posted_platforms.get(filename, empty)]
+            for filename in article_filenames
+        }
+
     def get_article_posting_status(self, article_filename):
         """Get detailed posting status for an article"""
-        tracking_data = self.load_tracking_data()
-        
+        tracking_data = self.tracking_data
+
         if article_filename not in tracking_data:
             return {
                 'posted': False,
@@ -81,7 +143,7 @@ class ArticleTracker:
                 'first_posted': None,
                 'last_posted': None
             }
-        
+
         article_data = tracking_data[article_filename]
         return {
             'posted': len(article_data['platforms']) > 0,
@@ -90,112 +152,78 @@ class ArticleTracker:
             'last_posted': article_data.get('last_posted'),
             'platform_details': article_data['platforms']
         }
-    
-    def get_unposted_articles(self, all_articles, platforms=['twitter', 'facebook', 'instagram']):
+
+    def get_unposted_articles(self, all_articles, platforms=DEFAULT_PLATFORMS):
         """Get articles that haven't been posted to all specified platforms"""
+        missing = self.missing_platforms([article['filename'] for article in all_articles], platforms)
         unposted = []
-        
+
         for article in all_articles:
-            filename = article['filename']
-            missing_platforms = []
-            
-            for platform in platforms:
-                if not self.is_article_posted(filename, platform):
-                    missing_platforms.append(platform)
-            
+            missing_platforms = missing[article['filename']]
             if missing_platforms:
                 article_copy = article.copy()
                 article_copy['missing_platforms'] = missing_platforms
                 unposted.append(article_copy)
-        
+
         return unposted
-    
+
     def remove_posted_from_queue(self, new_articles_file='social-media/new_articles_found.json'):
         """Remove fully posted articles from the new articles queue"""
         if not os.path.exists(new_articles_file):
             return
-        
+
         try:
             with open(new_articles_file, 'r') as f:
                 queue_data = json.load(f)
-            
+
             original_count = len(queue_data['new_articles'])
-            platforms = ['twitter', 'facebook', 'instagram']
-            
-            # Filter out articles posted to all platforms
+            missing = self.missing_platforms([article['filename'] for article in queue_data['new_articles']])
+
+            # Keep articles not yet posted to all platforms
             filtered_articles = []
             for article in queue_data['new_articles']:
-                filename = article['filename']
-                posted_platforms = []
-                
-                if self.is_article_posted(filename):
-                    status = self.get_article_posting_status(filename)
-                    posted_platforms = status['platforms']
-                
-                # Keep article if not posted to all platforms
-                if len(posted_platforms) < len(platforms):
-                    article['remaining_platforms'] = [p for p in platforms if p not in posted_platforms]
+                remaining_platforms = missing[article['filename']]
+                if remaining_platforms:
+                    article['remaining_platforms'] = remaining_platforms
                     filtered_articles.append(article)
-            
+
             # Update queue
             queue_data['new_articles'] = filtered_articles
             queue_data['new_articles_count'] = len(filtered_articles)
             queue_data['last_filtered'] = datetime.now().isoformat()
-            
-            with open(new_articles_file, 'w') as f:
+
+            temp_file = new_articles_file + '.tmp'
+            with open(temp_file, 'w') as f:
                 json.dump(queue_data, f, indent=2)
-            
+            os.replace(temp_file, new_articles_file)
+
             removed_count = original_count - len(filtered_articles)
             print(f"📋 Filtered queue: {removed_count} fully posted articles removed, {len(filtered_articles)} remaining")
-            
+
         except Exception as e:
             print(f"⚠️ Error filtering queue: {e}")
-    
+
     def generate_posting_report(self):
-        """Generate a report of all posting activity"""
-        tracking_data = self.load_tracking_data()
+        """Generate a report of all posting activity from indexed state store queries"""
+        self.flush()
+        now = datetime.now()
+        platform_stats = {platform: 0 for platform in REPORT_PLATFORMS}
+        platform_failures = dict(platform_stats)
+        successes, failures = self.store.post_counts()
+        platform_stats.update(successes)
+        platform_failures.update(failures)
+        
+        # A post counts as recent while whole days elapsed <= RECENT_DAYS
+        since = (now - timedelta(days=RECENT_DAYS + 1)).isoformat()
         
-        report = {
-            'generated_date': datetime.now().isoformat(),
-            'total_articles_posted': len(tracking_data),
-            'platform_stats': {
-                'twitter': 0,
-                'facebook': 0,
-                'instagram': 0,
-                'tiktok': 0
-            },
-            'recent_posts': [],
-            'failed_posts': []
+        return {
+            'generated_date': now.isoformat(),
+            'total_articles_posted': self.store.posted_article_count(),
+            'platform_stats': platform_stats,
+            'platform_failures': platform_failures,
+            'recent_posts': self.store.successful_posts_since(since),
+            'failed_posts': self.store.failed_posts()
         }
-        
-        for filename, data in tracking_data.items():
-            for platform, post_data in data['platforms'].items():
-                if post_data['success']:
-                    report['platform_stats'][platform] += 1
-                    
-                    # Add to recent posts (last 7 days)
-                    post_date = datetime.fromisoformat(post_data['posted_date'].replace('Z', '+00:00'))
-                    days_ago = (datetime.now() - post_date.replace(tzinfo=None)).days
-                    
-                    if days_ago <= 7:
-                        report['recent_posts'].append({
-                            'filename': filename,
-                            'platform': platform,
-                            'posted_date': post_data['posted_date'],
-                            'url': post_data.get('url', '')
-                        })
-                else:
-                    report['failed_posts'].append({
-                        'filename': filename,
-                        'platform': platform,
-                        'error': post_data.get('error', 'Unknown error'),
-                        'attempted_date': post_data['posted_date']
-                    })
-        
-        # Sort recent posts by date
-        report['recent_posts'].sort(key=lambda x: x['posted_date'], reverse=True)
-        
-        return report
 
 # Test function
 if __name__ == "__main__":
@@ -211,6 +239,7 @@ if __name__ == "__main__":
     }
     
     tracker.mark_article_posted('best-interests-of-children.html', 'twitter', sample_result)
+    tracker.flush()
     
     status = tracker.get_article_posting_status('best-interests-of-children.html')
     print(f"Article status: {status}")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Local artifact cache for S3 objects.
+
+Downloads an S3 object once into DADASSIST_CACHE_DIR/artifacts, keyed by the
+URL and the object's ETag, so every step that needs the same video reads it
+from disk. Each entry has a sidecar with its size and SHA-256; a cached file
+is only handed out after it re-hashes to the recorded checksum, and a fresh
+download is checked against the ETag when S3 reports a plain MD5 one.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import requests
+
+CACHE_DIR = os.getenv('DADASSIST_CACHE_DIR', os.path.expanduser('~/.cache/dadassist'))
+ARTIFACT_DIR = os.path.join(CACHE_DIR, 'artifacts')
+ARTIFACT_MAX_AGE_DAYS = int(os.getenv('ARTIFACT_MAX_AGE_DAYS', '14'))
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+def url_key(s3_url):
+    return hashlib.sha256(s3_url.encode('utf-8')).hexdigest()[:16]
+
+def artifact_path(s3_url, etag):
+    extension = os.path.splitext(s3_url.split('?')[0])[1] or '.bin'
+    return os.path.join(ARTIFACT_DIR, f'{url_key(s3_url)}-{etag}{extension}')
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def load_entry(path):
+    try:
+        with open(path + '.json', 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def is_valid(path, entry, size):
+    """True if a cached file matches the size and checksum recorded when it was downloaded"""
+    return (
+        entry is not None
+        and os.path.exists(path)
+        and entry.get('size') == size
+        and os.path.getsize(path) == size
+        and file_sha256(path) == entry.get('sha256')
+    )
+
+def download(s3_url, path, etag, size):
+    """Stream the object to path, hashing as it goes"""
+    temp_file = f'{path}.{os.getpid()}.part'
+    sha256 = hashlib.sha256()
+    md5 = hashlib.md5()
+    try:
+        with requests.get(s3_url, stream=True, timeout=300) as response:
+            response.raise_for_status()
+            with open(temp_file, 'wb') as f:
+                for block in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(block)
+                    sha256.update(block)
+                    md5.update(block)
+
+        downloaded = os.path.getsize(temp_file)
+        if downloaded != size:
+            raise IOError(f"Downloaded {downloaded} bytes, expected {size}")
+        # Multipart uploads have an ETag of the form <md5-of-md5s>-<parts>, which can't be checked this way
+        if '-' not in etag and md5.hexdigest() != etag:
+            raise IOError(f"Checksum mismatch: MD5 {md5.hexdigest()} != ETag {etag}")
+
+        os.replace(temp_file, path)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+    entry = {
+        's3_url': s3_url,
+        'etag': etag,
+        'size': size,
+        'sha256': sha256.hexdigest(),
+        'downloaded_at': time.time()
+    }
+    with open(path + '.json', 'w') as f:
+        json.dump(entry, f, indent=2)
+    return entry
+
+def prune(keep_path):
+    """Remove artifacts older than ARTIFACT_MAX_AGE_DAYS, and superseded versions of the same URL"""
+    prefix = os.path.basename(keep_path).split('-', 1)[0]
+    cutoff = time.time() - ARTIFACT_MAX_AGE_DAYS * 86400
+    for name in os.listdir(ARTIFACT_DIR):
+        path = os.path.join(ARTIFACT_DIR, name)
+        if name.endswith('.json') or path == keep_path:
+            continue
+        if name.startswith(prefix) or os.path.getmtime(path) < cutoff:
+            for stale in (path, path + '.json'):
+                if os.path.exists(stale):
+                    os.remove(stale)
+
+def fetch(s3_url):
+    """Local path to a verified copy of the S3 object, downloading it only if needed"""
+    response = requests.head(s3_url, timeout=30)
+    response.raise_for_status()
+    etag = response.headers.get('ETag', '').strip('"')
+    size = int(response.headers['Content-Length'])
+    if not etag:
+        raise IOError(f"No ETag for {s3_url}")
+
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    path = artifact_path(s3_url, etag)
+
+    if is_valid(path, load_entry(path), size):
+        print(f"📦 Using cached artifact {os.path.basename(path)} ({size / 1024 / 1024:.1f} MB)")
+        os.utime(path)
+    else:
+        print(f"⬇️  Downloading artifact ({size / 1024 / 1024:.1f} MB)...")
+        start = time.time()
+        download(s3_url, path, etag, size)
+        print(f"✅ Cached {os.path.basename(path)} in {time.time() - start:.1f}s")
+
+    prune(path)
+    return path
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print("Usage: artifact_cache.py <s3_url>")
+        sys.exit(1)
+    print(fetch(sys.argv[1]))
@@ -8,15 +8,14 @@ import os
 import json
 from datetime import datetime
 from robust_downloader import RobustDownloader
+from state_store import StateStore
 
 def load_latest_run():
     """Load the latest scraping run information"""
-    try:
-        with open('downloads/latest_run.json', 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
+    run_info = StateStore().latest_run()
+    if run_info is None:
         print("❌ No latest run found. Run apify_scraper.py first.")
-        return None
+    return run_info
 
 def download_articles_robust(urls):
     """Download articles using robust 4-method fallback"""
@@ -207,8 +206,7 @@ def main():
             "extraction_method": "requests_beautifulsoup"
         })
         
-        with open("downloads/latest_run.json", 'w') as f:
-            json.dump(run_info, f, indent=2)
+        StateStore().save_latest_run(run_info)
         
         return True
         
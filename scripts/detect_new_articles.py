@@ -4,85 +4,86 @@ DadAssist Social Media Automation - Article Detection
 Compares current articles on website with previous run to find new articles
 """
 
-import requests
-from bs4 import BeautifulSoup
 import json
 import os
 from datetime import datetime
 
+from site_index import get_site_index
+from state_store import StateStore
+
 def get_current_articles():
-    """Scrape current articles from DadAssist website"""
-    print("🔍 Scraping current articles from dadassist.com.au...")
-    
+    """Get current articles from the shared, TTL-cached site index"""
     try:
-        response = requests.get('https://dadassist.com.au/posts/index.html', timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find all article links
-        article_links = soup.find_all('a', href=lambda x: x and 'articles/' in x)
-        
-        current_articles = []
-        for link in article_links:
-            filename = link['href'].replace('articles/', '')
-            title = link.get_text().strip()
-            
-            # Get description from next sibling div
-            description_div = link.find_next_sibling('div', class_='resource-description')
-            description = description_div.get_text().strip() if description_div else ""
-            
-            current_articles.append({
-                'filename': filename,
-                'title': title,
-                'description': description,
-                'url': f"https://dadassist.com.au/posts/articles/{filename}",
-                'discovered_date': datetime.now().isoformat()
-            })
-        
-        print(f"✅ Found {len(current_articles)} total articles on website")
-        return current_articles
-        
+        site_articles = get_site_index()
     except Exception as e:
-        print(f"❌ Error scraping articles: {e}")
+        print(f"❌ Error loading site index: {e}")
         return []
+    
+    discovered_date = datetime.now().isoformat()
+    current_articles = [{
+        'filename': entry['filename'],
+        'title': entry['title'],
+        'description': entry['description'],
+        'category': entry['category'],
+        'content_hash': entry['content_hash'],
+        'url': entry['url'],
+        'discovered_date': discovered_date
+    } for entry in site_articles]
+    
+    print(f"✅ Found {len(current_articles)} total articles on website")
+    return current_articles
 
-def load_previous_articles():
-    """Load previous articles list from file"""
-    previous_file = 'social-media/previous_articles.json'
-    
-    if os.path.exists(previous_file):
-        try:
-            with open(previous_file, 'r') as f:
-                previous_articles = json.load(f)
-            print(f"📋 Loaded {len(previous_articles)} articles from previous run")
-            return previous_articles
-        except Exception as e:
-            print(f"⚠️ Error loading previous articles: {e}")
-            return []
-    else:
-        print("📋 No previous articles file found - first run")
-        return []
+def load_known_articles(store=None):
+    """Hashed index of known articles from the state store: {filename: content_hash}"""
+    store = store or StateStore()
+    return store.known_article_hashes()
+
+def diff_articles(current_articles, known):
+    """Split current articles into new, changed and hash-updated lists in one pass"""
+    new_articles = []
+    changed_articles = []
+    learned = []
+    
+    for article in current_articles:
+        filename = article['filename']
+        if filename not in known:
+            new_articles.append(article)
+            continue
+        
+        content_hash = article.get('content_hash', '')
+        known_hash = known[filename]
+        if content_hash and content_hash != known_hash:
+            if known_hash:
+                changed_articles.append(article)
+            else:
+                # First time we have seen a hash for this article - record it, not a change
+                learned.append(article)
+    
+    return new_articles, changed_articles, learned
+
+def record_known_articles(articles, store=None):
+    """Persist only the delta: one upsert per new or changed article"""
+    if not articles:
+        return
+    
+    store = store or StateStore()
+    store.upsert_known_articles(articles)
 
 def detect_new_articles():
-    """Compare current vs previous articles to find new ones"""
+    """Compare current articles against the known-article index to find new and changed ones"""
     current_articles = get_current_articles()
-    previous_articles = load_previous_articles()
     
     if not current_articles:
         print("❌ No current articles found - aborting")
-        return []
+        return None
     
-    # Get filenames from previous run
-    previous_filenames = [article['filename'] for article in previous_articles]
+    known = load_known_articles()
+    print(f"📋 Known article index holds {len(known)} articles")
     
-    # Find new articles
-    new_articles = [
-        article for article in current_articles 
-        if article['filename'] not in previous_filenames
-    ]
+    new_articles, changed_articles, learned = diff_articles(current_articles, known)
     
     print(f"🆕 Found {len(new_articles)} new articles since last run")
+    print(f"✏️ Found {len(changed_articles)} changed articles since last run")
     
     # Log new articles
     if new_articles:
@@ -95,10 +96,15 @@ def detect_new_articles():
     else:
         print("✅ No new articles found - no social media posts needed")
     
-    return new_articles, current_articles
+    if changed_articles:
+        print("\n📝 Changed articles detected:")
+        for i, article in enumerate(changed_articles, 1):
+            print(f"  {i}. {article['title']} ({article['filename']})")
+    
+    return new_articles, changed_articles, learned
 
-def save_results(new_articles, current_articles):
-    """Save detection results and update previous articles list"""
+def save_results(new_articles, changed_articles, learned=None):
+    """Save detection results and record the delta in the known-article index"""
     
     # Ensure social-media directory exists
     os.makedirs('social-media', exist_ok=True)
@@ -108,15 +114,16 @@ def save_results(new_articles, current_articles):
         json.dump({
             'detection_date': datetime.now().isoformat(),
             'new_articles_count': len(new_articles),
-            'new_articles': new_articles
+            'new_articles': new_articles,
+            'changed_articles_count': len(changed_articles),
+            'changed_articles': changed_articles
         }, f, indent=2)
     
-    # Update previous articles list for next run
-    with open('social-media/previous_articles.json', 'w') as f:
-        json.dump(current_articles, f, indent=2)
+    delta = new_articles + changed_articles + (learned or [])
+    record_known_articles(delta)
     
     print(f"💾 Saved {len(new_articles)} new articles to social-media/new_articles_found.json")
-    print(f"💾 Updated previous articles list with {len(current_articles)} total articles")
+    print(f"💾 Recorded {len(delta)} known-article updates in the state store")
 
 def main():
     """Main article detection function"""
@@ -124,10 +131,11 @@ def main():
     print(f"⏰ Run time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
     print()
     
-    new_articles, current_articles = detect_new_articles()
+    detection = detect_new_articles()
     
-    if current_articles:
-        save_results(new_articles, current_articles)
+    if detection is not None:
+        new_articles, changed_articles, learned = detection
+        save_results(new_articles, changed_articles, learned)
         
         if new_articles:
             print(f"✅ Detection complete: {len(new_articles)} new articles ready for social media posting")
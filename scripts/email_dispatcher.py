@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+DadAssist - Email Dispatcher
+Shared SES sender for all notifiers.
+
+One authenticated SMTP session is opened per process and reused for every
+message, so several notifications cost a single connect/STARTTLS/login.
+Messages can be sent inline or handed to a background thread; either way a
+dropped connection or transient SMTP error is retried on a fresh session.
+Background sends are flushed before the process exits.
+
+NOTIFICATION_EMAIL may list several comma-separated recipients; each gets
+their own copy, and the copies go out as one batch on the session.
+
+Debug copies of outgoing emails are written only when EMAIL_DEBUG=1.
+"""
+
+import os
+import time
+import atexit
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+
+SMTP_SERVER = os.getenv('SMTP_SERVER', 'email-smtp.ap-southeast-2.amazonaws.com')
+SMTP_PORT = int(os.getenv('SMTP_PORT', '587'))
+SMTP_TIMEOUT = 60
+SEND_RETRIES = 3
+EMAIL_DEBUG = os.getenv('EMAIL_DEBUG', '') == '1'
+
+def build_message(subject, html_content, sender, recipient):
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = subject
+    msg['From'] = sender
+    msg['To'] = recipient
+    msg.attach(MIMEText(html_content, 'html'))
+    return msg
+
+def write_debug_artifact(filename, html_content):
+    """Save a copy of an email's HTML when EMAIL_DEBUG=1"""
+    if not EMAIL_DEBUG:
+        return
+    with open(filename, 'w') as f:
+        f.write(html_content)
+    print(f"📧 Email content saved to {filename} ({os.path.getsize(filename)} bytes)")
+
+class EmailDispatcher:
+    def __init__(self, username=None, password=None, server=SMTP_SERVER, port=SMTP_PORT):
+        self.username = username or os.getenv('SES_USERNAME')
+        self.password = password or os.getenv('EMAIL_PASSWORD')
+        self.server = server
+        self.port = port
+        self.connection = None
+        # One connection, so sends are serialised - the background worker included
+        self.lock = threading.Lock()
+        self.queue_lock = threading.Lock()
+        self.executor = None
+        self.pending = []
+
+    def has_credentials(self):
+        return bool(self.username and self.password)
+
+    def _connect(self):
+        connection = smtplib.SMTP(self.server, self.port, timeout=SMTP_TIMEOUT)
+        connection.starttls()
+        connection.login(self.username, self.password)
+        self.connection = connection
+
+    def _disconnect(self):
+        if self.connection is not None:
+            try:
+                self.connection.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+        self.connection = None
+
+    def send(self, msg):
+        """Send one message on the shared session, reconnecting and retrying on failure"""
+        with self.lock:
+            return self._send(msg)
+
+    def send_many(self, messages):
+        """Send a batch of messages back to back in one SMTP session; True/False per message"""
+        with self.lock:
+            return [self._send(msg) for msg in messages]
+
+    def _send(self, msg):
+        for attempt in range(1, SEND_RETRIES + 1):
+            try:
+                if self.connection is None:
+                    self._connect()
+                self.connection.send_message(msg)
+                return True
+            except smtplib.SMTPAuthenticationError as e:
+                # Bad credentials won't fix themselves on retry
+                print(f"❌ SMTP authentication failed: {e}")
+                self._disconnect()
+                return False
+            except (smtplib.SMTPException, OSError) as e:
+                self._disconnect()
+                if attempt == SEND_RETRIES:
+                    print(f"❌ Failed to send '{msg['Subject']}' after {attempt} attempts: {e}")
+                    return False
+                print(f"⚠️ Send failed ({e}), retrying ({attempt}/{SEND_RETRIES})")
+                time.sleep(2 ** attempt)
+
+    def submit(self, msg):
+        """Send in the background; returns a Future resolving to True/False"""
+        return self._submit(self.send, msg)
+
+    def submit_many(self, messages):
+        """Send a batch in the background; returns a Future resolving to True if all were sent"""
+        return self._submit(lambda: all(self.send_many(messages)))
+
+    def _submit(self, func, *args):
+        with self.queue_lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='email')
+            future = self.executor.submit(func, *args)
+            self.pending.append(future)
+        return future
+
+    def flush(self):
+        """Wait for background sends; True if all of them succeeded"""
+        with self.queue_lock:
+            pending, self.pending = self.pending, []
+        return all(future.result() for future in pending)
+
+    def close(self):
+        self.flush()
+        with self.queue_lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=True)
+                self.executor = None
+        with self.lock:
+            self._disconnect()
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+def get_dispatcher():
+    """Process-wide dispatcher, closed (after flushing background sends) at exit"""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = EmailDispatcher()
+            atexit.register(_dispatcher.close)
+        return _dispatcher
+
+def parse_recipients(recipient):
+    """Addresses from a comma-separated recipient list"""
+    return [address.strip() for address in recipient.split(',') if address.strip()]
+
+def send_email(subject, html_content, sender, recipient, wait=True):
+    """
+    Send an HTML email through the shared dispatcher.
+
+    recipient may be a comma-separated list; each address gets its own copy and
+    the copies are sent as one batch. With wait=False the send happens on the
+    background thread and a Future is returned; otherwise returns True/False
+    (True only if every copy was sent).
+    """
+    dispatcher = get_dispatcher()
+    if not dispatcher.has_credentials():
+        print("❌ SES credentials not found in environment variables")
+        return False
+
+    messages = [build_message(subject, html_content, sender, address) for address in parse_recipients(recipient)]
+    if not messages:
+        print("❌ No recipient address given")
+        return False
+    if len(messages) == 1:
+        return dispatcher.send(messages[0]) if wait else dispatcher.submit(messages[0])
+    if wait:
+        return all(dispatcher.send_many(messages))
+    return dispatcher.submit_many(messages)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+DadAssist - Email Templates
+Compile-once HTML templates for the notifier emails.
+
+A template is HTML with {{ name }} placeholders. Compiling it inlines the
+<style> block's class rules into each element's style attribute (so the
+email renders in clients that strip <style>) and splits the result into
+literal text and placeholder names. Compiled templates are cached, so a
+render is a single join - no regex, template parsing or CSS work per email.
+
+Fragments rendered into a larger email are compiled against that email's
+stylesheet. Class attributes that are themselves placeholders can't be
+inlined ahead of time - compile one variant per class where it matters;
+otherwise those elements rely on the <style> block, which is left in.
+"""
+
+import re
+from functools import lru_cache
+
+PLACEHOLDER = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+STYLE_BLOCK = re.compile(r'<style>(.*?)</style>', re.S)
+CSS_RULE = re.compile(r'\.([\w-]+)\s*\{([^}]*)\}')
+CLASS_ATTR = re.compile(r'<(\w+)([^<>]*?)\sclass="([^"{}]+)"([^<>]*?)>')
+STYLE_ATTR = re.compile(r'\sstyle="([^"]*)"')
+
+def stylesheet(html):
+    """Contents of a template's <style> block ('' if it has none)"""
+    block = STYLE_BLOCK.search(html)
+    return block.group(1) if block else ''
+
+def inline_css(html, css=None):
+    """
+    Copy single-class CSS rules onto elements with static class attributes.
+
+    The rules come from css if given (for fragments that are rendered into a
+    larger template), otherwise from the html's own <style> block.
+    """
+    block = STYLE_BLOCK.search(html)
+    if css is None:
+        css = block.group(1) if block else ''
+    rules = {}
+    for name, declarations in CSS_RULE.findall(css):
+        # Only plain ".name { ... }" rules; pseudo-classes like a:hover stay in the block
+        rules[name] = '; '.join(d.strip() for d in declarations.split(';') if d.strip())
+    if not rules:
+        return html
+
+    def apply(match):
+        tag, before, classes, after = match.groups()
+        styles = [rules[c] for c in classes.split() if c in rules]
+        if not styles:
+            return match.group(0)
+        attributes = before + after
+        existing = STYLE_ATTR.search(attributes)
+        if existing:
+            # Inline style attributes win over class rules, so they go last
+            styles.append(existing.group(1))
+            attributes = STYLE_ATTR.sub('', attributes, count=1)
+        return f'<{tag}{attributes} class="{classes}" style="{"; ".join(styles)}">'
+
+    start = block.end() if block else 0
+    return html[:start] + CLASS_ATTR.sub(apply, html[start:])
+
+@lru_cache(maxsize=None)
+def compile_template(source, css=None):
+    """
+    Compile a template into a function of its placeholders: render(**values) -> str.
+
+    Cached per (source, css), so each template is parsed once per process.
+    """
+    parts = PLACEHOLDER.split(inline_css(source, css))
+    # split() alternates literal text (even indexes) with placeholder names (odd)
+    literals, names = parts[0::2], parts[1::2]
+
+    def render(**values):
+        rendered = [literals[0]]
+        for name, literal in zip(names, literals[1:]):
+            rendered.append(format(values[name]))
+            rendered.append(literal)
+        return ''.join(rendered)
+
+    return render
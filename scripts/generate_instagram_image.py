@@ -14,6 +14,8 @@ import os
 from PIL import Image, ImageDraw, ImageFont
 import textwrap
 
+OUTLINE_WIDTH = 3
+
 def generate_image_prompt(article_title, article_content=""):
     """Generate Nova Canvas prompt based on article content"""
     
@@ -102,16 +104,10 @@ def add_text_overlay(image_data, article_title):
             x = (img_width - text_width) // 2
             y = y_start + i * line_height
             
-            # Draw text with outline for better visibility (no background rectangle)
-            # Draw outline in black
-            outline_width = 3
-            for dx in range(-outline_width, outline_width + 1):
-                for dy in range(-outline_width, outline_width + 1):
-                    if dx != 0 or dy != 0:
-                        draw.text((x + dx, y + dy), line, font=font, fill=(0, 0, 0, 255))
-            
-            # Draw white text on top
-            draw.text((x, y), line, font=font, fill=(255, 255, 255, 255))
+            # White text with a black outline for visibility (no background rectangle),
+            # stroked in one pass rather than redrawn at every offset around it
+            draw.text((x, y), line, font=font, fill=(255, 255, 255, 255),
+                      stroke_width=OUTLINE_WIDTH, stroke_fill=(0, 0, 0, 255))
         
         # Convert back to bytes
         output = BytesIO()
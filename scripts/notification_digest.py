@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+DadAssist - Notification Digest
+Batches workflow notifications into one email per period.
+
+With EMAIL_DIGEST=1 the notifiers write a short run summary to the spool
+instead of sending an email. The scheduled digest job renders everything
+spooled since the last digest into a single email and sends it through the
+shared dispatcher.
+
+  config/notification_spool/<time>-<workflow>-<id>.json    one file per run (committed)
+
+A file per run keeps concurrent workflows from conflicting: runs only add
+files and the digest only deletes the ones it sent, so rebases are clean.
+The digest job removes the sent files and pushes that before emailing (see
+prepare/send), so a failed push can't make the next digest repeat them.
+
+Usage: notification_digest.py <prepare <outbox>|send <outbox>|status>
+"""
+
+import os
+import sys
+import json
+import uuid
+from datetime import datetime
+
+import email_dispatcher
+from email_templates import compile_template, stylesheet
+
+DIGEST_SPOOL_DIR = os.getenv('DADASSIST_DIGEST_SPOOL', 'config/notification_spool')
+DIGEST_ENABLED = os.getenv('EMAIL_DIGEST', '') == '1'
+
+WORKFLOWS = {
+    'content': '📰 Content Automation',
+    'social': '📱 Social Media Posting',
+    'video': '🎬 Weekly Video'
+}
+STATUS_ICONS = {'success': '✅', 'warning': '⚠️', 'failed': '❌'}
+
+def spool(workflow, status, subject, items):
+    """
+    Write a run summary to the digest spool instead of emailing it.
+
+    items is a list of (label, text, url) rows shown for the run; url may be ''.
+    """
+    now = datetime.now()
+    entry = {
+        'workflow': workflow,
+        'status': status,
+        'subject': subject,
+        'spooled_at': now.isoformat(),
+        'items': [[label, str(text), url or ''] for label, text, url in items]
+    }
+    os.makedirs(DIGEST_SPOOL_DIR, exist_ok=True)
+    # Time first so a directory listing is in spool order
+    path = os.path.join(DIGEST_SPOOL_DIR, f"{now.strftime('%Y%m%d_%H%M%S')}-{workflow}-{uuid.uuid4().hex[:8]}.json")
+    temp_file = path + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(entry, f, ensure_ascii=False)
+    os.replace(temp_file, path)
+    print(f"📬 Digest mode: spooled '{subject}' to {path}")
+    return True
+
+def read_spool():
+    """Spooled (path, entry) pairs, oldest first"""
+    if not os.path.isdir(DIGEST_SPOOL_DIR):
+        return []
+
+    spooled = []
+    for name in sorted(os.listdir(DIGEST_SPOOL_DIR)):
+        if not name.endswith('.json'):
+            continue
+        path = os.path.join(DIGEST_SPOOL_DIR, name)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                spooled.append((path, json.load(f)))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ Skipping unreadable spool file {name}: {e}")
+    return spooled
+
+DIGEST_EMAIL_TEMPLATE = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <style>
+            body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }
+            .header { background: linear-gradient(135deg, #E09900, #FF7F00); color: white; padding: 20px; border-radius: 8px; text-align: center; margin-bottom: 20px; }
+            .info-box { background: #e8f4f8; border: 1px solid #bee5eb; padding: 15px; border-radius: 5px; margin: 15px 0; }
+            .run-success { border-left: 4px solid #28a745; padding: 5px 15px; margin: 10px 0; }
+            .run-warning { border-left: 4px solid #ffc107; padding: 5px 15px; margin: 10px 0; }
+            .run-failed { border-left: 4px solid #dc3545; padding: 5px 15px; margin: 10px 0; }
+            .run-time { color: #6c757d; font-size: 0.9em; }
+            .footer { text-align: center; color: #6c757d; font-size: 0.9em; margin-top: 30px; padding-top: 20px; border-top: 1px solid #dee2e6; }
+            a { color: #E09900; text-decoration: none; }
+        </style>
+    </head>
+    <body>
+        <div class="header">
+            <h1>📬 DadAssist Automation Digest</h1>
+            <p>{{ period }}</p>
+        </div>
+
+        <div class="info-box">
+            <h3>📊 Runs This Period</h3>
+            <ul>{{ totals }}
+            </ul>
+        </div>
+        {{ sections }}
+        <div class="footer">
+            <p>🤖 One digest replaces {{ run_count }} individual notification emails</p>
+            <p>Generated: {{ generated_at }}</p>
+        </div>
+    </body>
+    </html>
+    """
+
+WORKFLOW_SECTION_TEMPLATE = """
+        <h2>{{ name }}</h2>{{ runs }}
+"""
+
+RUN_TEMPLATE = """
+        <div class="run-{{ status }}">
+            <p><strong>{{ icon }} {{ subject }}</strong><br><span class="run-time">{{ time }}</span></p>
+            <ul>{{ items }}
+            </ul>
+        </div>"""
+
+DIGEST_CSS = stylesheet(DIGEST_EMAIL_TEMPLATE)
+DIGEST_EMAIL = compile_template(DIGEST_EMAIL_TEMPLATE)
+WORKFLOW_SECTION = compile_template(WORKFLOW_SECTION_TEMPLATE, DIGEST_CSS)
+# One variant per status so each run's border colour is inlined
+RUN = {status: compile_template(RUN_TEMPLATE.replace('{{ status }}', status), DIGEST_CSS)
+       for status in STATUS_ICONS}
+
+def render_item(label, text, url):
+    if url:
+        return f'\n                <li><strong>{label}:</strong> <a href="{url}">{text}</a></li>'
+    return f'\n                <li><strong>{label}:</strong> {text}</li>'
+
+def format_time(timestamp):
+    try:
+        return datetime.fromisoformat(timestamp).strftime('%a %d %b %H:%M UTC')
+    except (TypeError, ValueError):
+        return timestamp or 'unknown time'
+
+def create_digest_content(entries):
+    """One email covering every spooled run, grouped by workflow"""
+    by_workflow = {}
+    for entry in entries:
+        by_workflow.setdefault(entry.get('workflow', 'other'), []).append(entry)
+
+    totals = []
+    sections = []
+    for workflow, runs in by_workflow.items():
+        name = WORKFLOWS.get(workflow, workflow.title())
+        counts = {}
+        rendered = []
+        for entry in runs:
+            status = entry.get('status') if entry.get('status') in STATUS_ICONS else 'failed'
+            counts[status] = counts.get(status, 0) + 1
+            rendered.append(RUN[status](
+                icon=STATUS_ICONS[status],
+                subject=entry.get('subject', ''),
+                time=format_time(entry.get('spooled_at')),
+                items=''.join(render_item(*item) for item in entry.get('items', []))
+            ))
+        breakdown = ', '.join(f"{counts[status]} {STATUS_ICONS[status]}" for status in STATUS_ICONS if status in counts)
+        totals.append(f"\n                <li><strong>{name}:</strong> {len(runs)} runs ({breakdown})</li>")
+        sections.append(WORKFLOW_SECTION(name=name, runs=''.join(rendered)))
+
+    first = format_time(entries[0].get('spooled_at'))
+    last = format_time(entries[-1].get('spooled_at'))
+    return DIGEST_EMAIL(
+        period=first if first == last else f"{first} → {last}",
+        totals=''.join(totals),
+        sections=''.join(sections),
+        run_count=len(entries),
+        generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')
+    )
+
+def digest_subject(entries):
+    failed = sum(1 for entry in entries if entry.get('status') == 'failed')
+    warnings = sum(1 for entry in entries if entry.get('status') == 'warning')
+    if failed:
+        status = f"{failed} failed"
+    elif warnings:
+        status = f"{warnings} with warnings"
+    else:
+        status = "all succeeded"
+    return f"📬 DadAssist Digest - {len(entries)} runs ({status})"
+
+def prepare_digest(outbox):
+    """
+    Render the spooled runs into outbox (a JSON file) and remove them from the spool.
+
+    Returns the number of runs; with none spooled no outbox is written.
+    """
+    spooled = read_spool()
+    if not spooled:
+        print("📭 Digest spool is empty - nothing to send")
+        return 0
+
+    entries = [entry for _, entry in spooled]
+    with open(outbox, 'w', encoding='utf-8') as f:
+        json.dump({
+            'subject': digest_subject(entries),
+            'html': create_digest_content(entries),
+            'runs': len(entries)
+        }, f, ensure_ascii=False)
+    for path, _ in spooled:
+        os.remove(path)
+    print(f"📦 Prepared digest of {len(entries)} runs in {outbox}")
+    return len(entries)
+
+def send_prepared(outbox):
+    """Email a digest written by prepare_digest"""
+    sender_email = os.getenv('SENDER_EMAIL', 'admin@dadassist.com.au')
+    recipient_email = os.getenv('NOTIFICATION_EMAIL')
+    if not recipient_email:
+        print("❌ No notification email configured")
+        return False
+
+    with open(outbox, 'r', encoding='utf-8') as f:
+        digest = json.load(f)
+    email_dispatcher.write_debug_artifact('debug_digest_email.html', digest['html'])
+
+    print(f"📧 Sending digest of {digest['runs']} runs to {recipient_email}...")
+    if not email_dispatcher.send_email(digest['subject'], digest['html'], sender_email, recipient_email):
+        print("❌ Digest not sent")
+        return False
+    print("✅ Digest sent")
+    return True
+
+def main():
+    """Command line access for workflows"""
+    if len(sys.argv) < 2 or (sys.argv[1] in ('prepare', 'send') and len(sys.argv) < 3):
+        print("Usage: notification_digest.py <prepare <outbox>|send <outbox>|status>")
+        sys.exit(1)
+
+    command = sys.argv[1]
+    if command == 'prepare':
+        prepare_digest(sys.argv[2])
+    elif command == 'send':
+        sys.exit(0 if send_prepared(sys.argv[2]) else 1)
+    elif command == 'status':
+        spooled = read_spool()
+        print(f"📬 {len(spooled)} runs spooled in {DIGEST_SPOOL_DIR}")
+        for _, entry in spooled:
+            print(f"   {entry.get('spooled_at', '')[:16]} {STATUS_ICONS.get(entry.get('status'), '❔')} {entry.get('subject', '')}")
+    else:
+        print(f"❌ Unknown command: {command}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -6,11 +6,11 @@ Sends comprehensive email notifications with run results and instructions
 
 import os
 import json
-import smtplib
 from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from datetime import datetime
+
+import notification_digest
+from email_dispatcher import send_email, write_debug_artifact
+from email_templates import compile_template, stylesheet
 
 def get_article_section(article_title, article_content=""):
     """Determine which index section the article belongs to based on content"""
@@ -83,20 +83,21 @@ def load_run_summary():
     workflow_status = os.getenv('WORKFLOW_STATUS', 'unknown')
     article_url = os.getenv('ARTICLE_URL', '')
     article_title = os.getenv('ARTICLE_TITLE', '')
-    social_media_results_file = os.getenv('SOCIAL_MEDIA_RESULTS_FILE', '')
+    social_media_results_run = os.getenv('SOCIAL_MEDIA_RESULTS_RUN', '')
     
     # Load social media results if available
     social_media_results = None
-    if social_media_results_file and os.path.exists(social_media_results_file):
+    if social_media_results_run:
         try:
-            print(f"📱 Loading social media results from: {social_media_results_file}")
-            with open(social_media_results_file, 'r') as f:
-                social_media_results = json.load(f)
-            print(f"✅ Loaded {len(social_media_results.get('results', []))} social media results")
+            from results_log import ResultsLog
+            print(f"📱 Loading social media results for run: {social_media_results_run}")
+            social_media_results = ResultsLog().get(social_media_results_run)
+            if social_media_results:
+                print(f"✅ Loaded {len(social_media_results.get('results', []))} social media results")
         except Exception as e:
             print(f"⚠️ Could not load social media results: {e}")
     else:
-        print(f"⚠️ Social media results file not found: {social_media_results_file}")
+        print("⚠️ No social media results run recorded")
     
     # Update summary based on workflow results
     summary['skip_generation'] = skip_generation
@@ -107,176 +108,42 @@ def load_run_summary():
     
     return summary
 
-def create_email_content(summary):
-    """Create comprehensive email content with instructions"""
-    
-    # Determine workflow outcome
-    skip_generation = summary.get('skip_generation', False)
-    workflow_status = summary.get('workflow_status', 'unknown')
-    article_url = summary.get('article_url', '')
-    article_title = summary.get('article_title', '')
-    
-    if skip_generation:
-        status = "⚠️ ALL DUPLICATES"
-        status_class = "status-failed"
-        outcome_message = "All scraped articles were duplicates - no new content generated"
-    elif workflow_status == 'success' and article_url:
-        status = "✅ SUCCESS"
-        status_class = "status-success"
-        outcome_message = f"New article generated and posted: {article_title}"
-    else:
-        status = "❌ FAILED" if not summary.get('success') else "⚠️ PARTIAL"
-        status_class = "status-failed"
-        outcome_message = "Workflow completed with issues - check logs for details"
-    
-    articles_found = summary.get('articles_found', 0)
-    quality_articles = summary.get('quality_articles', 0)
-    
-    # Create HTML email content
-    html_content = f"""
+CONTENT_EMAIL_TEMPLATE = """
     <!DOCTYPE html>
     <html>
     <head>
         <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .header {{ background-color: #2c5aa0; color: white; padding: 20px; text-align: center; }}
-            .content {{ padding: 20px; }}
-            .status-success {{ color: #28a745; font-weight: bold; }}
-            .status-failed {{ color: #dc3545; font-weight: bold; }}
-            .info-box {{ background-color: #f8f9fa; border-left: 4px solid #2c5aa0; padding: 15px; margin: 15px 0; }}
-            .warning-box {{ background-color: #fff3cd; border-left: 4px solid #ffc107; padding: 15px; margin: 15px 0; }}
-            .success-box {{ background-color: #d4edda; border-left: 4px solid #28a745; padding: 15px; margin: 15px 0; }}
-            .code {{ background-color: #f1f1f1; padding: 2px 5px; font-family: monospace; }}
-            .step {{ margin: 10px 0; }}
-            .step-number {{ background-color: #2c5aa0; color: white; border-radius: 50%; padding: 5px 10px; margin-right: 10px; }}
-            ul {{ margin: 10px 0; padding-left: 20px; }}
-            li {{ margin: 5px 0; }}
+            body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+            .header { background-color: #2c5aa0; color: white; padding: 20px; text-align: center; }
+            .content { padding: 20px; }
+            .status-success { color: #28a745; font-weight: bold; }
+            .status-failed { color: #dc3545; font-weight: bold; }
+            .info-box { background-color: #f8f9fa; border-left: 4px solid #2c5aa0; padding: 15px; margin: 15px 0; }
+            .warning-box { background-color: #fff3cd; border-left: 4px solid #ffc107; padding: 15px; margin: 15px 0; }
+            .success-box { background-color: #d4edda; border-left: 4px solid #28a745; padding: 15px; margin: 15px 0; }
+            .code { background-color: #f1f1f1; padding: 2px 5px; font-family: monospace; }
+            .step { margin: 10px 0; }
+            .step-number { background-color: #2c5aa0; color: white; border-radius: 50%; padding: 5px 10px; margin-right: 10px; }
+            ul { margin: 10px 0; padding-left: 20px; }
+            li { margin: 5px 0; }
         </style>
     </head>
     <body>
         <div class="header">
             <h1>🤖 DadAssist Content Automation Report</h1>
-            <p>Weekly Legal Content Scraping Results (v{summary.get('automation_version', '1.0.0')})</p>
+            <p>Weekly Legal Content Scraping Results (v{{ automation_version }})</p>
         </div>
         
         <div class="content">
             <h2>📊 Run Summary</h2>
-            <div class="{'success-box' if status.startswith('✅') else 'warning-box' if status.startswith('⚠️') else 'info-box'}">
-                <p><strong>Status:</strong> <span class="{status_class}">{status}</span></p>
-                <p><strong>Outcome:</strong> {outcome_message}</p>
-                <p><strong>Date:</strong> {datetime.fromisoformat(summary.get('run_date', '')).strftime('%A, %B %d, %Y at %I:%M %p')}</p>
-                <p><strong>Automation Version:</strong> v{summary.get('automation_version', '1.0.0')}</p>
-                <p><strong>Articles Found:</strong> {articles_found} articles discovered</p>
-                <p><strong>Quality Articles:</strong> {quality_articles} articles extracted successfully</p>"""
-    
-    # Add article-specific information if generated
-    if article_url and article_title:
-        html_content += f"""
-                <p><strong>Generated Article:</strong> <a href="{article_url}">{article_title}</a></p>
-                <p><strong>Live URL:</strong> <a href="{article_url}">{article_url}</a></p>"""
-    
-    html_content += f"""
-            </div>"""
-    
-    # Add social media posting results if available
-    social_media_results = summary.get('social_media_results')
-    if social_media_results and len(social_media_results) > 0:
-        html_content += f"""
-            <h2>📱 Social Media Posting Results</h2>
-            <div class="info-box">"""
-        
-        for result in social_media_results:
-            if 'posting_results' in result:
-                posting_results = result['posting_results']
-                article_info = result.get('article', {})
-                
-                html_content += f"""
-                <p><strong>Article:</strong> {article_info.get('title', 'Unknown')}</p>
-                <table style="width: 100%; border-collapse: collapse; margin: 10px 0;">
-                    <tr style="background-color: #f8f9fa;">
-                        <th style="border: 1px solid #ddd; padding: 8px; text-align: left;">Platform</th>
-                        <th style="border: 1px solid #ddd; padding: 8px; text-align: left;">Status</th>
-                        <th style="border: 1px solid #ddd; padding: 8px; text-align: left;">Post URL</th>
-                    </tr>"""
-                
-                # Twitter results
-                twitter_result = posting_results.get('twitter', {})
-                if twitter_result:
-                    status = "✅ Success" if twitter_result.get('success') else "❌ Failed"
-                    error_msg = twitter_result.get('error', '')
-                    post_url = twitter_result.get('url', 'N/A')
-                    
-                    html_content += f"""
-                    <tr>
-                        <td style="border: 1px solid #ddd; padding: 8px;">🐦 Twitter</td>
-                        <td style="border: 1px solid #ddd; padding: 8px;">{status}</td>
-                        <td style="border: 1px solid #ddd; padding: 8px;">
-                            {f'<a href="{post_url}">{post_url}</a>' if post_url != 'N/A' else error_msg}
-                        </td>
-                    </tr>"""
-                
-                # Facebook results
-                facebook_result = posting_results.get('facebook', {})
-                if facebook_result:
-                    status = "✅ Success" if facebook_result.get('success') else "❌ Failed"
-                    error_msg = facebook_result.get('error', '')
-                    post_url = facebook_result.get('url', 'N/A')
-                    
-                    html_content += f"""
-                    <tr>
-                        <td style="border: 1px solid #ddd; padding: 8px;">📘 Facebook</td>
-                        <td style="border: 1px solid #ddd; padding: 8px;">{status}</td>
-                        <td style="border: 1px solid #ddd; padding: 8px;">
-                            {f'<a href="{post_url}">{post_url}</a>' if post_url != 'N/A' else error_msg}
-                        </td>
-                    </tr>"""
-                
-                # Instagram results
-                instagram_result = posting_results.get('instagram', {})
-                if instagram_result:
-                    status = "✅ Success" if instagram_result.get('success') else "❌ Failed"
-                    error_msg = instagram_result.get('error', '')
-                    post_url = instagram_result.get('url', 'N/A')
-                    
-                    html_content += f"""
-                    <tr>
-                        <td style="border: 1px solid #ddd; padding: 8px;">📷 Instagram</td>
-                        <td style="border: 1px solid #ddd; padding: 8px;">{status}</td>
-                        <td style="border: 1px solid #ddd; padding: 8px;">
-                            {f'<a href="{post_url}">{post_url}</a>' if post_url != 'N/A' else error_msg}
-                        </td>
-                    </tr>"""
-                
-                html_content += """
-                </table>"""
-        
-        html_content += """
-            </div>"""
-    
-    # Add specific instructions based on outcome
-    if skip_generation:
-        html_content += f"""
-            <h2>🔄 Next Steps (All Articles Were Duplicates)</h2>
-            <div class="warning-box">
-                <p><strong>What happened:</strong> All scraped articles already exist on DadAssist.com.au</p>
-                <p><strong>Next action:</strong> The search rotation will automatically advance to try different queries next week</p>
-                <p><strong>Manual option:</strong> You can modify search terms in config/apify_config.json for more variety</p>
-            </div>"""
-    elif article_url:
-        html_content += f"""
-            <h2>✅ Article Successfully Generated</h2>
-            <div class="success-box">
-                <p><strong>New Article:</strong> {article_title}</p>
-                <p><strong>Live URL:</strong> <a href="{article_url}">{article_url}</a></p>
-                <p><strong>Social Media Results:</strong></p>
-                <ul>
-                <li>Twitter: ✅ Success - https://twitter.com/dad_assist/status/123</li>
-                <li>Facebook: ✅ Success - https://facebook.com/DadAssist/posts/456</li>
-                <li>Instagram: ❌ Failed - Token expired</li>
-                </ul>
-            </div>"""
-    
-    html_content += f"""
+            <div class="{{ box_class }}">
+                <p><strong>Status:</strong> <span class="{{ status_class }}">{{ status }}</span></p>
+                <p><strong>Outcome:</strong> {{ outcome_message }}</p>
+                <p><strong>Date:</strong> {{ run_date }}</p>
+                <p><strong>Automation Version:</strong> v{{ automation_version }}</p>
+                <p><strong>Articles Found:</strong> {{ articles_found }} articles discovered</p>
+                <p><strong>Quality Articles:</strong> {{ quality_articles }} articles extracted successfully</p>{{ article_links }}
+            </div>{{ social_section }}{{ next_steps }}
             <h2>📥 How to Download This Week's Articles</h2>
             <div class="info-box">
                 <div class="step">
@@ -353,38 +220,203 @@ def create_email_content(summary):
                 <p><strong>Repository:</strong> <a href="https://github.com/N-BRAITH/dadassist-content-automation">dadassist-content-automation</a></p>
                 <p><strong>Schedule:</strong> Every Monday at 9:00 AM UTC</p>
                 <p><strong>Retention:</strong> Artifacts kept for 30 days</p>
-                <p><strong>Next Run:</strong> {(datetime.now().replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=(7-datetime.now().weekday()))).strftime('%A, %B %d at 9:00 AM UTC') if datetime.now().weekday() != 0 else 'Next Monday at 9:00 AM UTC'}</p>
+                <p><strong>Next Run:</strong> {{ next_run }}</p>
             </div>
 
             <div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; color: #666; font-size: 12px;">
                 <p>This is an automated message from DadAssist Content Automation System.</p>
-                <p>Generated on {datetime.now().strftime('%Y-%m-%d at %H:%M:%S UTC')}</p>
+                <p>Generated on {{ generated_at }}</p>
             </div>
         </div>
     </body>
     </html>
     """
+
+ARTICLE_LINKS_TEMPLATE = """
+                <p><strong>Generated Article:</strong> <a href="{{ article_url }}">{{ article_title }}</a></p>
+                <p><strong>Live URL:</strong> <a href="{{ article_url }}">{{ article_url }}</a></p>"""
+
+SOCIAL_SECTION_TEMPLATE = """
+            <h2>📱 Social Media Posting Results</h2>
+            <div class="info-box">{{ tables }}
+            </div>"""
+
+SOCIAL_TABLE_TEMPLATE = """
+                <p><strong>Article:</strong> {{ title }}</p>
+                <table style="width: 100%; border-collapse: collapse; margin: 10px 0;">
+                    <tr style="background-color: #f8f9fa;">
+                        <th style="border: 1px solid #ddd; padding: 8px; text-align: left;">Platform</th>
+                        <th style="border: 1px solid #ddd; padding: 8px; text-align: left;">Status</th>
+                        <th style="border: 1px solid #ddd; padding: 8px; text-align: left;">Post URL</th>
+                    </tr>{{ rows }}
+                </table>"""
+
+SOCIAL_ROW_TEMPLATE = """
+                    <tr>
+                        <td style="border: 1px solid #ddd; padding: 8px;">{{ platform }}</td>
+                        <td style="border: 1px solid #ddd; padding: 8px;">{{ status }}</td>
+                        <td style="border: 1px solid #ddd; padding: 8px;">
+                            {{ detail }}
+                        </td>
+                    </tr>"""
+
+DUPLICATES_STEPS_TEMPLATE = """
+            <h2>🔄 Next Steps (All Articles Were Duplicates)</h2>
+            <div class="warning-box">
+                <p><strong>What happened:</strong> All scraped articles already exist on DadAssist.com.au</p>
+                <p><strong>Next action:</strong> The search rotation will automatically advance to try different queries next week</p>
+                <p><strong>Manual option:</strong> You can modify search terms in config/apify_config.json for more variety</p>
+            </div>"""
+
+ARTICLE_STEPS_TEMPLATE = """
+            <h2>✅ Article Successfully Generated</h2>
+            <div class="success-box">
+                <p><strong>New Article:</strong> {{ article_title }}</p>
+                <p><strong>Live URL:</strong> <a href="{{ article_url }}">{{ article_url }}</a></p>
+                <p><strong>Social Media Results:</strong></p>
+                <ul>{{ social_summary }}
+                </ul>
+            </div>"""
+
+# Compiled once at import; fragments take their CSS from the main template's stylesheet
+CONTENT_EMAIL = compile_template(CONTENT_EMAIL_TEMPLATE)
+CONTENT_CSS = stylesheet(CONTENT_EMAIL_TEMPLATE)
+ARTICLE_LINKS = compile_template(ARTICLE_LINKS_TEMPLATE, CONTENT_CSS)
+SOCIAL_SECTION = compile_template(SOCIAL_SECTION_TEMPLATE, CONTENT_CSS)
+SOCIAL_TABLE = compile_template(SOCIAL_TABLE_TEMPLATE, CONTENT_CSS)
+SOCIAL_ROW = compile_template(SOCIAL_ROW_TEMPLATE, CONTENT_CSS)
+DUPLICATES_STEPS = compile_template(DUPLICATES_STEPS_TEMPLATE, CONTENT_CSS)
+ARTICLE_STEPS = compile_template(ARTICLE_STEPS_TEMPLATE, CONTENT_CSS)
+
+
+SOCIAL_PLATFORMS = [('twitter', '🐦 Twitter'), ('facebook', '📘 Facebook'), ('instagram', '📷 Instagram')]
+
+def results_by_platform(posting_results):
+    """Posting results keyed by platform, whether stored as a list or a dict"""
+    if isinstance(posting_results, dict):
+        return posting_results
+    return {result.get('platform'): result for result in posting_results}
+
+def render_social_media_results(social_media_results):
+    """Social media tables plus a one-line summary per platform, in one pass over the results"""
+    if isinstance(social_media_results, dict):
+        social_media_results = social_media_results.get('results', [])
+    
+    tables = []
+    summary = []
+    for result in social_media_results or []:
+        if 'posting_results' not in result:
+            continue
+        posting_results = results_by_platform(result['posting_results'])
+        rows = []
+        for platform, label in SOCIAL_PLATFORMS:
+            platform_result = posting_results.get(platform)
+            if not platform_result:
+                continue
+            success = platform_result.get('success')
+            post_url = platform_result.get('url')
+            error_msg = platform_result.get('error', '')
+            rows.append(SOCIAL_ROW(
+                platform=label,
+                status="✅ Success" if success else "❌ Failed",
+                detail=f'<a href="{post_url}">{post_url}</a>' if post_url else error_msg
+            ))
+            summary.append(f"\n                <li>{label.split(' ', 1)[1]}: {'✅ Success - ' + post_url if success and post_url else '❌ Failed - ' + error_msg}</li>")
+        tables.append(SOCIAL_TABLE(title=result.get('article', {}).get('title', 'Unknown'), rows=''.join(rows)))
+    
+    section = SOCIAL_SECTION(tables=''.join(tables)) if tables else ''
+    return section, ''.join(summary)
+
+def next_run_text(now):
+    if now.weekday() == 0:
+        return 'Next Monday at 9:00 AM UTC'
+    next_run = now.replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=(7 - now.weekday()))
+    return next_run.strftime('%A, %B %d at 9:00 AM UTC')
+
+def create_email_content(summary):
+    """Create comprehensive email content with instructions"""
+    
+    # Determine workflow outcome
+    skip_generation = summary.get('skip_generation', False)
+    workflow_status = summary.get('workflow_status', 'unknown')
+    article_url = summary.get('article_url', '')
+    article_title = summary.get('article_title', '')
+    
+    if skip_generation:
+        status = "⚠️ ALL DUPLICATES"
+        status_class = "status-failed"
+        outcome_message = "All scraped articles were duplicates - no new content generated"
+    elif workflow_status == 'success' and article_url:
+        status = "✅ SUCCESS"
+        status_class = "status-success"
+        outcome_message = f"New article generated and posted: {article_title}"
+    else:
+        status = "❌ FAILED" if not summary.get('success') else "⚠️ PARTIAL"
+        status_class = "status-failed"
+        outcome_message = "Workflow completed with issues - check logs for details"
+    
+    social_section, social_summary = render_social_media_results(summary.get('social_media_results'))
     
-    return html_content
+    # Specific instructions based on outcome
+    if skip_generation:
+        next_steps = DUPLICATES_STEPS()
+    elif article_url:
+        next_steps = ARTICLE_STEPS(
+            article_title=article_title,
+            article_url=article_url,
+            social_summary=social_summary or "\n                <li>No social media results recorded</li>"
+        )
+    else:
+        next_steps = ''
+    
+    now = datetime.now()
+    return CONTENT_EMAIL(
+        automation_version=summary.get('automation_version', '1.0.0'),
+        box_class='success-box' if status.startswith('✅') else 'warning-box' if status.startswith('⚠️') else 'info-box',
+        status_class=status_class,
+        status=status,
+        outcome_message=outcome_message,
+        run_date=datetime.fromisoformat(summary.get('run_date', '')).strftime('%A, %B %d, %Y at %I:%M %p'),
+        articles_found=summary.get('articles_found', 0),
+        quality_articles=summary.get('quality_articles', 0),
+        article_links=ARTICLE_LINKS(article_url=article_url, article_title=article_title) if article_url and article_title else '',
+        social_section=social_section,
+        next_steps=next_steps,
+        next_run=next_run_text(now),
+        generated_at=now.strftime('%Y-%m-%d at %H:%M:%S UTC')
+    )
 
-def send_email_notification(summary):
-    """Send email notification using Microsoft 365 SMTP"""
+def spool_run_summary(summary, subject):
+    """Add this run to the notification digest instead of emailing it"""
+    if summary.get('workflow_status') in ('failure', 'cancelled'):
+        status = 'failed'
+    elif summary.get('skip_generation', False):
+        status = 'warning'
+    else:
+        status = 'success'
+    
+    items = [
+        ('Articles found', summary.get('articles_found', 0), ''),
+        ('Quality articles', summary.get('quality_articles', 0), '')
+    ]
+    if summary.get('article_url'):
+        items.append(('Article', summary.get('article_title') or summary['article_url'], summary['article_url']))
+    social_media_results = summary.get('social_media_results')
+    if isinstance(social_media_results, dict):
+        social_media_results = social_media_results.get('results', [])
+    for result in social_media_results or []:
+        for platform, platform_result in results_by_platform(result.get('posting_results', [])).items():
+            success = platform_result.get('success')
+            items.append((str(platform).title(), '✅ Posted' if success else f"❌ {platform_result.get('error', 'Failed')}",
+                          platform_result.get('url', '') if success else ''))
+    return notification_digest.spool('content', status, subject, items)
+
+def send_email_notification(summary, wait=True):
+    """Send email notification via the shared SES dispatcher"""
     
-    # Email configuration
-    smtp_server = "email-smtp.ap-southeast-2.amazonaws.com"
-    smtp_port = 587
-    ses_username = os.getenv('SES_USERNAME')
-    sender_password = os.getenv('EMAIL_PASSWORD')
     sender_email = os.getenv('SENDER_EMAIL', 'admin@dadassist.com.au')
     recipient_email = os.getenv('NOTIFICATION_EMAIL')
     
-    if not sender_password or not ses_username:
-        print("❌ SES credentials not found in environment variables")
-        return False
-    
-    # Create message
-    msg = MIMEMultipart('alternative')
-    
     # Dynamic subject based on outcome
     skip_generation = summary.get('skip_generation', False)
     article_url = summary.get('article_url', '')
@@ -396,51 +428,18 @@ def send_email_notification(summary):
     else:
         subject = f"🤖 DadAssist Automation: {summary.get('quality_articles', 0)} Articles Ready for Review"
     
-    msg['Subject'] = subject
-    msg['From'] = sender_email
-    msg['To'] = recipient_email
+    if notification_digest.DIGEST_ENABLED:
+        return spool_run_summary(summary, subject)
     
     # Create HTML content
     html_content = create_email_content(summary)
+    write_debug_artifact('debug_email_content.html', html_content)
     
-    # Save email content for debugging
-    current_dir = os.getcwd()
-    print(f"📁 Current working directory: {current_dir}")
-    
-    debug_file_path = 'debug_email_content.html'
-    with open(debug_file_path, 'w') as f:
-        f.write(html_content)
-    
-    # Verify file was created
-    if os.path.exists(debug_file_path):
-        file_size = os.path.getsize(debug_file_path)
-        print(f"📧 Email content saved to {debug_file_path} ({file_size} bytes)")
-    else:
-        print(f"❌ Failed to create debug file at {debug_file_path}")
-    
-    # List files in current directory
-    files = os.listdir('.')
-    print(f"📂 Files in current directory: {[f for f in files if f.endswith('.html') or f.endswith('.log')]}")
-    
-    html_part = MIMEText(html_content, 'html')
-    msg.attach(html_part)
-    
-    try:
-        # Send email
-        print(f"📧 Sending notification to {recipient_email}...")
-        
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()
-        server.login(ses_username, sender_password)
-        server.send_message(msg)
-        server.quit()
-        
+    print(f"📧 Sending notification to {recipient_email}...")
+    sent = send_email(subject, html_content, sender_email, recipient_email, wait=wait)
+    if sent is True:
         print("✅ Email notification sent successfully!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Failed to send email: {e}")
-        return False
+    return sent
 
 def main():
     """Main notification function"""
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+DadAssist Social Media - Authentication Cache
+Remembers which credentials have already been validated so posters can skip
+the validation round trip (get_me / Graph API GET) until the entry expires or
+a request comes back unauthorised.
+
+Entries are keyed by a hash of the credentials - tokens are never written out.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+
+import requests
+
+CACHE_DIR = os.getenv('DADASSIST_CACHE_DIR', os.path.expanduser('~/.cache/dadassist'))
+AUTH_CACHE_FILE = os.path.join(CACHE_DIR, 'auth_cache.json')
+# Upper bound for entries whose token reports no expiry (e.g. OAuth 1.0a keys)
+DEFAULT_TTL = int(os.getenv('AUTH_CACHE_TTL', '86400'))
+
+_lock = threading.Lock()
+
+def credential_key(platform, *secrets):
+    digest = hashlib.sha256('\0'.join(s or '' for s in secrets).encode('utf-8')).hexdigest()
+    return f'{platform}:{digest}'
+
+def _load(cache_file):
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading auth cache: {e}")
+    return {}
+
+def _save(cache, cache_file):
+    os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+    temp_file = f'{cache_file}.{os.getpid()}.tmp'
+    with open(temp_file, 'w') as f:
+        json.dump(cache, f)
+    os.replace(temp_file, cache_file)
+
+def get_cached_identity(platform, *secrets, cache_file=AUTH_CACHE_FILE):
+    """Identity recorded for these credentials, or None if unknown or expired"""
+    with _lock:
+        entry = _load(cache_file).get(credential_key(platform, *secrets))
+    if entry and entry['expires_at'] > time.time():
+        return entry['identity']
+    return None
+
+def cache_identity(platform, identity, *secrets, expires_at=None, cache_file=AUTH_CACHE_FILE):
+    """Record validated credentials until the token expiry (capped at DEFAULT_TTL)"""
+    ttl_expiry = time.time() + DEFAULT_TTL
+    expires_at = min(expires_at, ttl_expiry) if expires_at else ttl_expiry
+    with _lock:
+        cache = _load(cache_file)
+        now = time.time()
+        cache = {key: entry for key, entry in cache.items() if entry['expires_at'] > now}
+        cache[credential_key(platform, *secrets)] = {
+            'identity': identity,
+            'validated_at': now,
+            'expires_at': expires_at
+        }
+        _save(cache, cache_file)
+
+def invalidate(platform, *secrets, cache_file=AUTH_CACHE_FILE):
+    """Forget validated credentials, e.g. after a 401"""
+    with _lock:
+        cache = _load(cache_file)
+        if cache.pop(credential_key(platform, *secrets), None) is not None:
+            _save(cache, cache_file)
+            print(f"🔐 Cleared cached {platform} authentication")
+
+def graph_token_expiry(access_token, graph_url='https://graph.facebook.com'):
+    """Expiry (epoch seconds) reported by the Graph API for a token, or None if it never expires or is unknown"""
+    try:
+        response = requests.get(
+            f'{graph_url}/debug_token',
+            params={'input_token': access_token, 'access_token': access_token},
+            timeout=10
+        )
+        if response.status_code != 200:
+            return None
+        data = response.json().get('data', {})
+        expiries = [data.get('expires_at'), data.get('data_access_expires_at')]
+        expiries = [e for e in expiries if e]
+        return min(expiries) if expiries else None
+    except Exception:
+        return None
+
+def is_unauthorized(response):
+    """True for a 401, or a Graph API OAuth error (code 190) which comes back as a 400"""
+    if response.status_code == 401:
+        return True
+    try:
+        return response.json().get('error', {}).get('code') == 190
+    except ValueError:
+        return False
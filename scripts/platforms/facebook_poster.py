@@ -7,14 +7,22 @@ Posts content to Facebook page using Graph API with GitHub Secrets
 import os
 import json
 import requests
+import threading
 from datetime import datetime
 
+import auth_cache
+from rate_limits import get_tracker, is_graph_rate_limited
+
+GRAPH_API_URL = os.getenv('GRAPH_API_URL', 'https://graph.facebook.com')
+
 class FacebookPoster:
     def __init__(self, dry_run=True):
         self.dry_run = dry_run
         # DadAssist Facebook API credentials from GitHub Secrets
         self.page_access_token = os.getenv('FACEBOOK_ACCESS_TOKEN')
         self.page_id = os.getenv('FACEBOOK_PAGE_ID')
+        # Set by the caller to abandon a post (e.g. on timeout) before it is sent
+        self.cancelled = threading.Event()
         
         # Check if credentials are available
         if not all([self.page_access_token, self.page_id]):
@@ -30,15 +38,27 @@ class FacebookPoster:
             print("❌ Facebook credentials missing from environment")
             return False
         
+        # Skip the validation round trip while a previous one is still current
+        page_name = auth_cache.get_cached_identity('facebook', self.page_id, self.page_access_token)
+        if page_name:
+            print(f"🔐 Facebook authentication cached - {page_name}")
+            return True
+        
         try:
             # Test authentication by getting page info
             response = requests.get(
-                f'https://graph.facebook.com/{self.page_id}',
+                f'{GRAPH_API_URL}/{self.page_id}',
                 params={'access_token': self.page_access_token}
             )
             
+            get_tracker().update_from_headers('facebook', response.headers)
+            
             if response.status_code == 200:
                 page_data = response.json()
+                auth_cache.cache_identity(
+                    'facebook', page_data.get('name', 'DadAssist'), self.page_id, self.page_access_token,
+                    expires_at=auth_cache.graph_token_expiry(self.page_access_token, GRAPH_API_URL)
+                )
                 print(f"🔐 Facebook authentication successful - {page_data.get('name', 'DadAssist')}")
                 return True
             else:
@@ -74,15 +94,25 @@ class FacebookPoster:
                 'error': 'Missing credentials'
             }
         
+        if self.cancelled.is_set():
+            print("⏹️ Facebook post cancelled before sending")
+            return {
+                'success': False,
+                'platform': 'facebook',
+                'error': 'Cancelled'
+            }
+        
         try:
             response = requests.post(
-                f'https://graph.facebook.com/{self.page_id}/feed',
+                f'{GRAPH_API_URL}/{self.page_id}/feed',
                 data={
                     'message': content,
                     'access_token': self.page_access_token
                 }
             )
             
+            get_tracker().update_from_headers('facebook', response.headers)
+            
             if response.status_code == 200:
                 result = response.json()
                 post_id = result.get('id', 'unknown')
@@ -99,8 +129,18 @@ class FacebookPoster:
                     'message': 'Facebook post successful'
                 }
             else:
+                if auth_cache.is_unauthorized(response):
+                    auth_cache.invalidate('facebook', self.page_id, self.page_access_token)
                 error_msg = response.json().get('error', {}).get('message', 'Unknown error')
                 print(f"❌ Failed to post to Facebook: {error_msg}")
+                if is_graph_rate_limited(response):
+                    get_tracker().record_rate_limited('facebook', response.headers)
+                    return {
+                        'success': False,
+                        'platform': 'facebook',
+                        'rate_limited': True,
+                        'error': error_msg
+                    }
                 return {
                     'success': False,
                     'platform': 'facebook',
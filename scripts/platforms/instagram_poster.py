@@ -9,14 +9,31 @@ import json
 import requests
 import boto3
 import base64
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import auth_cache
+from rate_limits import get_tracker, is_graph_rate_limited
+
+GRAPH_API_URL = os.getenv('GRAPH_API_URL', 'https://graph.facebook.com')
+DEFAULT_IMAGE_URL = "https://images.unsplash.com/photo-1589829545856-d10d557cf95f?w=1080&h=1080&fit=crop&crop=center"
+REQUEST_TIMEOUT = 30
+# Container polling: exponential backoff with full jitter, capped per sleep and overall
+POLL_INITIAL_DELAY = 1.0
+POLL_MAX_DELAY = 8.0
+CONTAINER_MAX_WAIT = 60
+
 class InstagramPoster:
     def __init__(self, dry_run=True):
         self.dry_run = dry_run
         # DadAssist Instagram API credentials from GitHub Secrets (separate token)
         self.instagram_access_token = os.getenv('INSTAGRAM_ACCESS_TOKEN')
         self.instagram_account_id = os.getenv('INSTAGRAM_ACCOUNT_ID')
+        # Set by the caller to abandon a post (e.g. on timeout) before it is published
+        self.cancelled = threading.Event()
         
         # Check if credentials are available
         if not all([self.instagram_access_token, self.instagram_account_id]):
@@ -32,18 +49,32 @@ class InstagramPoster:
             print("❌ Instagram credentials missing from environment")
             return False
         
+        # Skip the validation round trip while a previous one is still current
+        username = auth_cache.get_cached_identity('instagram', self.instagram_account_id, self.instagram_access_token)
+        if username:
+            print(f"🔐 Instagram authentication cached - @{username}")
+            return True
+        
         try:
             # Test authentication by getting Instagram account info
             response = requests.get(
-                f'https://graph.facebook.com/{self.instagram_account_id}',
+                f'{GRAPH_API_URL}/{self.instagram_account_id}',
                 params={
                     'fields': 'username',
                     'access_token': self.instagram_access_token
-                }
+                },
+                timeout=REQUEST_TIMEOUT
             )
             
+            get_tracker().update_from_headers('instagram', response.headers)
+            
             if response.status_code == 200:
                 account_data = response.json()
+                auth_cache.cache_identity(
+                    'instagram', account_data.get('username', 'dadassist'),
+                    self.instagram_account_id, self.instagram_access_token,
+                    expires_at=auth_cache.graph_token_expiry(self.instagram_access_token, GRAPH_API_URL)
+                )
                 print(f"🔐 Instagram authentication successful - @{account_data.get('username', 'dadassist')}")
                 return True
             else:
@@ -60,7 +91,7 @@ class InstagramPoster:
         
         # Use provided image URL or default professional image
         if not image_url:
-            image_url = "https://images.unsplash.com/photo-1589829545856-d10d557cf95f?w=1080&h=1080&fit=crop&crop=center"
+            image_url = DEFAULT_IMAGE_URL
         
         if self.dry_run:
             print("📷 [DRY RUN] Would post to Instagram:")
@@ -83,87 +114,155 @@ class InstagramPoster:
                 'error': 'Missing credentials'
             }
         
+        return self.create_image_posts([(post_data, image_url)])[0]
+    
+    def create_image_posts(self, posts):
+        """
+        Post several images: [(post_data, image_url), ...].
+
+        Every container is created first so Instagram processes them in
+        parallel, then publish_containers publishes each one as it is ready.
+        Results are returned in input order.
+        """
+        results = [None] * len(posts)
+        created = []
+        for i, (post_data, image_url) in enumerate(posts):
+            container = self.create_container(post_data, image_url)
+            if container['success']:
+                created.append((i, container['creation_id'], post_data['content']))
+            else:
+                results[i] = container
+        
+        published = self.publish_containers([(creation_id, content) for _, creation_id, content in created])
+        for (i, _, _), result in zip(created, published):
+            results[i] = result
+        return results
+    
+    def _failure(self, error, rate_limited=False):
+        result = {
+            'success': False,
+            'platform': 'instagram',
+            'error': error
+        }
+        if rate_limited:
+            result['rate_limited'] = True
+        return result
+    
+    def _check_unauthorized(self, response):
+        if auth_cache.is_unauthorized(response):
+            auth_cache.invalidate('instagram', self.instagram_account_id, self.instagram_access_token)
+    
+    def _check_rate_limit(self, response):
+        """Record quota headers; True if this response was throttled"""
+        if is_graph_rate_limited(response):
+            get_tracker().record_rate_limited('instagram', response.headers)
+            return True
+        get_tracker().update_from_headers('instagram', response.headers)
+        return False
+    
+    def create_container(self, post_data, image_url=None):
+        """Step 1: create the media container so Instagram can start processing the image"""
+        if not image_url:
+            image_url = DEFAULT_IMAGE_URL
+        
         try:
-            # Step 1: Create media container
             media_response = requests.post(
-                f'https://graph.facebook.com/{self.instagram_account_id}/media',
+                f'{GRAPH_API_URL}/{self.instagram_account_id}/media',
                 data={
                     'image_url': image_url,
-                    'caption': content,
+                    'caption': post_data['content'],
                     'access_token': self.instagram_access_token
-                }
+                },
+                timeout=REQUEST_TIMEOUT
             )
             
+            rate_limited = self._check_rate_limit(media_response)
             if media_response.status_code != 200:
+                self._check_unauthorized(media_response)
                 error_msg = media_response.json().get('error', {}).get('message', 'Media creation failed')
                 print(f"❌ Failed to create Instagram media: {error_msg}")
-                return {
-                    'success': False,
-                    'platform': 'instagram',
-                    'error': error_msg
-                }
+                return self._failure(error_msg, rate_limited)
             
             creation_id = media_response.json().get('id')
             
             if not creation_id:
                 print(f"❌ No creation_id returned from Instagram")
                 print(f"   Full response: {media_response.json()}")
-                return {
-                    'success': False,
-                    'platform': 'instagram',
-                    'error': 'Media ID is not available'
-                }
+                return self._failure('Media ID is not available')
             
             print(f"✅ Media container created: {creation_id}")
+            return {'success': True, 'platform': 'instagram', 'creation_id': creation_id}
             
-            # Wait for Instagram to finish processing
-            import time
-            max_attempts = 30
-            for attempt in range(max_attempts):
-                status_response = requests.get(
-                    f'https://graph.facebook.com/{creation_id}',
-                    params={
-                        'fields': 'status_code',
-                        'access_token': self.instagram_access_token
-                    }
-                )
-                
-                if status_response.status_code == 200:
-                    status_code = status_response.json().get('status_code')
-                    print(f"⏳ Media status: {status_code} (attempt {attempt + 1}/{max_attempts})")
-                    
-                    if status_code == 'FINISHED':
-                        print(f"✅ Media processing complete")
-                        break
-                    elif status_code == 'ERROR':
-                        print(f"❌ Media processing failed")
-                        return {
-                            'success': False,
-                            'platform': 'instagram',
-                            'error': 'Media processing failed'
-                        }
-                else:
-                    print(f"⚠️ Status check failed: {status_response.status_code}")
-                    print(f"   Response: {status_response.text}")
+        except Exception as e:
+            print(f"❌ Failed to create Instagram media: {e}")
+            return self._failure(str(e))
+    
+    def wait_for_container(self, creation_id, max_wait=CONTAINER_MAX_WAIT):
+        """
+        Poll the container until FINISHED, backing off exponentially with jitter.
+
+        Returns None when ready, otherwise a failure result.
+        """
+        delay = POLL_INITIAL_DELAY
+        deadline = time.monotonic() + max_wait
+        attempt = 0
+        
+        while True:
+            attempt += 1
+            status_response = requests.get(
+                f'{GRAPH_API_URL}/{creation_id}',
+                params={
+                    'fields': 'status_code',
+                    'access_token': self.instagram_access_token
+                },
+                timeout=REQUEST_TIMEOUT
+            )
+            
+            self._check_rate_limit(status_response)
+            if status_response.status_code == 200:
+                status_code = status_response.json().get('status_code')
+                print(f"⏳ Media status: {status_code} (attempt {attempt})")
                 
-                time.sleep(2)
+                if status_code == 'FINISHED':
+                    print(f"✅ Media processing complete")
+                    return None
+                elif status_code in ('ERROR', 'EXPIRED'):
+                    print(f"❌ Media processing failed")
+                    return self._failure('Media processing failed')
             else:
+                self._check_unauthorized(status_response)
+                print(f"⚠️ Status check failed: {status_response.status_code}")
+                print(f"   Response: {status_response.text}")
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 print(f"❌ Media processing timeout")
-                return {
-                    'success': False,
-                    'platform': 'instagram',
-                    'error': 'Media processing timeout'
-                }
+                return self._failure('Media processing timeout')
             
-            # Step 2: Publish media
+            # Full jitter keeps concurrent pollers from synchronising
+            sleep_for = min(random.uniform(0, delay), remaining)
+            delay = min(delay * 2, POLL_MAX_DELAY)
+            if self.cancelled.wait(sleep_for):
+                print(f"⏹️ Instagram post cancelled while processing")
+                return self._failure('Cancelled')
+    
+    def publish_container(self, creation_id, content=''):
+        """Step 2: publish a processed container"""
+        if self.cancelled.is_set():
+            print(f"⏹️ Instagram post cancelled before publishing")
+            return self._failure('Cancelled')
+        
+        try:
             publish_response = requests.post(
-                f'https://graph.facebook.com/{self.instagram_account_id}/media_publish',
+                f'{GRAPH_API_URL}/{self.instagram_account_id}/media_publish',
                 data={
                     'creation_id': creation_id,
                     'access_token': self.instagram_access_token
-                }
+                },
+                timeout=REQUEST_TIMEOUT
             )
             
+            rate_limited = self._check_rate_limit(publish_response)
             if publish_response.status_code == 200:
                 result = publish_response.json()
                 post_id = result.get('id', 'unknown')
@@ -180,18 +279,36 @@ class InstagramPoster:
                     'message': 'Instagram post successful'
                 }
             else:
+                self._check_unauthorized(publish_response)
                 error_msg = publish_response.json().get('error', {}).get('message', 'Publishing failed')
                 print(f"❌ Failed to publish Instagram post: {error_msg}")
-                return {
-                    'success': False,
-                    'platform': 'instagram',
-                    'error': error_msg
-                }
+                return self._failure(error_msg, rate_limited)
                 
         except Exception as e:
             print(f"❌ Failed to post to Instagram: {e}")
-            return {
-                'success': False,
-                'platform': 'instagram',
-                'error': str(e)
-            }
+            return self._failure(str(e))
+    
+    def publish_when_ready(self, creation_id, content=''):
+        """Wait for a container to finish processing, then publish it straight away"""
+        try:
+            failure = self.wait_for_container(creation_id)
+        except Exception as e:
+            print(f"❌ Failed to post to Instagram: {e}")
+            return self._failure(str(e))
+        
+        if failure:
+            return failure
+        return self.publish_container(creation_id, content)
+    
+    def publish_containers(self, containers, max_workers=4):
+        """
+        Batch-publish prepared containers: [(creation_id, content), ...].
+
+        Containers are polled concurrently and each is published as soon as it
+        is ready; results are returned in input order.
+        """
+        if not containers:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(containers))) as executor:
+            return list(executor.map(lambda c: self.publish_when_ready(*c), containers))
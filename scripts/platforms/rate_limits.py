@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+DadAssist Social Media - Rate Limit Scheduler
+Tracks remaining quota per platform from the rate-limit headers each API
+returns and schedules posts against it as token buckets: a post spends a
+token, an empty bucket waits for its window to reset, and a 429 empties the
+bucket until the reset the platform reported.
+
+  Twitter v2:  x-rate-limit-{limit,remaining,reset} and x-user-limit-24hour-*
+  Graph API:   X-App-Usage / X-Page-Usage / X-Business-Use-Case-Usage (percent used)
+
+State is persisted in DADASSIST_CACHE_DIR so consecutive runs share it.
+"""
+
+import os
+import json
+import time
+import threading
+
+CACHE_DIR = os.getenv('DADASSIST_CACHE_DIR', os.path.expanduser('~/.cache/dadassist'))
+RATE_LIMITS_FILE = os.path.join(CACHE_DIR, 'rate_limits.json')
+# Graph API usage headers are percentages over a rolling hour
+GRAPH_WINDOW = 3600
+# Fallback wait after a 429 that carried no reset information
+DEFAULT_RETRY_AFTER = 900
+
+class TokenBucket:
+    def __init__(self, limit=None, remaining=None, reset_at=0):
+        self.limit = limit
+        self.remaining = remaining
+        self.reset_at = reset_at
+
+    def refresh(self, now):
+        # An empty bucket with no reset time (headers without one, or old saved state)
+        # refills after the fallback window instead of staying empty forever
+        if self.remaining == 0 and not self.reset_at:
+            self.reset_at = now + DEFAULT_RETRY_AFTER
+        # A passed reset refills the bucket; unknown quota is treated as available
+        if self.reset_at and now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = 0
+
+    def wait_time(self, now):
+        """Seconds until a token is available (0 if one is available now)"""
+        self.refresh(now)
+        if self.remaining is None or self.remaining > 0:
+            return 0
+        return max(0, self.reset_at - now)
+
+    def take(self):
+        if self.remaining is not None:
+            self.remaining = max(0, self.remaining - 1)
+
+    def to_dict(self):
+        return {'limit': self.limit, 'remaining': self.remaining, 'reset_at': self.reset_at}
+
+def _header(headers, name):
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+def parse_twitter_headers(headers, now=None):
+    """(limit, remaining, reset_at) from Twitter v2 headers, using the tighter of the endpoint and 24h user limits"""
+    buckets = []
+    for prefix in ('x-rate-limit', 'x-user-limit-24hour'):
+        remaining = _header(headers, f'{prefix}-remaining')
+        if remaining is None:
+            continue
+        buckets.append((
+            int(_header(headers, f'{prefix}-limit') or remaining),
+            int(remaining),
+            int(_header(headers, f'{prefix}-reset') or 0)
+        ))
+    if not buckets:
+        return None
+    return min(buckets, key=lambda b: (b[1], -b[2]))
+
+def parse_graph_headers(headers, now=None):
+    """(limit, remaining, reset_at) from Graph API usage headers, as percent of quota left"""
+    now = now or time.time()
+    usage = []
+    regain_minutes = 0
+    for name in ('x-app-usage', 'x-page-usage', 'x-ad-account-usage', 'x-business-use-case-usage'):
+        value = _header(headers, name)
+        if not value:
+            continue
+        try:
+            data = json.loads(value)
+        except json.JSONDecodeError:
+            continue
+        # Business use case usage is keyed by object id with a list of entries
+        entries = [e for v in data.values() for e in v] if name == 'x-business-use-case-usage' else [data]
+        for entry in entries:
+            usage.extend(entry.get(k, 0) for k in ('call_count', 'total_cputime', 'total_time'))
+            regain_minutes = max(regain_minutes, entry.get('estimated_time_to_regain_access', 0))
+    if not usage:
+        return None
+    remaining = max(0, 100 - max(usage))
+    reset_at = now + (regain_minutes * 60 if regain_minutes else GRAPH_WINDOW)
+    return 100, remaining, int(reset_at)
+
+PARSERS = {
+    'twitter': parse_twitter_headers,
+    'facebook': parse_graph_headers,
+    'instagram': parse_graph_headers
+}
+
+class RateLimitTracker:
+    def __init__(self, state_file=RATE_LIMITS_FILE):
+        self.state_file = state_file
+        self.lock = threading.Lock()
+        self.buckets = {}
+        self._load()
+
+    def _load(self):
+        if self.state_file and os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, 'r') as f:
+                    for platform, state in json.load(f).items():
+                        self.buckets[platform] = TokenBucket(**state)
+            except Exception as e:
+                print(f"⚠️ Error loading rate limit state: {e}")
+                return
+
+            # Save any reset time refresh() fills in for an empty bucket, so the
+            # refill countdown carries over to the next run rather than restarting
+            stuck = [b for b in self.buckets.values() if b.remaining == 0 and not b.reset_at]
+            if stuck:
+                now = time.time()
+                for bucket in stuck:
+                    bucket.refresh(now)
+                self._save()
+
+    def _save(self):
+        if not self.state_file:
+            return
+        os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+        temp_file = f'{self.state_file}.{os.getpid()}.tmp'
+        with open(temp_file, 'w') as f:
+            json.dump({p: b.to_dict() for p, b in self.buckets.items()}, f)
+        os.replace(temp_file, self.state_file)
+
+    def bucket(self, platform):
+        return self.buckets.setdefault(platform, TokenBucket())
+
+    def update_from_headers(self, platform, headers):
+        """Record the quota a response reports"""
+        parsed = PARSERS.get(platform, parse_twitter_headers)(headers)
+        if parsed is None:
+            return
+        with self.lock:
+            bucket = self.bucket(platform)
+            bucket.limit, bucket.remaining, bucket.reset_at = parsed
+            self._save()
+
+    def record_rate_limited(self, platform, headers=None):
+        """A 429: empty the bucket until the reported reset (or Retry-After)"""
+        headers = headers or {}
+        with self.lock:
+            bucket = self.bucket(platform)
+            parsed = PARSERS.get(platform, parse_twitter_headers)(headers)
+            retry_after = _header(headers, 'retry-after')
+            if parsed:
+                bucket.limit, _, bucket.reset_at = parsed
+            elif retry_after and retry_after.isdigit():
+                bucket.reset_at = time.time() + int(retry_after)
+            else:
+                bucket.reset_at = time.time() + DEFAULT_RETRY_AFTER
+            bucket.remaining = 0
+            self._save()
+        print(f"🚦 {platform} rate limited until {time.strftime('%H:%M:%S', time.localtime(bucket.reset_at))}")
+
+    def wait_time(self, platform):
+        with self.lock:
+            return self.bucket(platform).wait_time(time.time())
+
+    def try_acquire(self, platform):
+        """Spend a token if one is available; otherwise return the seconds to wait"""
+        with self.lock:
+            bucket = self.bucket(platform)
+            wait = bucket.wait_time(time.time())
+            if wait == 0:
+                bucket.take()
+                self._save()
+            return wait
+
+    def status(self, platform):
+        with self.lock:
+            bucket = self.bucket(platform)
+            bucket.refresh(time.time())
+            return bucket.to_dict()
+
+class PostScheduler:
+    """
+    Runs posts against the rate limits.
+
+    A platform with an empty bucket does not hold up the others; its post
+    waits for the window to reset, up to max_wait, and is otherwise returned
+    as deferred so the caller can keep it for a later run.
+    """
+
+    def __init__(self, tracker=None, sleep=time.sleep):
+        self.tracker = tracker or get_tracker()
+        self.sleep = sleep
+
+    def run(self, platform, func, *args, max_wait=0):
+        """Run one post as soon as quota allows, retrying once after a 429"""
+        for _ in range(2):
+            wait = self.tracker.try_acquire(platform)
+            if wait > max_wait:
+                return deferred_result(platform, wait)
+            if wait:
+                print(f"🚦 Waiting {wait:.0f}s for {platform} rate limit window")
+                self.sleep(wait)
+                max_wait -= wait
+                self.tracker.try_acquire(platform)
+
+            result = func(*args)
+            if not result.get('rate_limited'):
+                return result
+            # The poster recorded the 429 reset; loop to wait for it if max_wait allows
+        return result
+
+GRAPH_RATE_LIMIT_CODES = {4, 17, 32, 613}
+
+def is_graph_rate_limited(response):
+    """True for a 429 or a Graph API throttling error (which comes back as a 400/403)"""
+    if response.status_code == 429:
+        return True
+    try:
+        return response.json().get('error', {}).get('code') in GRAPH_RATE_LIMIT_CODES
+    except ValueError:
+        return False
+
+def deferred_result(platform, wait):
+    return {
+        'success': False,
+        'platform': platform,
+        'deferred': True,
+        'retry_after': int(wait),
+        'error': f'Rate limited - retry in {int(wait)}s'
+    }
+
+_tracker = None
+_tracker_lock = threading.Lock()
+
+def get_tracker():
+    """Process-wide tracker shared by all posters"""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = RateLimitTracker()
+        return _tracker
@@ -7,8 +7,28 @@ Posts content to Twitter/X using API v2 with GitHub Secrets
 import os
 import json
 import tweepy
+import requests
+import threading
 from datetime import datetime
 
+import auth_cache
+from rate_limits import get_tracker
+
+TWITTER_HOST = 'https://api.twitter.com'
+# Point the client at another host (e.g. a local mock API) without changing tweepy
+TWITTER_API_URL = os.getenv('TWITTER_API_URL', TWITTER_HOST)
+
+class BaseURLAdapter(requests.adapters.HTTPAdapter):
+    """Rewrites requests for the Twitter API host onto TWITTER_API_URL"""
+
+    def __init__(self, base_url):
+        super().__init__()
+        self.base_url = base_url.rstrip('/')
+
+    def send(self, request, **kwargs):
+        request.url = self.base_url + request.url[len(TWITTER_HOST):]
+        return super().send(request, **kwargs)
+
 class TwitterPoster:
     def __init__(self, dry_run=True):
         self.dry_run = dry_run
@@ -18,6 +38,8 @@ class TwitterPoster:
         self.access_token = os.getenv('TWITTER_ACCESS_TOKEN')
         self.access_secret = os.getenv('TWITTER_ACCESS_SECRET')
         self.client = None
+        # Set by the caller to abandon a post (e.g. on timeout) before it is sent
+        self.cancelled = threading.Event()
         
         # Check if credentials are available
         if not all([self.api_key, self.api_secret, self.access_token, self.access_secret]):
@@ -38,18 +60,34 @@ class TwitterPoster:
                 consumer_key=self.api_key,
                 consumer_secret=self.api_secret,
                 access_token=self.access_token,
-                access_token_secret=self.access_secret
+                access_token_secret=self.access_secret,
+                # Raw responses so the rate-limit headers can be read
+                return_type=requests.Response
             )
+            if TWITTER_API_URL != TWITTER_HOST:
+                self.client.session.mount(TWITTER_HOST, BaseURLAdapter(TWITTER_API_URL))
+            
+            # Skip the get_me() round trip while a previous validation is still current
+            username = auth_cache.get_cached_identity('twitter', *self._credentials())
+            if username:
+                print(f"🔐 Twitter authentication cached - @{username}")
+                return True
             
             # Test authentication
-            me = self.client.get_me()
-            print(f"🔐 Twitter authentication successful - @{me.data.username}")
+            # users/me has its own quota; only create_tweet responses feed the posting bucket
+            response = self.client.get_me()
+            username = response.json()['data']['username']
+            auth_cache.cache_identity('twitter', username, *self._credentials())
+            print(f"🔐 Twitter authentication successful - @{username}")
             return True
             
         except Exception as e:
             print(f"❌ Twitter authentication failed: {e}")
             return False
     
+    def _credentials(self):
+        return self.api_key, self.api_secret, self.access_token, self.access_secret
+    
     def post_tweet(self, post_data):
         """Post a tweet to Twitter"""
         content = post_data['content']
@@ -75,9 +113,18 @@ class TwitterPoster:
                 'error': 'Not authenticated'
             }
         
+        if self.cancelled.is_set():
+            print("⏹️ Twitter post cancelled before sending")
+            return {
+                'success': False,
+                'platform': 'twitter',
+                'error': 'Cancelled'
+            }
+        
         try:
             response = self.client.create_tweet(text=content)
-            tweet_id = response.data['id']
+            get_tracker().update_from_headers('twitter', response.headers)
+            tweet_id = response.json()['data']['id']
             tweet_url = f'https://twitter.com/dad_assist/status/{tweet_id}'
             
             print(f"🐦 Posted to Twitter: {content[:50]}...")
@@ -91,6 +138,25 @@ class TwitterPoster:
                 'message': 'Tweet posted successfully'
             }
             
+        except tweepy.TooManyRequests as e:
+            get_tracker().record_rate_limited('twitter', e.response.headers)
+            print(f"❌ Failed to post to Twitter: {e}")
+            return {
+                'success': False,
+                'platform': 'twitter',
+                'rate_limited': True,
+                'error': str(e)
+            }
+            
+        except tweepy.Unauthorized as e:
+            auth_cache.invalidate('twitter', *self._credentials())
+            print(f"❌ Failed to post to Twitter: {e}")
+            return {
+                'success': False,
+                'platform': 'twitter',
+                'error': str(e)
+            }
+            
         except Exception as e:
             print(f"❌ Failed to post to Twitter: {e}")
             return {
@@ -100,9 +166,10 @@ class TwitterPoster:
             }
     
     def get_rate_limit_status(self):
-        """Check Twitter API rate limits"""
+        """Twitter quota as last reported by the API's rate-limit headers"""
+        status = get_tracker().status('twitter')
         return {
-            'remaining_posts': 17,  # Free tier daily limit
-            'reset_time': '2024-12-19T00:00:00Z',
-            'limit': 17
+            'remaining_posts': status['remaining'],
+            'reset_time': datetime.fromtimestamp(status['reset_at']).isoformat() if status['reset_at'] else None,
+            'limit': status['limit']
         }
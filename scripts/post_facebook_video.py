@@ -1,98 +1,247 @@
 #!/usr/bin/env python3
-"""Post video to Facebook page."""
+"""Post video to Facebook page.
+
+Uses the Graph API resumable upload protocol (start / transfer / finish),
+streaming each chunk straight from the S3 HTTP response - no temp file, and
+memory bounded by the chunk size Facebook asks for. The upload session and
+confirmed offset are persisted after every chunk, so a rerun after a network
+failure resumes from the last confirmed byte instead of starting over. A
+saved session that Facebook no longer accepts is dropped and the upload
+starts again.
+"""
 
 import os
 import sys
+import time
 import requests
-import tempfile
 
-def download_video(s3_url):
-    """Download video from S3 to temp file."""
-    print(f"⬇️  Downloading video from S3...")
-    
-    response = requests.get(s3_url, stream=True)
+from upload_state import load_upload_state, save_upload_state, clear_upload_state
+
+GRAPH_VIDEO_URL = os.getenv('GRAPH_VIDEO_URL', 'https://graph-video.facebook.com/v18.0')
+CHUNK_RETRIES = 3
+REQUEST_TIMEOUT = 300
+
+def get_video_size(s3_url):
+    response = requests.head(s3_url, timeout=30)
     response.raise_for_status()
-    
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp4')
-    
-    for chunk in response.iter_content(chunk_size=8192):
-        temp_file.write(chunk)
-    
-    temp_file.close()
-    print(f"✅ Downloaded to {temp_file.name}")
-    return temp_file.name
-
-def post_video_to_facebook(video_path, title, description):
-    """Post video to Facebook page."""
-    
+    return int(response.headers['Content-Length'])
+
+class S3ChunkReader:
+    """Reads exact byte ranges from a streaming S3 GET, reopening at the current offset on failure"""
+
+    def __init__(self, s3_url, offset=0, block_size=1024 * 1024):
+        self.s3_url = s3_url
+        self.offset = offset
+        self.block_size = block_size
+        self.response = None
+        self.iterator = None
+        self.pending = b''
+
+    def _open(self):
+        self.close()
+        headers = {'Range': f'bytes={self.offset}-'} if self.offset else {}
+        self.response = requests.get(self.s3_url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT)
+        self.response.raise_for_status()
+        self.iterator = self.response.iter_content(chunk_size=self.block_size)
+        self.pending = b''
+
+    def read(self, start, end):
+        """Return bytes [start, end) of the object"""
+        if start != self.offset or self.iterator is None:
+            self.offset = start
+            self._open()
+
+        parts = [self.pending[:end - start]]
+        self.pending = self.pending[end - start:]
+        needed = end - start - len(parts[0])
+        while needed > 0:
+            block = next(self.iterator, b'')
+            if not block:
+                raise IOError(f"S3 stream ended at byte {end - needed}, expected {end}")
+            parts.append(block[:needed])
+            self.pending = block[needed:]
+            needed -= len(parts[-1])
+
+        self.offset = end
+        return b''.join(parts)
+
+    def close(self):
+        if self.response is not None:
+            self.response.close()
+        self.response = None
+        self.iterator = None
+
+class FileChunkReader:
+    """Reads byte ranges from a local copy of the video"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+
+    def read(self, start, end):
+        if self.file is None:
+            self.file = open(self.path, 'rb')
+        self.file.seek(start)
+        return self.file.read(end - start)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+        self.file = None
+
+class GraphError(RuntimeError):
+    """An error response from the Graph API (as opposed to a network failure)"""
+
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.status_code = status_code
+
+def graph_post(url, data, files=None):
+    response = requests.post(url, data=data, files=files, timeout=REQUEST_TIMEOUT)
+    if response.status_code != 200:
+        try:
+            message = response.json().get('error', {}).get('message')
+        except ValueError:
+            message = None
+        raise GraphError(message or f'HTTP {response.status_code}', response.status_code)
+    return response.json()
+
+def start_upload(page_id, access_token, s3_url, file_size):
+    result = graph_post(f"{GRAPH_VIDEO_URL}/{page_id}/videos", {
+        'upload_phase': 'start',
+        'file_size': file_size,
+        'access_token': access_token
+    })
+    state = {
+        's3_url': s3_url,
+        'file_size': file_size,
+        'upload_session_id': result['upload_session_id'],
+        'video_id': result['video_id'],
+        'start_offset': int(result['start_offset']),
+        'end_offset': int(result['end_offset'])
+    }
+    save_upload_state('facebook', state)
+    print(f"📘 Started upload session {state['upload_session_id']} ({file_size / 1024 / 1024:.1f} MB)")
+    return state
+
+def transfer_chunks(page_id, access_token, state, local_path=None):
+    """Send chunks at the offsets Facebook asks for until it reports the file complete"""
+    reader = FileChunkReader(local_path) if local_path else S3ChunkReader(state['s3_url'], state['start_offset'])
+    try:
+        # The protocol hands out the next range in each response, so chunks go one at a time
+        while state['start_offset'] < state['end_offset']:
+            start, end = state['start_offset'], state['end_offset']
+            for attempt in range(1, CHUNK_RETRIES + 1):
+                try:
+                    chunk = reader.read(start, end)
+                    result = graph_post(f"{GRAPH_VIDEO_URL}/{page_id}/videos", {
+                        'upload_phase': 'transfer',
+                        'upload_session_id': state['upload_session_id'],
+                        'start_offset': start,
+                        'access_token': access_token
+                    }, files={'video_file_chunk': ('chunk', chunk, 'application/octet-stream')})
+                    break
+                except (requests.RequestException, IOError, RuntimeError) as e:
+                    # A 4xx (e.g. an expired session) won't succeed on retry
+                    if attempt == CHUNK_RETRIES or (isinstance(e, GraphError) and e.status_code < 500):
+                        raise
+                    print(f"⚠️ Chunk {start}-{end} failed ({e}), retrying ({attempt}/{CHUNK_RETRIES})")
+                    reader.close()
+                    time.sleep(2 ** attempt)
+
+            state['start_offset'] = int(result['start_offset'])
+            state['end_offset'] = int(result['end_offset'])
+            save_upload_state('facebook', state)
+            print(f"   ⬆️  {state['start_offset'] / state['file_size'] * 100:.0f}% uploaded")
+    finally:
+        reader.close()
+
+def finish_upload(page_id, access_token, state, title, description):
+    graph_post(f"{GRAPH_VIDEO_URL}/{page_id}/videos", {
+        'upload_phase': 'finish',
+        'upload_session_id': state['upload_session_id'],
+        'title': title,
+        'description': description,
+        'access_token': access_token
+    })
+    return state['video_id']
+
+def post_video_to_facebook(s3_url, title, description, local_path=None):
+    """
+    Post video to Facebook page, resuming an interrupted upload of the same video.
+
+    Chunks are read from local_path when a cached copy is available, otherwise streamed from S3.
+    """
+
     page_id = os.getenv('FACEBOOK_PAGE_ID')
     access_token = os.getenv('FACEBOOK_ACCESS_TOKEN')
-    
+
     if not all([page_id, access_token]):
         print("❌ Missing Facebook credentials")
         sys.exit(1)
-    
+
     print(f"📘 Uploading video to Facebook...")
     print(f"   Title: {title}")
     print(f"   Description: {description[:100]}...")
-    
-    url = f"https://graph-video.facebook.com/v18.0/{page_id}/videos"
-    
-    with open(video_path, 'rb') as video_file:
-        files = {'file': video_file}
-        data = {
-            'title': title,
-            'description': description,
-            'access_token': access_token
-        }
-        
-        response = requests.post(url, files=files, data=data)
-    
-    if response.status_code == 200:
-        result = response.json()
-        video_id = result.get('id')
-        video_url = f"https://www.facebook.com/{page_id}/videos/{video_id}"
-        
-        print(f"✅ Video posted to Facebook")
-        print(f"🔗 Video ID: {video_id}")
-        print(f"🔗 URL: {video_url}")
-        
-        # Save outputs
-        with open('facebook_video_id.txt', 'w') as f:
-            f.write(video_id)
-        with open('facebook_video_url.txt', 'w') as f:
-            f.write(video_url)
-        
-        return video_id, video_url
-    else:
-        error = response.json().get('error', {})
-        print(f"❌ Failed to post video: {error.get('message', 'Unknown error')}")
+
+    def new_session():
+        file_size = os.path.getsize(local_path) if local_path else get_video_size(s3_url)
+        return start_upload(page_id, access_token, s3_url, file_size)
+
+    def upload(state):
+        transfer_chunks(page_id, access_token, state, local_path)
+        return finish_upload(page_id, access_token, state, title, description)
+
+    try:
+        state = load_upload_state('facebook', s3_url)
+        if state:
+            print(f"🔁 Resuming upload session {state['upload_session_id']} at byte {state['start_offset']}")
+            try:
+                video_id = upload(state)
+            except GraphError as e:
+                # Sessions expire; a saved one Facebook rejects would otherwise fail every rerun
+                print(f"⚠️ Previous upload session rejected ({e}) - starting over")
+                clear_upload_state('facebook', s3_url)
+                video_id = upload(new_session())
+        else:
+            video_id = upload(new_session())
+    except Exception as e:
+        print(f"❌ Failed to post video: {e}")
         sys.exit(1)
 
+    clear_upload_state('facebook', s3_url)
+    video_url = f"https://www.facebook.com/{page_id}/videos/{video_id}"
+
+    print(f"✅ Video posted to Facebook")
+    print(f"🔗 Video ID: {video_id}")
+    print(f"🔗 URL: {video_url}")
+
+    # Save outputs
+    with open('facebook_video_id.txt', 'w') as f:
+        f.write(video_id)
+    with open('facebook_video_url.txt', 'w') as f:
+        f.write(video_url)
+
+    return video_id, video_url
+
+def video_description(title):
+    return f"{title}\n\nVisit dadassist.com.au for more information and support for Australian fathers."
+
 def main():
     """Main function."""
-    
+
     # Read inputs
     with open('s3_url.txt', 'r') as f:
         s3_url = f.read().strip()
-    
+
     with open('video_title.txt', 'r') as f:
         title = f.read().strip()
-    
+
     # Create description
-    description = f"{title}\n\nVisit dadassist.com.au for more information and support for Australian fathers."
-    
-    # Download video
-    video_path = download_video(s3_url)
-    
-    try:
-        # Post to Facebook
-        post_video_to_facebook(video_path, title, description)
-    finally:
-        # Clean up temp file
-        if os.path.exists(video_path):
-            os.remove(video_path)
-            print(f"🗑️  Cleaned up temp file")
+    description = video_description(title)
+
+    # Stream from S3 to Facebook
+    post_video_to_facebook(s3_url, title, description)
 
 if __name__ == '__main__':
     main()
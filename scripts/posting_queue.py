@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+DadAssist Social Media - Posting Queue
+Durable queue of (article, platform) posting jobs kept in the state store.
+
+Each job's key is its idempotency key, so an article is queued and posted to
+a platform at most once no matter how many runs see it. A run drains up to
+a budget of due jobs with bounded concurrency; failures are retried with
+exponential backoff and rate-limited posts wait for their window to reset.
+A post that timed out may still have been published, so its job is parked
+as 'unknown' for a manual check instead of being retried.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from state_store import StateStore
+
+PLATFORMS = ['twitter', 'facebook', 'instagram']
+POSTING_BUDGET = int(os.getenv('POSTING_BUDGET', '9'))
+POSTING_CONCURRENCY = int(os.getenv('POSTING_CONCURRENCY', '3'))
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 900
+
+def retry_delay(attempts):
+    """Backoff before the next attempt: 15 min, 30 min, 1 h, 2 h ..."""
+    return RETRY_BASE_DELAY * 2 ** (attempts - 1)
+
+def enqueue_articles(articles, platforms=PLATFORMS, store=None):
+    """Queue a job per article and platform, skipping pairs already queued"""
+    store = store or StateStore()
+    added = store.enqueue_post_jobs(articles, platforms)
+    print(f"📥 Queued {added} new posting jobs ({len(articles)} articles × {len(platforms)} platforms)")
+    return added
+
+def drain_queue(post_job, budget=POSTING_BUDGET, concurrency=POSTING_CONCURRENCY, store=None, prepare=None):
+    """
+    Run up to budget due jobs through post_job(job) -> result dict.
+
+    Store updates stay on the calling thread; post_job runs on the pool.
+    prepare(jobs), if given, sees the runnable jobs first so work that spans
+    several jobs can be started before any of them is posted.
+    Returns [(job, result)] in the order jobs were claimed.
+    """
+    store = store or StateStore()
+    now = time.time()
+    jobs = store.claim_post_jobs(budget, now)
+    if not jobs:
+        print("✅ Posting queue is empty - nothing due")
+        return []
+
+    print(f"🚚 Draining {len(jobs)} posting jobs (budget {budget}, concurrency {concurrency})")
+
+    runnable = []
+    outcomes = {}
+    for job in jobs:
+        if store.post_succeeded(job['filename'], job['platform']):
+            # Posted by an earlier run that died before finishing the job
+            store.finish_post_job(job['job_key'], 'done', job['attempts'])
+            outcomes[job['job_key']] = {'success': True, 'platform': job['platform'], 'message': 'Already posted'}
+        else:
+            runnable.append(job)
+
+    if prepare and runnable:
+        prepare(runnable)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {executor.submit(post_job, job): job for job in runnable}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'success': False, 'platform': job['platform'], 'error': str(e)}
+            record_outcome(store, job, result)
+            outcomes[job['job_key']] = result
+
+    counts = store.post_job_counts()
+    print(f"📊 Queue: {counts.get('pending', 0)} pending, {counts.get('done', 0)} done, "
+          f"{counts.get('failed', 0)} failed, {counts.get('unknown', 0)} unknown")
+    return [(job, outcomes[job['job_key']]) for job in jobs]
+
+def record_outcome(store, job, result):
+    """Persist one job's result and schedule any retry"""
+    now = time.time()
+    with store.transaction():
+        if result.get('success'):
+            store.record_posts([(job['filename'], job['platform'], dict(result, posted_date=datetime.now().isoformat()))])
+            store.finish_post_job(job['job_key'], 'done', job['attempts'] + 1)
+        elif result.get('outcome_unknown'):
+            # Retrying could post twice; leave it for someone to check the platform
+            store.finish_post_job(job['job_key'], 'unknown', job['attempts'] + 1, 0, result.get('error', ''))
+            print(f"❔ {job['job_key']} outcome unknown - check the platform before requeueing")
+        elif result.get('deferred') or result.get('rate_limited'):
+            # Quota, not a failure: wait for the window without spending an attempt
+            retry_after = result.get('retry_after') or RETRY_BASE_DELAY
+            store.finish_post_job(job['job_key'], 'pending', job['attempts'], now + retry_after, result.get('error', ''))
+        else:
+            attempts = job['attempts'] + 1
+            if attempts >= MAX_ATTEMPTS:
+                store.record_posts([(job['filename'], job['platform'], dict(result, posted_date=datetime.now().isoformat()))])
+                store.finish_post_job(job['job_key'], 'failed', attempts, 0, result.get('error', ''))
+                print(f"❌ {job['job_key']} failed permanently after {attempts} attempts")
+            else:
+                store.finish_post_job(job['job_key'], 'pending', attempts, now + retry_delay(attempts), result.get('error', ''))
+
+def main():
+    """Show queue status"""
+    store = StateStore()
+    counts = store.post_job_counts()
+    print(f"📋 Posting queue: {counts}")
+    for job in store.post_jobs():
+        if job['status'] != 'done':
+            due = datetime.fromtimestamp(job['next_attempt_at']).isoformat() if job['next_attempt_at'] else 'now'
+            print(f"  {job['status']:>8} {job['job_key']} (attempts {job['attempts']}, due {due}) {job['last_error']}")
+
+if __name__ == '__main__':
+    main()
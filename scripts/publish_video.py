@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Publish the weekly video to YouTube and Facebook.
+
+Fetches the video from S3 once into the local artifact cache, then runs both
+uploads concurrently from that verified copy. Each platform succeeds or fails
+on its own; the exit code is non-zero if either failed. Outputs are the same
+files the standalone scripts write (youtube_id.txt, facebook_video_*.txt).
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import artifact_cache
+from upload_youtube import upload_to_youtube, update_processed_urls
+from post_facebook_video import post_video_to_facebook, video_description
+
+def read_input(filename):
+    with open(filename, 'r') as f:
+        return f.read().strip()
+
+def run_upload(platform, func, *args):
+    """Run one upload, turning any failure (including the scripts' sys.exit) into a result"""
+    try:
+        return {'success': True, 'platform': platform, 'result': func(*args)}
+    except BaseException as e:
+        error = f'exit code {e.code}' if isinstance(e, SystemExit) else str(e)
+        print(f"❌ {platform} upload failed: {error}")
+        return {'success': False, 'platform': platform, 'error': error}
+
+def main():
+    try:
+        s3_url = read_input('s3_url.txt')
+        title = read_input('video_title.txt')
+        category = read_input('video_category.txt')
+        article_url = read_input('selected_url.txt')
+    except FileNotFoundError as e:
+        print(f"❌ Missing input file: {e}")
+        sys.exit(1)
+
+    try:
+        local_path = artifact_cache.fetch(s3_url)
+    except Exception as e:
+        # Fall back to streaming straight from S3 in each uploader
+        print(f"⚠️ Artifact cache unavailable ({e}) - streaming from S3")
+        local_path = None
+
+    print(f"🚀 Publishing to YouTube and Facebook concurrently")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        youtube = executor.submit(run_upload, 'youtube', upload_to_youtube, s3_url, title, category, local_path)
+        facebook = executor.submit(run_upload, 'facebook', post_video_to_facebook, s3_url, title, video_description(title), local_path)
+        results = [youtube.result(), facebook.result()]
+
+    if results[0]['success']:
+        video_id, _ = results[0]['result']
+        update_processed_urls(article_url, video_id, category)
+
+    for result in results:
+        status = "✅" if result['success'] else "❌"
+        print(f"{status} {result['platform']}")
+
+    if not all(r['success'] for r in results):
+        sys.exit(1)
+    print(f"🎉 All done!")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+DadAssist Social Media - Posting Results Log
+Append-only history of posting runs with a small index, replacing one
+posting_results_<timestamp>.json file per run.
+
+  social-media/results/posting_results.jsonl        one run summary per line
+  social-media/results/results_index.json           latest pointer + per-date byte offsets
+  social-media/results/archive/posting_results_YYYY-MM.jsonl.gz   compacted history
+
+The latest run and any run by id are read with a single seek; date-range
+scans only touch the offsets for those dates (and the archives for older months).
+"""
+
+import os
+import sys
+import json
+import glob
+import gzip
+from datetime import datetime, timedelta
+
+RESULTS_DIR = 'social-media/results'
+LOG_NAME = 'posting_results.jsonl'
+INDEX_NAME = 'results_index.json'
+ARCHIVE_DIR_NAME = 'archive'
+LEGACY_PATTERN = 'posting_results_*.json'
+DEFAULT_KEEP_DAYS = 30
+
+def run_date_key(summary):
+    """Calendar date (YYYY-MM-DD) a run summary belongs to"""
+    return summary.get('run_date', '')[:10]
+
+class ResultsLog:
+    def __init__(self, results_dir=RESULTS_DIR):
+        self.results_dir = results_dir
+        self.log_file = os.path.join(results_dir, LOG_NAME)
+        self.index_file = os.path.join(results_dir, INDEX_NAME)
+        self.archive_dir = os.path.join(results_dir, ARCHIVE_DIR_NAME)
+        self._index = None
+
+    # Index
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = self._load_index()
+        return self._index
+
+    def _empty_index(self):
+        return {'latest': None, 'latest_archived': None, 'dates': {}, 'log_size': 0, 'archives': {}}
+
+    def _load_index(self):
+        index = None
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, 'r') as f:
+                    index = json.load(f)
+            except Exception as e:
+                print(f"⚠️ Error loading results index, rebuilding: {e}")
+
+        log_size = os.path.getsize(self.log_file) if os.path.exists(self.log_file) else 0
+        if index is None or index.get('log_size') != log_size:
+            # An append landed without its index update (or the index is missing) - rescan the log
+            previous = index or {}
+            index = self._scan_log()
+            index['archives'] = previous.get('archives', {})
+            index['latest_archived'] = previous.get('latest_archived')
+            self._save_index(index)
+        return index
+
+    def _scan_log(self):
+        index = self._empty_index()
+        if not os.path.exists(self.log_file):
+            return index
+
+        with open(self.log_file, 'rb') as f:
+            offset = 0
+            for line in f:
+                try:
+                    summary = json.loads(line)
+                except json.JSONDecodeError:
+                    offset += len(line)
+                    continue
+                self._index_entry(index, summary, offset, len(line))
+                offset += len(line)
+        index['log_size'] = offset
+        return index
+
+    def _index_entry(self, index, summary, offset, length):
+        entry = [summary['run_id'], offset, length]
+        index['dates'].setdefault(run_date_key(summary), []).append(entry)
+        if index['latest'] is None or summary['run_id'] >= index['latest'][0]:
+            index['latest'] = entry
+
+    def _save_index(self, index):
+        os.makedirs(self.results_dir, exist_ok=True)
+        temp_file = self.index_file + '.tmp'
+        with open(temp_file, 'w') as f:
+            json.dump(index, f)
+        os.replace(temp_file, self.index_file)
+
+    # Reads and writes
+
+    def append(self, summary):
+        """Append a run summary to the log and return its run id"""
+        summary.setdefault('run_id', datetime.now().strftime('%Y%m%d_%H%M%S'))
+        line = (json.dumps(summary) + '\n').encode('utf-8')
+
+        index = self.index
+        os.makedirs(self.results_dir, exist_ok=True)
+        with open(self.log_file, 'ab') as f:
+            offset = f.tell()
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._index_entry(index, summary, offset, len(line))
+        index['log_size'] = offset + len(line)
+        self._save_index(index)
+        return summary['run_id']
+
+    def _read_at(self, f, offset, length):
+        f.seek(offset)
+        return json.loads(f.read(length))
+
+    def latest_id(self):
+        latest = self.index['latest']
+        return latest[0] if latest else self.index.get('latest_archived')
+
+    def latest(self):
+        """Most recent run summary, or None"""
+        latest = self.index['latest']
+        if latest is None:
+            # Everything has been compacted away; fall back to the archived latest run
+            run_id = self.index.get('latest_archived')
+            return self.get(run_id) if run_id else None
+        with open(self.log_file, 'rb') as f:
+            return self._read_at(f, latest[1], latest[2])
+
+    def get(self, run_id):
+        """Run summary by id (run ids are YYYYmmdd_HHMMSS timestamps)"""
+        date_key = f"{run_id[:4]}-{run_id[4:6]}-{run_id[6:8]}"
+        for entry_id, offset, length in self.index['dates'].get(date_key, []):
+            if entry_id == run_id:
+                with open(self.log_file, 'rb') as f:
+                    return self._read_at(f, offset, length)
+
+        for summary in self._iter_archive(date_key[:7]):
+            if summary.get('run_id') == run_id:
+                return summary
+        return None
+
+    def iter_runs(self, start_date=None, end_date=None):
+        """Yield run summaries with start_date <= date <= end_date (YYYY-MM-DD), oldest first"""
+        def in_range(date_key):
+            return (not start_date or date_key >= start_date) and (not end_date or date_key <= end_date)
+
+        for month in sorted(self.index.get('archives', {})):
+            if (not start_date or month >= start_date[:7]) and (not end_date or month <= end_date[:7]):
+                for summary in self._iter_archive(month):
+                    if in_range(run_date_key(summary)):
+                        yield summary
+
+        dates = sorted(d for d in self.index['dates'] if in_range(d))
+        if not dates:
+            return
+        with open(self.log_file, 'rb') as f:
+            for date_key in dates:
+                for _, offset, length in self.index['dates'][date_key]:
+                    yield self._read_at(f, offset, length)
+
+    # Compaction
+
+    def _archive_path(self, month):
+        return os.path.join(self.archive_dir, f'posting_results_{month}.jsonl.gz')
+
+    def _iter_archive(self, month):
+        path = self._archive_path(month)
+        if not os.path.exists(path):
+            return
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def import_legacy_files(self):
+        """Fold posting_results_<timestamp>.json files into the log, oldest first"""
+        legacy_files = sorted(glob.glob(os.path.join(self.results_dir, LEGACY_PATTERN)))
+        for path in legacy_files:
+            with open(path, 'r') as f:
+                summary = json.load(f)
+            summary.setdefault('run_id', os.path.basename(path)[len('posting_results_'):-len('.json')])
+            self.append(summary)
+            os.remove(path)
+        return len(legacy_files)
+
+    def compact(self, keep_days=DEFAULT_KEEP_DAYS):
+        """Move runs older than keep_days into monthly gzip archives and rewrite the live log"""
+        imported = self.import_legacy_files()
+        cutoff = (datetime.now() - timedelta(days=keep_days)).strftime('%Y-%m-%d')
+
+        index = self.index
+        old_dates = sorted(d for d in index['dates'] if d < cutoff)
+        if not old_dates:
+            print(f"📦 Nothing to compact ({imported} legacy files imported)")
+            return 0
+
+        kept = []
+        archived = {}
+        with open(self.log_file, 'rb') as f:
+            for date_key in sorted(index['dates']):
+                for _, offset, length in index['dates'][date_key]:
+                    f.seek(offset)
+                    line = f.read(length)
+                    if date_key < cutoff:
+                        archived.setdefault(date_key[:7], []).append(line)
+                    else:
+                        kept.append(line)
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        for month, lines in archived.items():
+            # gzip members concatenate, so appending keeps earlier archives readable
+            with gzip.open(self._archive_path(month), 'ab') as f:
+                f.writelines(lines)
+            index['archives'][month] = index['archives'].get(month, 0) + len(lines)
+
+        temp_file = self.log_file + '.tmp'
+        with open(temp_file, 'wb') as f:
+            f.writelines(kept)
+        os.replace(temp_file, self.log_file)
+
+        latest_id = self.latest_id()
+        archives = index['archives']
+        self._index = self._scan_log()
+        self._index['archives'] = archives
+        self._index['latest_archived'] = latest_id
+        self._save_index(self._index)
+
+        archived_count = sum(len(lines) for lines in archived.values())
+        print(f"📦 Compacted {archived_count} runs into {len(archived)} archives, {len(kept)} runs kept live")
+        return archived_count
+
+def load_latest_posting_results(results_dir=RESULTS_DIR):
+    """Latest posting run summary, or None"""
+    return ResultsLog(results_dir).latest()
+
+def main():
+    """Command line access for workflows"""
+    if len(sys.argv) < 2:
+        print("Usage: results_log.py <latest-id|compact [keep_days]>")
+        sys.exit(1)
+
+    command = sys.argv[1]
+    log = ResultsLog()
+    if command == 'latest-id':
+        latest_id = log.latest_id()
+        if latest_id is None:
+            sys.exit(1)
+        print(latest_id)
+    elif command == 'compact':
+        keep_days = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_KEEP_DAYS
+        log.compact(keep_days)
+    else:
+        print(f"❌ Unknown command: {command}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -1,40 +1,18 @@
 #!/usr/bin/env python3
 """Select next unprocessed article from DadAssist website."""
 
-import json
 import random
-import requests
-from bs4 import BeautifulSoup
 
-INDEX_URL = "https://www.dadassist.com.au/posts/index.html"
-PROCESSED_FILE = "processed_urls.json"
+from site_index import get_site_index, normalize_url
+from state_store import StateStore
 
 def load_processed_urls():
-    """Load list of already processed URLs."""
-    try:
-        with open(PROCESSED_FILE, 'r') as f:
-            data = json.load(f)
-            return {item['url'] for item in data}
-    except FileNotFoundError:
-        return set()
+    """Load set of already processed URLs from the state store."""
+    return {normalize_url(url) for url in StateStore().processed_urls()}
 
-def scrape_article_urls():
-    """Scrape all article URLs from index page."""
-    print(f"📥 Fetching article list from {INDEX_URL}")
-    
-    response = requests.get(INDEX_URL, timeout=30)
-    response.raise_for_status()
-    
-    soup = BeautifulSoup(response.content, 'html.parser')
-    
-    # Find all article links
-    article_links = []
-    for link in soup.find_all('a', href=True):
-        href = link['href']
-        if href.startswith('articles/') and href.endswith('.html'):
-            full_url = f"https://www.dadassist.com.au/posts/{href}"
-            article_links.append(full_url)
-    
+def get_article_urls():
+    """Get all article URLs from the shared site index."""
+    article_links = [f"https://www.dadassist.com.au/posts/articles/{entry['filename']}" for entry in get_site_index()]
     print(f"📊 Found {len(article_links)} total articles")
     return article_links
 
@@ -43,10 +21,10 @@ def select_next_article():
     processed = load_processed_urls()
     print(f"✅ Already processed: {len(processed)} articles")
     
-    all_articles = scrape_article_urls()
+    all_articles = get_article_urls()
     
     # Get all unprocessed articles
-    unprocessed = [url for url in all_articles if url not in processed]
+    unprocessed = sorted(url for url in set(all_articles) if normalize_url(url) not in processed)
     
     if not unprocessed:
         print("⚠️  All articles have been processed!")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+DadAssist Shared Site Index
+Fetches and parses the list of published articles once, normalises URLs and
+caches the parsed result on disk, so select_article and detect_new_articles
+running on the same machine reuse it.
+
+The cache is revalidated against the catalog feed on every call (a
+conditional GET, normally a 304), and is rebuilt whenever any article's
+updated date or content hash changes, so a newly published article is never
+hidden. Only the index.html fallback, which has no validators, relies on the
+SITE_INDEX_TTL.
+"""
+
+import json
+import os
+import time
+import hashlib
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import requests
+
+from article_catalog import fetch_catalog, CACHE_DIR
+
+SITE_URL = 'https://dadassist.com.au'
+INDEX_URL = f'{SITE_URL}/posts/index.html'
+SITE_INDEX_CACHE = os.path.join(CACHE_DIR, 'site_index.json')
+DEFAULT_TTL = int(os.getenv('SITE_INDEX_TTL', '3600'))
+
+def normalize_url(url):
+    """Canonical article URL: https, bare domain, no query or fragment"""
+    url = url.strip()
+    if url.startswith('articles/'):
+        url = f'{SITE_URL}/posts/{url}'
+
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return f'https://{host}{parts.path}'
+
+def article_url(filename):
+    return f'{SITE_URL}/posts/articles/{filename}'
+
+def parse_index_html(content):
+    """Parse posts/index.html into article entries"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, 'html.parser')
+    entries = {}
+
+    for link in soup.find_all('a', href=lambda x: x and x.startswith('articles/') and x.endswith('.html')):
+        filename = link['href'].replace('articles/', '')
+        description_div = link.find_next_sibling('div', class_='resource-description')
+        entries[filename] = {
+            'filename': filename,
+            'title': link.get_text().strip(),
+            'description': description_div.get_text().strip() if description_div else '',
+            'category': '',
+            'content_hash': ''
+        }
+
+    return list(entries.values())
+
+def catalog_version(catalog):
+    """Fingerprint of the catalog: changes when an article is added, removed, updated or edited"""
+    digest = hashlib.sha256()
+    for entry in sorted(catalog, key=lambda e: e['filename']):
+        digest.update(f"{entry['filename']}|{entry.get('updated', '')}|{entry.get('content_hash', '')}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def catalog_entries(catalog):
+    return [{
+        'filename': entry['filename'],
+        'title': entry['title'],
+        'description': entry.get('description', ''),
+        'category': entry.get('category', ''),
+        'content_hash': entry.get('content_hash', '')
+    } for entry in catalog]
+
+def scrape_index():
+    print(f"🔍 Scraping article list from {INDEX_URL}")
+    response = requests.get(INDEX_URL, timeout=30)
+    response.raise_for_status()
+    return parse_index_html(response.content)
+
+def fetch_catalog_or_none():
+    try:
+        return fetch_catalog()
+    except Exception as e:
+        print(f"⚠️ Error fetching catalog, falling back to index scrape: {e}")
+        return None
+
+def load_cached_index(cache_file=SITE_INDEX_CACHE):
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading site index cache: {e}")
+    return None
+
+def save_cached_index(articles, source, version, cache_file=SITE_INDEX_CACHE):
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    temp_file = cache_file + '.tmp'
+    with open(temp_file, 'w') as f:
+        json.dump({
+            'fetched_at': time.time(),
+            'fetched_date': datetime.now().isoformat(),
+            'source': source,
+            'version': version,
+            'articles': articles
+        }, f)
+    os.replace(temp_file, cache_file)
+
+def get_site_index(ttl=DEFAULT_TTL, force_refresh=False, cache_file=SITE_INDEX_CACHE):
+    """Return the list of published articles, served from the on-disk cache while it matches the catalog"""
+    cached = None if force_refresh else load_cached_index(cache_file)
+
+    catalog = fetch_catalog_or_none()
+    if catalog is not None:
+        version = catalog_version(catalog)
+        if cached and cached.get('version') == version:
+            print(f"📋 Using cached site index ({len(cached['articles'])} articles, catalog unchanged)")
+            return cached['articles']
+        articles, source = catalog_entries(catalog), 'catalog'
+    else:
+        # index.html carries no per-article versions, so the fallback can only be cached by age
+        if cached and cached.get('source') == 'index.html':
+            age = time.time() - cached['fetched_at']
+            if age < ttl:
+                print(f"📋 Using cached site index ({len(cached['articles'])} articles, {int(age)}s old)")
+                return cached['articles']
+        articles, source, version = scrape_index(), 'index.html', None
+
+    for entry in articles:
+        entry['url'] = article_url(entry['filename'])
+    save_cached_index(articles, source, version, cache_file)
+
+    print(f"📋 Site index refreshed from {source} ({len(articles)} articles)")
+    return articles
@@ -6,220 +6,182 @@ Uses same architecture as existing content automation notifier
 """
 
 import os
-import json
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from datetime import datetime
-import glob
+
+import notification_digest
+from email_dispatcher import send_email
+from email_templates import compile_template, stylesheet
+from results_log import ResultsLog
 
 def load_latest_posting_results():
     """Load the latest social media posting results"""
     try:
-        # Find the most recent results file
-        results_files = glob.glob('social-media/results/posting_results_*.json')
-        if not results_files:
+        # Latest pointer in the results index - a single seek into the log
+        results = ResultsLog().latest()
+        if not results:
             print("❌ No posting results found")
             return None
         
-        latest_file = max(results_files, key=os.path.getctime)
-        with open(latest_file, 'r') as f:
-            return json.load(f)
+        return results
     except Exception as e:
         print(f"❌ Error loading posting results: {e}")
         return None
 
-def create_social_media_email_content(results):
-    """Create comprehensive email content with social media posting results"""
-    
-    # Determine overall status
-    total_attempts = results.get('total_posts_attempted', 0)
-    successful_posts = sum(
-        sum(1 for post_result in article['posting_results'] if post_result['success'])
-        for article in results['results']
-    )
-    
-    status = "✅ SUCCESS" if successful_posts > 0 else "❌ FAILED"
-    success_rate = (successful_posts / total_attempts * 100) if total_attempts > 0 else 0
-    
-    # Get posting details
-    articles_processed = results.get('articles_processed', 0)
-    run_mode = "DRY RUN" if results.get('dry_run', True) else "LIVE POSTING"
-    
-    html_content = f"""
+SOCIAL_EMAIL_TEMPLATE = """
     <!DOCTYPE html>
     <html>
     <head>
         <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }}
-            .header {{ background: linear-gradient(135deg, #E09900, #FF7F00); color: white; padding: 20px; border-radius: 8px; text-align: center; margin-bottom: 20px; }}
-            .status-success {{ background: #d4edda; border: 1px solid #c3e6cb; color: #155724; padding: 15px; border-radius: 5px; margin: 15px 0; }}
-            .status-failed {{ background: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; padding: 15px; border-radius: 5px; margin: 15px 0; }}
-            .info-box {{ background: #e8f4f8; border: 1px solid #bee5eb; padding: 15px; border-radius: 5px; margin: 15px 0; }}
-            .warning-box {{ background: #fff3cd; border: 1px solid #ffeaa7; padding: 15px; border-radius: 5px; margin: 15px 0; }}
-            .stats {{ display: flex; justify-content: space-around; margin: 20px 0; }}
-            .stat {{ text-align: center; padding: 10px; background: #f8f9fa; border-radius: 5px; }}
-            .stat-number {{ font-size: 24px; font-weight: bold; color: #E09900; }}
-            .platform-results {{ margin: 20px 0; }}
-            .platform {{ background: #f8f9fa; padding: 15px; margin: 10px 0; border-radius: 5px; border-left: 4px solid #E09900; }}
-            .success {{ border-left-color: #28a745; }}
-            .failed {{ border-left-color: #dc3545; }}
-            .post-content {{ background: #ffffff; padding: 10px; margin: 10px 0; border: 1px solid #dee2e6; border-radius: 3px; font-family: monospace; font-size: 12px; }}
-            .step {{ margin: 10px 0; padding: 10px; background: #f8f9fa; border-radius: 5px; }}
-            .step-number {{ background: #E09900; color: white; padding: 5px 10px; border-radius: 50%; margin-right: 10px; font-weight: bold; }}
-            .code {{ background: #f1f3f4; padding: 2px 6px; border-radius: 3px; font-family: monospace; }}
-            a {{ color: #E09900; text-decoration: none; }}
-            a:hover {{ text-decoration: underline; }}
+            body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }
+            .header { background: linear-gradient(135deg, #E09900, #FF7F00); color: white; padding: 20px; border-radius: 8px; text-align: center; margin-bottom: 20px; }
+            .status-success { background: #d4edda; border: 1px solid #c3e6cb; color: #155724; padding: 15px; border-radius: 5px; margin: 15px 0; }
+            .status-failed { background: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; padding: 15px; border-radius: 5px; margin: 15px 0; }
+            .info-box { background: #e8f4f8; border: 1px solid #bee5eb; padding: 15px; border-radius: 5px; margin: 15px 0; }
+            .warning-box { background: #fff3cd; border: 1px solid #ffeaa7; padding: 15px; border-radius: 5px; margin: 15px 0; }
+            .stats { display: flex; justify-content: space-around; margin: 20px 0; }
+            .stat { text-align: center; padding: 10px; background: #f8f9fa; border-radius: 5px; }
+            .stat-number { font-size: 24px; font-weight: bold; color: #E09900; }
+            .platform-results { margin: 20px 0; }
+            .platform { background: #f8f9fa; padding: 15px; margin: 10px 0; border-radius: 5px; border-left: 4px solid #E09900; }
+            .success { border-left-color: #28a745; }
+            .failed { border-left-color: #dc3545; }
+            .post-content { background: #ffffff; padding: 10px; margin: 10px 0; border: 1px solid #dee2e6; border-radius: 3px; font-family: monospace; font-size: 12px; }
+            .step { margin: 10px 0; padding: 10px; background: #f8f9fa; border-radius: 5px; }
+            .step-number { background: #E09900; color: white; padding: 5px 10px; border-radius: 50%; margin-right: 10px; font-weight: bold; }
+            .code { background: #f1f3f4; padding: 2px 6px; border-radius: 3px; font-family: monospace; }
+            a { color: #E09900; text-decoration: none; }
+            a:hover { text-decoration: underline; }
         </style>
     </head>
     <body>
         <div class="header">
             <h1>🤖 DadAssist Social Media Automation Report</h1>
-            <p>Social Media Posting Results - {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}</p>
+            <p>Social Media Posting Results - {{ header_time }}</p>
         </div>
 
-        <div class="{'status-success' if successful_posts > 0 else 'status-failed'}">
-            <h2>{status} - Social Media Posting Complete</h2>
-            <p><strong>Mode:</strong> {run_mode}</p>
-            <p><strong>Articles Processed:</strong> {articles_processed}</p>
-            <p><strong>Posts Attempted:</strong> {total_attempts}</p>
-            <p><strong>Successful Posts:</strong> {successful_posts}</p>
-            <p><strong>Success Rate:</strong> {success_rate:.1f}%</p>
+        <div class="{{ status_box }}">
+            <h2>{{ status }} - Social Media Posting Complete</h2>
+            <p><strong>Mode:</strong> {{ run_mode }}</p>
+            <p><strong>Articles Processed:</strong> {{ articles_processed }}</p>
+            <p><strong>Posts Attempted:</strong> {{ total_attempts }}</p>
+            <p><strong>Successful Posts:</strong> {{ successful_posts }}</p>
+            <p><strong>Success Rate:</strong> {{ success_rate }}%</p>
         </div>
 
         <div class="stats">
             <div class="stat">
-                <div class="stat-number">{articles_processed}</div>
+                <div class="stat-number">{{ articles_processed }}</div>
                 <div>Articles</div>
             </div>
             <div class="stat">
-                <div class="stat-number">{successful_posts}</div>
+                <div class="stat-number">{{ successful_posts }}</div>
                 <div>Successful Posts</div>
             </div>
             <div class="stat">
-                <div class="stat-number">{success_rate:.0f}%</div>
+                <div class="stat-number">{{ success_rate_rounded }}%</div>
                 <div>Success Rate</div>
             </div>
         </div>
 
         <h2>📊 Platform Results</h2>
         <div class="platform-results">
-    """
-    
-    # Add platform-specific results
-    platform_stats = {'twitter': 0, 'facebook': 0, 'instagram': 0}
-    platform_urls = {'twitter': [], 'facebook': [], 'instagram': []}
-    
-    for article_result in results['results']:
-        article_title = article_result['article']['title']
-        article_url = article_result['article'].get('url', 'URL not available')
-        
-        html_content += f"""
-        <div class="platform">
-            <h3>📖 {article_title}</h3>
-            <p><strong>📄 DadAssist Article:</strong> <a href="{article_url}">{article_url}</a></p>
-        """
-        
-        for post_result in article_result['posting_results']:
-            platform = post_result['platform']
-            success = post_result['success']
-            
-            if success:
-                platform_stats[platform] += 1
-                if 'url' in post_result:
-                    platform_urls[platform].append(post_result['url'])
-            
-            status_class = 'success' if success else 'failed'
-            status_icon = '✅' if success else '❌'
-            
-            html_content += f"""
-            <div class="platform {status_class}">
-                <strong>{status_icon} {platform.title()}</strong>
-                {f"- <a href='{post_result.get('url', '#')}'>View Post</a>" if success and 'url' in post_result else ''}
-                {f"- Error: {post_result.get('error', 'Unknown error')}" if not success else ''}
-            </div>
-            """
-        
-        # Show post content preview
-        if 'posts_generated' in article_result:
-            html_content += "<h4>📝 Generated Content Preview:</h4>"
-            for platform, post_data in article_result['posts_generated'].items():
-                if platform != 'tiktok':  # Skip TikTok for now
-                    content_preview = post_data['content'][:100] + "..." if len(post_data['content']) > 100 else post_data['content']
-                    html_content += f"""
-                    <div class="post-content">
-                        <strong>{platform.title()}:</strong> {content_preview}
-                        <br><small>Hashtags: {', '.join(post_data['hashtags'])}</small>
-                    </div>
-                    """
-        
-        html_content += "</div>"
-    
-    # Add article summary with URLs
-    html_content += f"""
+{{ article_blocks }}
         <h2>📚 Articles Posted</h2>
         <div class="info-box">
             <p><strong>DadAssist Knowledge Base Articles Promoted:</strong></p>
             <ul>
-    """
-    
-    for article_result in results['results']:
-        article_title = article_result['article']['title']
-        article_url = article_result['article'].get('url', '#')
-        article_filename = article_result['article'].get('filename', 'unknown')
-        
-        html_content += f"""
-                <li>
-                    <strong>{article_title}</strong><br>
-                    <small>File: {article_filename}</small><br>
-                    <a href="{article_url}">{article_url}</a>
-                </li>
-        """
-    
-    html_content += """
+    {{ article_items }}
             </ul>
         </div>
-    """
     
-    # Add platform summary
-    html_content += f"""
         </div>
 
         <h2>🎯 Platform Summary</h2>
         <div class="info-box">
-            <p><strong>Twitter:</strong> {platform_stats['twitter']} posts successful</p>
-            <p><strong>Facebook:</strong> {platform_stats['facebook']} posts successful</p>
-            <p><strong>Instagram:</strong> {platform_stats['instagram']} posts successful</p>
+            <p><strong>Twitter:</strong> {{ twitter_count }} posts successful</p>
+            <p><strong>Facebook:</strong> {{ facebook_count }} posts successful</p>
+            <p><strong>Instagram:</strong> {{ instagram_count }} posts successful</p>
         </div>
-    """
-    
-    # Add live post links if available
-    if any(platform_urls.values()) and not results.get('dry_run', True):
-        html_content += """
-        <h2>🔗 Live Post Links</h2>
+    {{ live_links }}{{ troubleshooting }}
+        <h2>📋 Next Steps</h2>
+        <div class="info-box">
+            <div class="step">
+                <span class="step-number">1</span>
+                <strong>Review Results:</strong> Check the success rate and any failed posts above
+            </div>
+            <div class="step">
+                <span class="step-number">2</span>
+                <strong>View Live Posts:</strong> Visit your social media accounts to see the posts
+                <ul>
+                    <li><strong>Twitter:</strong> <a href="https://twitter.com/dad_assist">@dad_assist</a></li>
+                    <li><strong>Facebook:</strong> <a href="https://facebook.com/DadAssist">DadAssist Page</a></li>
+                    <li><strong>Instagram:</strong> <a href="https://instagram.com/dadassist">@dadassist</a></li>
+                </ul>
+            </div>
+            <div class="step">
+                <span class="step-number">3</span>
+                <strong>Check Original Articles:</strong> Verify the DadAssist articles being promoted
+                <ul>{{ article_links }}                </ul>
+            </div>
+            <div class="step">
+                <span class="step-number">4</span>
+                <strong>Monitor Engagement:</strong> Track likes, comments, and clicks on SubmitForm.html links
+            </div>
+            <div class="step">
+                <span class="step-number">5</span>
+                <strong>Queue Management:</strong> {{ queue_remaining }} articles remaining in queue
+            </div>
+        </div>
+
+        <h2>⚙️ Automation Settings</h2>
         <div class="info-box">
+            <p><strong>Repository:</strong> <a href="https://github.com/N-BRAITH/dadassist-content-automation">dadassist-content-automation</a></p>
+            <p><strong>Workflow:</strong> Social Media Posts (Tuesday 6 PM UTC)</p>
+            <p><strong>Mode:</strong> {{ run_mode }}</p>
+            <p><strong>Platforms:</strong> Twitter, Facebook, Instagram (TikTok disabled)</p>
+        </div>
+
+        <div class="warning-box">
+            <p><strong>📧 This is an automated report from your DadAssist social media system.</strong></p>
+            <p>Generated at: {{ generated_at }}</p>
+        </div>
+    </body>
+    </html>
+    """
+
+ARTICLE_BLOCK_TEMPLATE = """
+        <div class="platform">
+            <h3>📖 {{ title }}</h3>
+            <p><strong>📄 DadAssist Article:</strong> <a href="{{ url }}">{{ url }}</a></p>
+        {{ platforms }}{{ previews }}</div>"""
+
+PLATFORM_RESULT_TEMPLATE = """
+            <div class="platform {{ status_class }}">
+                <strong>{{ status_icon }} {{ platform }}</strong>
+                {{ link }}
+                {{ error }}
+            </div>
+            """
+
+POST_PREVIEW_TEMPLATE = """
+                    <div class="post-content">
+                        <strong>{{ platform }}:</strong> {{ preview }}
+                        <br><small>Hashtags: {{ hashtags }}</small>
+                    </div>
+                    """
+
+ARTICLE_ITEM_TEMPLATE = """
+                <li>
+                    <strong>{{ title }}</strong><br>
+                    <small>File: {{ filename }}</small><br>
+                    <a href="{{ url }}">{{ url }}</a>
+                </li>
         """
-        
-        for platform, urls in platform_urls.items():
-            if urls:
-                html_content += f"<p><strong>{platform.title()}:</strong></p><ul>"
-                for url in urls:
-                    html_content += f'<li><a href="{url}">{url}</a></li>'
-                html_content += "</ul>"
-        
-        html_content += "</div>"
-    
-    # Add troubleshooting section if there are failures
-    failed_posts = sum(
-        sum(1 for post_result in article['posting_results'] if not post_result['success'])
-        for article in results['results']
-    )
-    
-    if failed_posts > 0:
-        html_content += f"""
+
+TROUBLESHOOTING_TEMPLATE = """
         <h2>🔧 Troubleshooting Failed Posts</h2>
         <div class="warning-box">
-            <p><strong>⚠️ {failed_posts} posts failed.</strong> Common causes and solutions:</p>
+            <p><strong>⚠️ {{ failed_posts }} posts failed.</strong> Common causes and solutions:</p>
         </div>
 
         <h3>🔑 Update API Credentials</h3>
@@ -393,117 +355,179 @@ def create_social_media_email_content(results):
             </ol>
         </div>
         """
+
+# Compiled once at import; fragments take their CSS from the main template's stylesheet
+SOCIAL_EMAIL = compile_template(SOCIAL_EMAIL_TEMPLATE)
+SOCIAL_CSS = stylesheet(SOCIAL_EMAIL_TEMPLATE)
+ARTICLE_BLOCK = compile_template(ARTICLE_BLOCK_TEMPLATE, SOCIAL_CSS)
+# One variant per status so the status class is static and gets inlined too
+PLATFORM_RESULT = {
+    status: compile_template(PLATFORM_RESULT_TEMPLATE.replace('{{ status_class }}', status), SOCIAL_CSS)
+    for status in ('success', 'failed')
+}
+POST_PREVIEW = compile_template(POST_PREVIEW_TEMPLATE, SOCIAL_CSS)
+ARTICLE_ITEM = compile_template(ARTICLE_ITEM_TEMPLATE, SOCIAL_CSS)
+TROUBLESHOOTING = compile_template(TROUBLESHOOTING_TEMPLATE, SOCIAL_CSS)
+
+
+def summarize_results(results):
+    """Success/failure counts and per-platform successes from one pass over a run's results"""
+    summary = {
+        'successful_posts': 0,
+        'failed_posts': 0,
+        'platform_stats': {'twitter': 0, 'facebook': 0, 'instagram': 0},
+        'platform_urls': {'twitter': [], 'facebook': [], 'instagram': []}
+    }
+    for article_result in results['results']:
+        for post_result in article_result['posting_results']:
+            if post_result['success']:
+                summary['successful_posts'] += 1
+                platform = post_result['platform']
+                summary['platform_stats'][platform] = summary['platform_stats'].get(platform, 0) + 1
+                if 'url' in post_result:
+                    summary['platform_urls'].setdefault(platform, []).append(post_result['url'])
+            else:
+                summary['failed_posts'] += 1
+    return summary
+
+def render_article_block(article_result):
+    platforms = []
+    for post_result in article_result['posting_results']:
+        success = post_result['success']
+        platforms.append(PLATFORM_RESULT['success' if success else 'failed'](
+            status_icon='✅' if success else '❌',
+            platform=post_result['platform'].title(),
+            link=f"- <a href='{post_result.get('url', '#')}'>View Post</a>" if success and 'url' in post_result else '',
+            error=f"- Error: {post_result.get('error', 'Unknown error')}" if not success else ''
+        ))
     
-    # Add next steps
-    html_content += f"""
-        <h2>📋 Next Steps</h2>
-        <div class="info-box">
-            <div class="step">
-                <span class="step-number">1</span>
-                <strong>Review Results:</strong> Check the success rate and any failed posts above
-            </div>
-            <div class="step">
-                <span class="step-number">2</span>
-                <strong>View Live Posts:</strong> Visit your social media accounts to see the posts
-                <ul>
-                    <li><strong>Twitter:</strong> <a href="https://twitter.com/dad_assist">@dad_assist</a></li>
-                    <li><strong>Facebook:</strong> <a href="https://facebook.com/DadAssist">DadAssist Page</a></li>
-                    <li><strong>Instagram:</strong> <a href="https://instagram.com/dadassist">@dadassist</a></li>
-                </ul>
-            </div>
-            <div class="step">
-                <span class="step-number">3</span>
-                <strong>Check Original Articles:</strong> Verify the DadAssist articles being promoted
-                <ul>"""
+    # Show post content preview
+    previews = ''
+    if 'posts_generated' in article_result:
+        previews = "<h4>📝 Generated Content Preview:</h4>" + ''.join(
+            POST_PREVIEW(
+                platform=platform.title(),
+                preview=post_data['content'][:100] + "..." if len(post_data['content']) > 100 else post_data['content'],
+                hashtags=', '.join(post_data['hashtags'])
+            )
+            for platform, post_data in article_result['posts_generated'].items()
+            if platform != 'tiktok'  # Skip TikTok for now
+        )
     
+    return ARTICLE_BLOCK(
+        title=article_result['article']['title'],
+        url=article_result['article'].get('url', 'URL not available'),
+        platforms=''.join(platforms),
+        previews=previews
+    )
+
+def create_social_media_email_content(results, summary=None):
+    """Create comprehensive email content with social media posting results"""
+    
+    summary = summary or summarize_results(results)
+    total_attempts = results.get('total_posts_attempted', 0)
+    successful_posts = summary['successful_posts']
+    success_rate = (successful_posts / total_attempts * 100) if total_attempts > 0 else 0
+    articles_processed = results.get('articles_processed', 0)
+    run_mode = "DRY RUN" if results.get('dry_run', True) else "LIVE POSTING"
+    
+    article_blocks = []
+    article_items = []
+    article_links = []
     for article_result in results['results']:
-        article_title = article_result['article']['title']
-        article_url = article_result['article'].get('url', '#')
-        html_content += f"""
-                    <li><a href="{article_url}">{article_title}</a></li>"""
+        article = article_result['article']
+        article_blocks.append(render_article_block(article_result))
+        article_items.append(ARTICLE_ITEM(
+            title=article['title'],
+            filename=article.get('filename', 'unknown'),
+            url=article.get('url', '#')
+        ))
+        article_links.append(f"""
+                    <li><a href="{article.get('url', '#')}">{article['title']}</a></li>""")
     
-    html_content += f"""
-                </ul>
-            </div>
-            <div class="step">
-                <span class="step-number">4</span>
-                <strong>Monitor Engagement:</strong> Track likes, comments, and clicks on SubmitForm.html links
-            </div>
-            <div class="step">
-                <span class="step-number">5</span>
-                <strong>Queue Management:</strong> {articles_processed - successful_posts//3} articles remaining in queue
-            </div>
-        </div>
-
-        <h2>⚙️ Automation Settings</h2>
+    # Live post links if available
+    live_links = ''
+    platform_urls = summary['platform_urls']
+    if any(platform_urls.values()) and not results.get('dry_run', True):
+        live_links = """
+        <h2>🔗 Live Post Links</h2>
         <div class="info-box">
-            <p><strong>Repository:</strong> <a href="https://github.com/N-BRAITH/dadassist-content-automation">dadassist-content-automation</a></p>
-            <p><strong>Workflow:</strong> Social Media Posts (Tuesday 6 PM UTC)</p>
-            <p><strong>Mode:</strong> {run_mode}</p>
-            <p><strong>Platforms:</strong> Twitter, Facebook, Instagram (TikTok disabled)</p>
-        </div>
+        """ + ''.join(
+            f"<p><strong>{platform.title()}:</strong></p><ul>" + ''.join(f'<li><a href="{url}">{url}</a></li>' for url in urls) + "</ul>"
+            for platform, urls in platform_urls.items() if urls
+        ) + "</div>"
+    
+    now = datetime.now()
+    return SOCIAL_EMAIL(
+        header_time=now.strftime('%Y-%m-%d %H:%M UTC'),
+        status_box='status-success' if successful_posts > 0 else 'status-failed',
+        status="✅ SUCCESS" if successful_posts > 0 else "❌ FAILED",
+        run_mode=run_mode,
+        articles_processed=articles_processed,
+        total_attempts=total_attempts,
+        successful_posts=successful_posts,
+        success_rate=f'{success_rate:.1f}',
+        success_rate_rounded=f'{success_rate:.0f}',
+        article_blocks=''.join(article_blocks),
+        article_items=''.join(article_items),
+        twitter_count=summary['platform_stats']['twitter'],
+        facebook_count=summary['platform_stats']['facebook'],
+        instagram_count=summary['platform_stats']['instagram'],
+        live_links=live_links,
+        troubleshooting=TROUBLESHOOTING(failed_posts=summary['failed_posts']) if summary['failed_posts'] > 0 else '',
+        article_links=''.join(article_links),
+        queue_remaining=articles_processed - successful_posts // 3,
+        generated_at=now.strftime('%Y-%m-%d %H:%M:%S UTC')
+    )
 
-        <div class="warning-box">
-            <p><strong>📧 This is an automated report from your DadAssist social media system.</strong></p>
-            <p>Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
-        </div>
-    </body>
-    </html>
-    """
+def spool_posting_results(results, summary, subject):
+    """Add this posting run to the notification digest instead of emailing it"""
+    if summary['failed_posts'] == 0:
+        status = 'success'
+    else:
+        status = 'warning' if summary['successful_posts'] > 0 else 'failed'
     
-    return html_content
+    items = [('Posts', f"{summary['successful_posts']}/{results.get('total_posts_attempted', 0)} successful", '')]
+    for article_result in results['results']:
+        article = article_result['article']
+        outcomes = ', '.join(
+            f"{'✅' if post_result['success'] else '❌'} {post_result['platform'].title()}"
+            for post_result in article_result['posting_results']
+        )
+        items.append((article['title'], outcomes, article.get('url', '')))
+    for platform, urls in summary['platform_urls'].items():
+        for url in urls:
+            items.append((platform.title(), url, url))
+    return notification_digest.spool('social', status, subject, items)
 
-def send_social_media_notification(results):
+def send_social_media_notification(results, wait=True):
     """Send email notification with social media posting results"""
     
-    # Email configuration (using same setup as existing notifier)
     sender_email = os.getenv('SENDER_EMAIL', 'noreply@dadassist.com.au')
     notification_email = os.getenv('NOTIFICATION_EMAIL')
-    email_password = os.getenv('EMAIL_PASSWORD')
-    ses_username = os.getenv('SES_USERNAME')
     
-    if not notification_email:
+    if not notification_email and not notification_digest.DIGEST_ENABLED:
         print("❌ No notification email configured")
         return False
     
-    # Create email content
-    html_content = create_social_media_email_content(results)
-    
-    # Determine subject based on results
-    successful_posts = sum(
-        sum(1 for post_result in article['posting_results'] if post_result['success'])
-        for article in results['results']
-    )
+    summary = summarize_results(results)
+    successful_posts = summary['successful_posts']
     
     run_mode = "DRY RUN" if results.get('dry_run', True) else "LIVE"
     status = "✅ SUCCESS" if successful_posts > 0 else "❌ FAILED"
     
     subject = f"🤖 DadAssist Social Media Report - {status} ({run_mode}) - {successful_posts} posts"
     
-    # Create email message
-    msg = MIMEMultipart('alternative')
-    msg['Subject'] = subject
-    msg['From'] = sender_email
-    msg['To'] = notification_email
+    if notification_digest.DIGEST_ENABLED:
+        return spool_posting_results(results, summary, subject)
     
-    # Add HTML content
-    html_part = MIMEText(html_content, 'html')
-    msg.attach(html_part)
+    # Create email content
+    html_content = create_social_media_email_content(results, summary)
     
-    try:
-        # Send via Amazon SES (same region as existing notifier)
-        server = smtplib.SMTP('email-smtp.ap-southeast-2.amazonaws.com', 587)
-        server.starttls()
-        server.login(ses_username, email_password)
-        server.send_message(msg)
-        server.quit()
-        
+    sent = send_email(subject, html_content, sender_email, notification_email, wait=wait)
+    if sent is True:
         print(f"✅ Social media notification sent to {notification_email}")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Failed to send notification: {e}")
-        return False
+    return sent
 
 def main():
     """Main notification function"""
@@ -7,7 +7,10 @@ Reads new articles and posts to all social media platforms
 import json
 import os
 import sys
+import time
 import argparse
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from datetime import datetime
 
 # Import platform-specific posters
@@ -15,10 +18,14 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'platforms'))
 from twitter_poster import TwitterPoster
 from facebook_poster import FacebookPoster
 from instagram_poster import InstagramPoster
+from rate_limits import PostScheduler, deferred_result
+from posting_queue import enqueue_articles, drain_queue, PLATFORMS, POSTING_BUDGET, POSTING_CONCURRENCY
 from tiktok_poster import TikTokPoster
 
 # Import post templates
 from post_templates import generate_all_posts
+from state_store import StateStore
+from results_log import ResultsLog
 
 def load_new_articles():
     """Load new articles from detection system"""
@@ -38,48 +45,132 @@ def load_new_articles():
         print(f"❌ Error loading new articles: {e}")
         return None
 
-def post_to_all_platforms(article, dry_run=True):
-    """Post article to social media platforms (excluding TikTok for now)"""
-    print(f"\n📝 Processing article: {article['title']}")
-    print(f"   File: {article['filename']}")
-    
-    # Generate platform-specific posts
-    all_posts = generate_all_posts(article)
-    
-    # Initialize platform posters (excluding TikTok)
-    twitter = TwitterPoster(dry_run=dry_run)
-    facebook = FacebookPoster(dry_run=dry_run)
-    instagram = InstagramPoster(dry_run=dry_run)
-    
-    results = []
-    
-    # Post to Twitter
+# Per-platform wall-clock limits in seconds; Instagram includes up to 60s of media processing
+PLATFORM_TIMEOUTS = {
+    'twitter': int(os.getenv('TWITTER_POST_TIMEOUT', '60')),
+    'facebook': int(os.getenv('FACEBOOK_POST_TIMEOUT', '60')),
+    'instagram': int(os.getenv('INSTAGRAM_POST_TIMEOUT', '120'))
+}
+
+def post_to_twitter(twitter, post_data):
     print(f"\n🐦 Posting to Twitter...")
     if twitter.authenticate():
-        result = twitter.post_tweet(all_posts['posts']['twitter'])
-        results.append(result)
-    else:
-        results.append({'success': False, 'platform': 'twitter', 'error': 'Authentication failed'})
-    
-    # Post to Facebook
+        return twitter.post_tweet(post_data)
+    return {'success': False, 'platform': 'twitter', 'error': 'Authentication failed'}
+
+def post_to_facebook(facebook, post_data):
     print(f"\n📘 Posting to Facebook...")
     if facebook.authenticate():
-        result = facebook.post_to_page(all_posts['posts']['facebook'])
-        results.append(result)
-    else:
-        results.append({'success': False, 'platform': 'facebook', 'error': 'Authentication failed'})
-    
-    # Post to Instagram
+        return facebook.post_to_page(post_data)
+    return {'success': False, 'platform': 'facebook', 'error': 'Authentication failed'}
+
+def post_to_instagram(instagram, post_data):
     print(f"\n📷 Posting to Instagram...")
     if instagram.authenticate():
         # Use generated image URL if available
         instagram_image_url = os.getenv('INSTAGRAM_IMAGE_URL')
         if instagram_image_url:
             print(f"🎨 Using generated image: {instagram_image_url}")
-        result = instagram.create_image_post(all_posts['posts']['instagram'], instagram_image_url)
-        results.append(result)
-    else:
-        results.append({'success': False, 'platform': 'instagram', 'error': 'Authentication failed'})
+        return instagram.create_image_post(post_data, instagram_image_url)
+    return {'success': False, 'platform': 'instagram', 'error': 'Authentication failed'}
+
+def post_batch_to_instagram(instagram, posts):
+    """Create a container per post up front, then publish each as soon as Instagram has processed it"""
+    print(f"\n📷 Posting {len(posts)} images to Instagram...")
+    if not instagram.authenticate():
+        return [{'success': False, 'platform': 'instagram', 'error': 'Authentication failed'} for _ in posts]
+    instagram_image_url = os.getenv('INSTAGRAM_IMAGE_URL')
+    if instagram_image_url:
+        print(f"🎨 Using generated image: {instagram_image_url}")
+    return instagram.create_image_posts([(post_data, instagram_image_url) for post_data in posts])
+
+def timed_out_result(platform, timeout):
+    """
+    Result for a post that overran its timeout. The request may still be in
+    flight and land, so the outcome is unknown rather than failed and the post
+    must not be retried.
+    """
+    return {
+        'success': False,
+        'platform': platform,
+        'outcome_unknown': True,
+        'error': f'Timed out after {timeout}s - may still have posted, not retried'
+    }
+
+def start_post(call):
+    """
+    Run call() on a daemon thread and return a Future for its result.
+
+    Daemon threads, unlike executor workers, are not joined at exit, so a hung
+    API call can't hold the process open after it has been reported.
+    """
+    future = Future()
+    
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(call())
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+def wait_for_post(platform, poster, future, timeout, started):
+    """Result of a started post, or an unknown outcome once timeout has passed since started"""
+    try:
+        return future.result(timeout=max(0, started + timeout - time.monotonic()))
+    except FutureTimeoutError:
+        print(f"⏱️ {platform} timed out after {timeout}s - cancelling")
+        # Stops the poster at its next check, i.e. before the post is sent if it hasn't been yet
+        poster.cancelled.set()
+        return timed_out_result(platform, timeout)
+    except Exception as e:
+        return {'success': False, 'platform': platform, 'error': str(e)}
+
+def run_platform_jobs(jobs, timeouts=PLATFORM_TIMEOUTS, scheduler=None):
+    """
+    Run (platform, poster, func, post_data) jobs concurrently.
+
+    Results come back in job order. A platform that overruns its timeout is
+    cancelled and reported with an unknown outcome. With a scheduler, each
+    job spends a rate-limit token first and a platform out of quota comes
+    back deferred.
+    """
+    def post(platform, poster, func, post_data):
+        if scheduler:
+            return scheduler.run(platform, func, poster, post_data)
+        return func(poster, post_data)
+    
+    started = time.monotonic()
+    futures = [start_post(lambda job=job: post(*job)) for job in jobs]
+    
+    return [
+        wait_for_post(platform, poster, future, timeouts.get(platform, 60), started)
+        for (platform, poster, _, _), future in zip(jobs, futures)
+    ]
+
+def post_to_all_platforms(article, dry_run=True):
+    """Post article to social media platforms concurrently (excluding TikTok for now)"""
+    print(f"\n📝 Processing article: {article['title']}")
+    print(f"   File: {article['filename']}")
+    
+    # Generate platform-specific posts
+    all_posts = generate_all_posts(article)
+    posts = all_posts['posts']
+    
+    # Initialize platform posters (excluding TikTok)
+    jobs = [
+        ('twitter', TwitterPoster(dry_run=dry_run), post_to_twitter, posts['twitter']),
+        ('facebook', FacebookPoster(dry_run=dry_run), post_to_facebook, posts['facebook']),
+        ('instagram', InstagramPoster(dry_run=dry_run), post_to_instagram, posts['instagram'])
+    ]
+    
+    started = time.monotonic()
+    # Dry runs make no API calls, so they neither spend nor wait for rate-limit quota
+    results = run_platform_jobs(jobs, scheduler=None if dry_run else PostScheduler())
+    print(f"\n⏱️ Posted to {len(jobs)} platforms in {time.monotonic() - started:.1f}s")
     
     # Skip TikTok for now
     print(f"\n🎵 Skipping TikTok (not configured)")
@@ -90,13 +181,91 @@ def post_to_all_platforms(article, dry_run=True):
         'posting_results': results
     }
 
+def post_from_queue(articles, budget=POSTING_BUDGET, concurrency=POSTING_CONCURRENCY):
+    """
+    Queue (article, platform) jobs and drain up to budget of them.
+
+    Results are grouped per article in the post_to_all_platforms shape.
+    The drain's Instagram jobs are posted as one batch, started before the
+    other platforms so media processing overlaps their posts.
+    """
+    store = StateStore()
+    enqueue_articles(articles, store=store)
+    
+    posters = {
+        'twitter': (TwitterPoster, post_to_twitter),
+        'facebook': (FacebookPoster, post_to_facebook)
+    }
+    scheduler = PostScheduler()
+    instagram = InstagramPoster(dry_run=False)
+    instagram_jobs = {}
+    generated = {}
+    generated_lock = threading.Lock()
+    
+    def posts_for(article):
+        # Each article's posts are generated once, shared by its platform jobs
+        with generated_lock:
+            if article['filename'] not in generated:
+                generated[article['filename']] = generate_all_posts(article)
+            return generated[article['filename']]
+    
+    def start_instagram_batch(jobs):
+        batch = []
+        for job in jobs:
+            if job['platform'] != 'instagram':
+                continue
+            # Each image spends its own token; jobs without one wait for the window in the queue
+            wait = scheduler.tracker.try_acquire('instagram')
+            if wait:
+                instagram_jobs[job['job_key']] = deferred_result('instagram', wait)
+            else:
+                batch.append(job)
+        if not batch:
+            return
+        
+        started = time.monotonic()
+        posts = [posts_for(job['article'])['posts']['instagram'] for job in batch]
+        future = start_post(lambda: post_batch_to_instagram(instagram, posts))
+        for index, job in enumerate(batch):
+            instagram_jobs[job['job_key']] = (future, index, started)
+    
+    def instagram_result(job):
+        entry = instagram_jobs[job['job_key']]
+        if isinstance(entry, dict):
+            return entry
+        future, index, started = entry
+        results = wait_for_post('instagram', instagram, future, PLATFORM_TIMEOUTS['instagram'], started)
+        # A timeout or error covers the whole batch
+        return results[index] if isinstance(results, list) else dict(results)
+    
+    def post_job(job):
+        platform = job['platform']
+        if platform == 'instagram':
+            return instagram_result(job)
+        poster_class, func = posters[platform]
+        # A poster per job, so concurrent jobs for one platform don't share client or cancellation state
+        poster = poster_class(dry_run=False)
+        post_data = posts_for(job['article'])['posts'][platform]
+        started = time.monotonic()
+        future = start_post(lambda: scheduler.run(platform, func, poster, post_data))
+        return wait_for_post(platform, poster, future, PLATFORM_TIMEOUTS.get(platform, 60), started)
+    
+    outcomes = drain_queue(post_job, budget=budget, concurrency=concurrency, store=store,
+                           prepare=start_instagram_batch)
+    
+    by_article = {}
+    for job, result in sorted(outcomes, key=lambda o: PLATFORMS.index(o[0]['platform'])):
+        all_posts = posts_for(job['article'])
+        entry = by_article.setdefault(job['filename'], {
+            'article': all_posts['article'],
+            'posts_generated': all_posts['posts'],
+            'posting_results': []
+        })
+        entry['posting_results'].append(result)
+    return list(by_article.values())
+
 def save_posting_results(all_results, dry_run=True):
-    """Save posting results for review"""
-    os.makedirs('social-media/results', exist_ok=True)
-    
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f'social-media/results/posting_results_{timestamp}.json'
-    
+    """Append posting results to the results log for review"""
     # Import section detection function
     import sys
     sys.path.append('scripts')
@@ -117,15 +286,14 @@ def save_posting_results(all_results, dry_run=True):
         'run_date': datetime.now().isoformat(),
         'dry_run': dry_run,
         'articles_processed': len(all_results),
-        'total_posts_attempted': len(all_results) * 4,  # 4 platforms
+        'total_posts_attempted': sum(len(result['posting_results']) for result in all_results),
         'results': all_results
     }
     
-    with open(filename, 'w') as f:
-        json.dump(summary, f, indent=2)
+    run_id = ResultsLog().append(summary)
     
-    print(f"\n💾 Results saved to: {filename}")
-    return filename
+    print(f"\n💾 Results saved to posting results log (run {run_id})")
+    return summary
 
 def print_summary(all_results, dry_run=True):
     """Print summary of posting results"""
@@ -189,33 +357,19 @@ def validate_credentials():
         return True
 
 def update_previous_articles_index(posted_article):
-    """Add posted article to previous_articles.json to prevent re-discovery"""
+    """Add posted article to the known-article index to prevent re-discovery"""
     try:
-        previous_file = 'social-media/previous_articles.json'
-        
-        # Load existing previous articles
-        if os.path.exists(previous_file):
-            with open(previous_file, 'r') as f:
-                previous_articles = json.load(f)
-        else:
-            previous_articles = []
-        
-        # Check if article already exists
-        exists = any(article['filename'] == posted_article['filename'] for article in previous_articles)
+        store = StateStore()
         
-        if not exists:
-            # Add posted article to previous articles index
-            previous_articles.append({
+        if posted_article['filename'] not in store.known_article_hashes():
+            store.upsert_known_articles([{
                 'filename': posted_article['filename'],
                 'title': posted_article['title'],
                 'description': posted_article.get('description', ''),
                 'url': posted_article['url'],
+                'content_hash': posted_article.get('content_hash', ''),
                 'discovered_date': datetime.now().isoformat()
-            })
-            
-            # Save updated previous articles
-            with open(previous_file, 'w') as f:
-                json.dump(previous_articles, f, indent=2)
+            }])
             
             print(f"✅ Added '{posted_article['title']}' to previous articles index")
         else:
@@ -271,35 +425,37 @@ def main():
         print("✅ No new articles found - no social media posts needed")
         return
     
-    # Process only 1 article per run (weekly posting)
-    articles_to_process = articles_data['new_articles'][:1]  # Limit to 1 article
-    
-    print(f"📋 Processing 1 article from {articles_data['new_articles_count']} available articles")
+    articles = articles_data['new_articles']
     
-    all_results = []
-    for article in articles_to_process:
-        result = post_to_all_platforms(article, dry_run=dry_run)
-        all_results.append(result)
+    if dry_run:
+        # Dry runs preview the posts without touching the durable queue
+        articles_to_process = articles[:max(1, POSTING_BUDGET // len(PLATFORMS))]
+        print(f"📋 Previewing {len(articles_to_process)} of {articles_data['new_articles_count']} available articles")
+        all_results = [post_to_all_platforms(article, dry_run=True) for article in articles_to_process]
+    else:
+        print(f"📋 Queueing {articles_data['new_articles_count']} available articles")
+        all_results = post_from_queue(articles)
+        
+        # Update previous articles index with every article posted somewhere
+        for result in all_results:
+            if any(post['success'] for post in result['posting_results']):
+                update_previous_articles_index(result['article'])
     
-    # Update previous articles index with posted article
-    if not dry_run and all_results:
-        posted_article = all_results[0]['article']  # We only post 1 article per run
-        update_previous_articles_index(posted_article)
+    if not all_results:
+        print("✅ No posting jobs due this run")
+        return
     
     # Save and display results
-    results_file = save_posting_results(all_results, dry_run=dry_run)
+    notification_data = save_posting_results(all_results, dry_run=dry_run)
     print_summary(all_results, dry_run=dry_run)
     
     # Send notification email
     try:
         from social_media_notifier import send_social_media_notification
         
-        # Load the results we just saved
-        with open(results_file, 'r') as f:
-            notification_data = json.load(f)
-        
         print(f"\n📧 Sending notification email...")
-        send_social_media_notification(notification_data)
+        # Sent on the dispatcher's background thread; flushed before the process exits
+        send_social_media_notification(notification_data, wait=False)
         
     except Exception as e:
         print(f"⚠️ Could not send notification email: {e}")
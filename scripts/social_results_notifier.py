@@ -5,24 +5,25 @@ Simple, accurate notification script that reads actual posting results
 """
 
 import os
-import json
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 
+from email_dispatcher import send_email
+from results_log import ResultsLog
+
 def load_social_media_results():
-    """Load social media results from environment variable"""
-    results_file = os.getenv('SOCIAL_MEDIA_RESULTS_FILE', '')
+    """Load the social media run named by the environment from the results log"""
+    run_id = os.getenv('SOCIAL_MEDIA_RESULTS_RUN', '')
     
-    if not results_file or not os.path.exists(results_file):
-        print(f"❌ No results file found: {results_file}")
+    if not run_id:
+        print("❌ No social media results run recorded")
         return None
     
     try:
-        with open(results_file, 'r') as f:
-            results = json.load(f)
-        print(f"✅ Loaded results from: {results_file}")
+        results = ResultsLog().get(run_id)
+        if not results:
+            print(f"❌ No results found for run: {run_id}")
+            return None
+        print(f"✅ Loaded results for run: {run_id}")
         return results
     except Exception as e:
         print(f"❌ Error loading results: {e}")
@@ -127,8 +128,6 @@ def send_notification(results):
     # Email config
     sender_email = os.getenv('SENDER_EMAIL', 'admin@dadassist.com.au')
     notification_email = os.getenv('NOTIFICATION_EMAIL')
-    email_password = os.getenv('EMAIL_PASSWORD')
-    ses_username = os.getenv('SES_USERNAME')
     
     if not notification_email:
         print("❌ No notification email configured")
@@ -150,27 +149,10 @@ def send_notification(results):
     else:
         subject = "🤖 DadAssist Social Media - Error"
     
-    msg = MIMEMultipart('alternative')
-    msg['Subject'] = subject
-    msg['From'] = sender_email
-    msg['To'] = notification_email
-    
-    html_part = MIMEText(html_content, 'html')
-    msg.attach(html_part)
-    
-    try:
-        server = smtplib.SMTP('email-smtp.ap-southeast-2.amazonaws.com', 587)
-        server.starttls()
-        server.login(ses_username, email_password)
-        server.send_message(msg)
-        server.quit()
-        
+    sent = send_email(subject, html_content, sender_email, notification_email)
+    if sent:
         print(f"✅ Notification sent to {notification_email}")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Failed to send notification: {e}")
-        return False
+    return sent
 
 def main():
     """Main function"""
@@ -0,0 +1,633 @@
+#!/usr/bin/env python3
+"""
+DadAssist State Store
+Single transactional SQLite store for pipeline state that used to live in
+separately rewritten JSON files:
+
+  processed_urls.json                         -> processed_videos
+  config/scraped_urls.json                    -> scraped_urls
+  config/article_metadata.json (+ .jsonl)     -> articles
+  social-media/previous_articles.json (+ known_articles.jsonl) -> known_articles
+  social-media/posted_articles_tracking.json  -> posts
+  social-media/posting_queue.json             -> post_jobs
+
+Every table is keyed, so updates are indexed upserts inside one transaction,
+and concurrent jobs serialise on SQLite's write lock instead of clobbering files.
+The JSON files remain the interchange format: `import` merges them into the
+store (the committed files win over an older local database) and `export`
+writes them back for the workflows that commit them.
+
+Article metadata is exported append-only: new or changed articles are added
+to config/article_metadata.jsonl, and the article_metadata.json snapshot is
+only rewritten when the log is compacted (`compact`, or automatically once it
+reaches METADATA_COMPACT_AFTER lines).
+
+downloads/latest_run.json is per-run scratch data, not persisted state:
+save_latest_run mirrors the latest scraping run to it, and workflow steps add
+their own fields, so import and export leave it alone.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+
+STATE_DB = os.getenv('DADASSIST_STATE_DB', os.path.expanduser('~/.local/share/dadassist/state.db'))
+
+PROCESSED_URLS_FILE = 'processed_urls.json'
+SCRAPED_URLS_FILE = 'config/scraped_urls.json'
+ARTICLE_METADATA_FILE = 'config/article_metadata.json'
+ARTICLE_METADATA_LOG = 'config/article_metadata.jsonl'
+PREVIOUS_ARTICLES_FILE = 'social-media/previous_articles.json'
+KNOWN_ARTICLES_LOG = 'social-media/known_articles.jsonl'
+TRACKING_FILE = 'social-media/posted_articles_tracking.json'
+LATEST_RUN_FILE = 'downloads/latest_run.json'
+POSTING_QUEUE_FILE = 'social-media/posting_queue.json'
+METADATA_COMPACT_AFTER = 50
+
+SCRAPED_URLS_DESCRIPTION = 'Tracks URLs that have been scraped to prevent duplicates'
+METADATA_DESCRIPTION = ('Tracks all generated DadAssist articles with source URLs and metadata. '
+                        'Starting from ID 99 to account for 98 existing articles with old naming scheme.')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS processed_videos (
+    url TEXT PRIMARY KEY,
+    processed_date TEXT,
+    youtube_video_id TEXT,
+    category TEXT
+);
+CREATE TABLE IF NOT EXISTS scraped_urls (
+    url TEXT PRIMARY KEY,
+    scraped_date TEXT
+);
+CREATE TABLE IF NOT EXISTS articles (
+    article_id INTEGER PRIMARY KEY,
+    filename TEXT NOT NULL,
+    source_url TEXT,
+    title TEXT,
+    generated_date TEXT,
+    live_url TEXT,
+    category TEXT
+);
+CREATE INDEX IF NOT EXISTS articles_filename ON articles (filename);
+CREATE INDEX IF NOT EXISTS articles_source_url ON articles (source_url);
+CREATE INDEX IF NOT EXISTS articles_category ON articles (category);
+CREATE TABLE IF NOT EXISTS known_articles (
+    filename TEXT PRIMARY KEY,
+    title TEXT,
+    description TEXT,
+    url TEXT,
+    content_hash TEXT,
+    discovered_date TEXT
+);
+CREATE TABLE IF NOT EXISTS posts (
+    filename TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    posted_date TEXT,
+    success INTEGER,
+    post_id TEXT,
+    url TEXT,
+    message TEXT,
+    error TEXT,
+    PRIMARY KEY (filename, platform)
+);
+CREATE INDEX IF NOT EXISTS posts_platform_success ON posts (platform, success);
+CREATE INDEX IF NOT EXISTS posts_success_date ON posts (success, posted_date);
+CREATE TABLE IF NOT EXISTS documents (
+    name TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated TEXT
+);
+CREATE TABLE IF NOT EXISTS post_jobs (
+    job_key TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    article TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created TEXT,
+    updated TEXT
+);
+CREATE INDEX IF NOT EXISTS post_jobs_due ON post_jobs (status, next_attempt_at);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+'''
+
+def load_json_lines(path):
+    """Records from a JSON lines file, skipping torn or corrupt lines"""
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+def post_job_key(filename, platform):
+    """Idempotency key: an article is posted to a platform at most once"""
+    return f'{filename}:{platform}'
+
+class StateStore:
+    def __init__(self, db_path=STATE_DB):
+        self.db_path = db_path
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        if db_path != ':memory:':
+            self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+        self._depth = 0
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    @contextmanager
+    def transaction(self):
+        """Run a block atomically; nested blocks join the outer transaction"""
+        if self._depth:
+            self._depth += 1
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+            return
+
+        # IMMEDIATE takes the write lock up front so concurrent writers queue instead of failing
+        self.conn.execute('BEGIN IMMEDIATE')
+        self._depth = 1
+        try:
+            yield self
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        finally:
+            self._depth = 0
+
+    # Processed videos (weekly video pipeline)
+
+    def add_processed_url(self, url, youtube_video_id, category, processed_date=None):
+        with self.transaction():
+            self.conn.execute(
+                'INSERT OR REPLACE INTO processed_videos VALUES (?, ?, ?, ?)',
+                (url, processed_date or datetime.now().isoformat(), youtube_video_id, category)
+            )
+
+    def processed_urls(self):
+        return {row['url'] for row in self.conn.execute('SELECT url FROM processed_videos')}
+
+    def count_processed(self):
+        return self.conn.execute('SELECT COUNT(*) FROM processed_videos').fetchone()[0]
+
+    # Scraped URL exclusion list
+
+    def add_scraped_urls(self, urls):
+        """Add URLs to the exclusion list, returning how many were new"""
+        scraped_date = datetime.now().isoformat()
+        with self.transaction():
+            before = self.conn.total_changes
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO scraped_urls VALUES (?, ?)',
+                [(url, scraped_date) for url in urls]
+            )
+            return self.conn.total_changes - before
+
+    def scraped_urls(self):
+        return {row['url'] for row in self.conn.execute('SELECT url FROM scraped_urls')}
+
+    # Generated article metadata
+
+    def next_article_id(self):
+        row = self.conn.execute('SELECT MAX(article_id) FROM articles').fetchone()
+        stored = self.get_setting('next_article_id')
+        candidates = [int(stored)] if stored else []
+        if row[0] is not None:
+            candidates.append(row[0] + 1)
+        return max(candidates) if candidates else 1
+
+    def add_article(self, filename, title, source_url, live_url, category='Legal Procedures',
+                    article_id=None, generated_date=None):
+        with self.transaction():
+            if article_id is None:
+                article_id = self.next_article_id()
+            self.conn.execute(
+                'INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (article_id, filename, source_url, title,
+                 generated_date or datetime.now().isoformat(), live_url, category)
+            )
+            self.set_setting('next_article_id', max(article_id + 1, self.next_article_id()))
+        return article_id
+
+    def get_article(self, article_id):
+        row = self.conn.execute('SELECT * FROM articles WHERE article_id = ?', (article_id,)).fetchone()
+        return dict(row) if row else None
+
+    def get_article_by_filename(self, filename):
+        row = self.conn.execute('SELECT * FROM articles WHERE filename = ?', (filename,)).fetchone()
+        return dict(row) if row else None
+
+    def get_article_by_source_url(self, source_url):
+        row = self.conn.execute('SELECT * FROM articles WHERE source_url = ?', (source_url,)).fetchone()
+        return dict(row) if row else None
+
+    def get_articles_by_category(self, category):
+        return [dict(row) for row in self.conn.execute(
+            'SELECT * FROM articles WHERE category = ? ORDER BY article_id', (category,)
+        )]
+
+    def articles(self):
+        return [dict(row) for row in self.conn.execute('SELECT * FROM articles ORDER BY article_id')]
+
+    # Known website articles (social media detection)
+
+    def known_article_hashes(self):
+        return {row['filename']: row['content_hash'] or ''
+                for row in self.conn.execute('SELECT filename, content_hash FROM known_articles')}
+
+    def upsert_known_articles(self, articles):
+        with self.transaction():
+            self.conn.executemany(
+                '''INSERT INTO known_articles VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(filename) DO UPDATE SET
+                       title = excluded.title,
+                       description = COALESCE(NULLIF(excluded.description, ''), known_articles.description),
+                       url = excluded.url,
+                       content_hash = COALESCE(NULLIF(excluded.content_hash, ''), known_articles.content_hash)''',
+                [(a['filename'], a.get('title', ''), a.get('description', ''), a.get('url', ''),
+                  a.get('content_hash', ''), a.get('discovered_date') or datetime.now().isoformat())
+                 for a in articles]
+            )
+
+    def known_articles(self):
+        return [dict(row) for row in self.conn.execute('SELECT * FROM known_articles ORDER BY rowid')]
+
+    # Social media posting status
+
+    def record_posts(self, posts):
+        """Upsert (filename, platform, details) tuples in one transaction"""
+        with self.transaction():
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [(filename, platform, details.get('posted_date'), int(bool(details.get('success'))),
+                  details.get('post_id', ''), details.get('url', ''), details.get('message', ''),
+                  details.get('error', ''))
+                 for filename, platform, details in posts]
+            )
+
+    def tracking_data(self):
+        """Posting status in the posted_articles_tracking.json shape"""
+        tracking = {}
+        for row in self.conn.execute('SELECT * FROM posts ORDER BY posted_date'):
+            entry = tracking.setdefault(row['filename'], {
+                'first_posted': row['posted_date'],
+                'platforms': {}
+            })
+            entry['platforms'][row['platform']] = {
+                'posted_date': row['posted_date'],
+                'success': bool(row['success']),
+                'post_id': row['post_id'],
+                'url': row['url'],
+                'message': row['message'],
+                'error': row['error']
+            }
+            entry['last_posted'] = row['posted_date']
+        return tracking
+
+    def post_counts(self):
+        """({platform: successes}, {platform: failures}) from an index-only GROUP BY"""
+        successes, failures = {}, {}
+        for row in self.conn.execute('SELECT platform, success, COUNT(*) AS n FROM posts GROUP BY platform, success'):
+            (successes if row['success'] else failures)[row['platform']] = row['n']
+        return successes, failures
+
+    def posted_article_count(self):
+        return self.conn.execute('SELECT COUNT(DISTINCT filename) FROM posts').fetchone()[0]
+
+    def successful_posts_since(self, since):
+        """Successful posts with posted_date after since (ISO string), newest first"""
+        return [dict(row) for row in self.conn.execute(
+            'SELECT filename, platform, posted_date, url FROM posts '
+            'WHERE success = 1 AND posted_date > ? ORDER BY posted_date DESC', (since,)
+        )]
+
+    def failed_posts(self):
+        return [dict(row) for row in self.conn.execute(
+            'SELECT filename, platform, error, posted_date AS attempted_date FROM posts '
+            'WHERE success = 0 ORDER BY posted_date'
+        )]
+
+    # Social media posting queue: one job per (article, platform)
+
+    def enqueue_post_jobs(self, articles, platforms):
+        """Add a job per article and platform; existing jobs (any status) are left alone"""
+        now = datetime.now().isoformat()
+        with self.transaction():
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO post_jobs VALUES (?, ?, ?, ?, 'pending', 0, 0, '', ?, ?)",
+                [(post_job_key(article['filename'], platform), article['filename'], platform,
+                  json.dumps(article), now, now)
+                 for article in articles for platform in platforms]
+            )
+            return self.conn.total_changes - before
+
+    def claim_post_jobs(self, limit, now_ts, stale_after=3600):
+        """Atomically move up to limit due jobs to running and return them"""
+        with self.transaction():
+            # A run that died mid-post leaves jobs running; release them after stale_after
+            self.conn.execute(
+                "UPDATE post_jobs SET status = 'pending' WHERE status = 'running' AND next_attempt_at < ?",
+                (now_ts - stale_after,)
+            )
+            rows = self.conn.execute(
+                "SELECT * FROM post_jobs WHERE status = 'pending' AND next_attempt_at <= ? "
+                "ORDER BY created, job_key LIMIT ?",
+                (now_ts, limit)
+            ).fetchall()
+            self.conn.executemany(
+                "UPDATE post_jobs SET status = 'running', next_attempt_at = ?, updated = ? WHERE job_key = ?",
+                [(now_ts, datetime.now().isoformat(), row['job_key']) for row in rows]
+            )
+        jobs = []
+        for row in rows:
+            job = dict(row)
+            job['article'] = json.loads(job['article'])
+            jobs.append(job)
+        return jobs
+
+    def finish_post_job(self, job_key, status, attempts, next_attempt_at=0, last_error=''):
+        with self.transaction():
+            self.conn.execute(
+                "UPDATE post_jobs SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?, updated = ? "
+                "WHERE job_key = ?",
+                (status, attempts, next_attempt_at, last_error, datetime.now().isoformat(), job_key)
+            )
+
+    def post_succeeded(self, filename, platform):
+        row = self.conn.execute(
+            'SELECT success FROM posts WHERE filename = ? AND platform = ?', (filename, platform)
+        ).fetchone()
+        return bool(row and row['success'])
+
+    def post_job_counts(self):
+        return {row['status']: row['n'] for row in
+                self.conn.execute('SELECT status, COUNT(*) AS n FROM post_jobs GROUP BY status')}
+
+    def post_jobs(self):
+        jobs = []
+        for row in self.conn.execute('SELECT * FROM post_jobs ORDER BY created, job_key'):
+            job = dict(row)
+            job['article'] = json.loads(job['article'])
+            jobs.append(job)
+        return jobs
+
+    # Small JSON documents (e.g. latest scraping run)
+
+    def put_document(self, name, data):
+        with self.transaction():
+            self.conn.execute(
+                'INSERT OR REPLACE INTO documents VALUES (?, ?, ?)',
+                (name, json.dumps(data), datetime.now().isoformat())
+            )
+
+    def get_document(self, name):
+        row = self.conn.execute('SELECT data FROM documents WHERE name = ?', (name,)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def save_latest_run(self, run_info):
+        """Store the latest scraping run and mirror it to the JSON file workflow steps read"""
+        self.put_document('latest_run', run_info)
+        os.makedirs(os.path.dirname(LATEST_RUN_FILE), exist_ok=True)
+        with open(LATEST_RUN_FILE, 'w') as f:
+            json.dump(run_info, f, indent=2)
+
+    def latest_run(self):
+        return self.get_document('latest_run')
+
+    def get_setting(self, key):
+        row = self.conn.execute('SELECT value FROM settings WHERE key = ?', (key,)).fetchone()
+        return row['value'] if row else None
+
+    def set_setting(self, key, value):
+        self.conn.execute('INSERT OR REPLACE INTO settings VALUES (?, ?)', (key, str(value)))
+
+    # JSON compatibility
+
+    def import_json(self, root='.'):
+        """Merge the legacy JSON state files under root into the store"""
+        def path(name):
+            return os.path.join(root, name)
+
+        def load(name, default):
+            if not os.path.exists(path(name)):
+                return default
+            with open(path(name), 'r') as f:
+                return json.load(f)
+
+        def load_lines(name):
+            return load_json_lines(path(name))
+
+        with self.transaction():
+            for item in load(PROCESSED_URLS_FILE, []):
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO processed_videos VALUES (?, ?, ?, ?)',
+                    (item['url'], item.get('processed_date'), item.get('youtube_video_id'), item.get('category'))
+                )
+
+            self.add_scraped_urls(load(SCRAPED_URLS_FILE, {}).get('scraped_urls', []))
+
+            metadata = load(ARTICLE_METADATA_FILE, {})
+            for article in metadata.get('articles', []) + load_lines(ARTICLE_METADATA_LOG):
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (article['article_id'], article['filename'], article.get('source_url'),
+                     article.get('title'), article.get('generated_date'),
+                     article.get('live_url'), article.get('category'))
+                )
+            if metadata.get('next_article_id'):
+                self.set_setting('next_article_id', max(metadata['next_article_id'], self.next_article_id()))
+
+            self.upsert_known_articles(load(PREVIOUS_ARTICLES_FILE, []) + load_lines(KNOWN_ARTICLES_LOG))
+
+            # Upserts, so a database that persists between runs (the self-hosted runner)
+            # picks up newer committed state instead of keeping its stale rows
+            self.conn.executemany(
+                '''INSERT INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(filename, platform) DO UPDATE SET
+                       posted_date = excluded.posted_date, success = excluded.success,
+                       post_id = excluded.post_id, url = excluded.url,
+                       message = excluded.message, error = excluded.error
+                   WHERE COALESCE(excluded.posted_date, '') >= COALESCE(posts.posted_date, '')''',
+                [(filename, platform, details.get('posted_date'), int(bool(details.get('success'))),
+                  details.get('post_id', ''), details.get('url', ''), details.get('message', ''),
+                  details.get('error', ''))
+                 for filename, data in load(TRACKING_FILE, {}).items()
+                 for platform, details in data.get('platforms', {}).items()]
+            )
+
+            self.conn.executemany(
+                '''INSERT INTO post_jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(job_key) DO UPDATE SET
+                       article = excluded.article, status = excluded.status,
+                       attempts = excluded.attempts, next_attempt_at = excluded.next_attempt_at,
+                       last_error = excluded.last_error, updated = excluded.updated
+                   WHERE COALESCE(excluded.updated, '') >= COALESCE(post_jobs.updated, '')''',
+                [(job['job_key'], job['filename'], job['platform'], json.dumps(job['article']),
+                  job['status'], job['attempts'], job['next_attempt_at'], job.get('last_error', ''),
+                  job.get('created'), job.get('updated'))
+                 for job in load(POSTING_QUEUE_FILE, [])]
+            )
+
+        print(f"📥 Imported JSON state into {self.db_path}")
+
+    def export_json(self, root='.', compact=False):
+        """
+        Write the store back out in the legacy JSON shapes.
+
+        Articles are appended to the metadata log rather than rewriting the
+        snapshot; compact=True (or a long log) folds the log into the snapshot.
+        """
+        def unchanged(target, data):
+            # Skip rewriting files whose content only differs by timestamp, keeping the checkout clean
+            if not os.path.exists(target):
+                return False
+            try:
+                with open(target, 'r') as f:
+                    existing = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                return False
+            if isinstance(existing, dict) and isinstance(data, dict):
+                existing = {k: v for k, v in existing.items() if k != 'last_updated'}
+                data = {k: v for k, v in data.items() if k != 'last_updated'}
+            return existing == data
+
+        def write(name, data):
+            target = os.path.join(root, name)
+            if unchanged(target, data):
+                return
+            os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+            temp_file = target + '.tmp'
+            with open(temp_file, 'w') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_file, target)
+
+        def truncate(name):
+            # Logs are folded into the snapshots above; keep the file so git sees the change
+            target = os.path.join(root, name)
+            if os.path.exists(target) and os.path.getsize(target):
+                open(target, 'w').close()
+
+        now = datetime.now().isoformat()
+
+        write(PROCESSED_URLS_FILE, [
+            dict(row) for row in self.conn.execute('SELECT * FROM processed_videos ORDER BY rowid')
+        ])
+
+        scraped = [row['url'] for row in self.conn.execute('SELECT url FROM scraped_urls ORDER BY rowid')]
+        write(SCRAPED_URLS_FILE, {
+            'scraped_urls': scraped,
+            'last_updated': now,
+            'total_scraped': len(scraped),
+            'description': SCRAPED_URLS_DESCRIPTION
+        })
+
+        self._export_articles(root, compact, write, truncate, now)
+
+        write(PREVIOUS_ARTICLES_FILE, [
+            {k: v for k, v in article.items() if v or k != 'content_hash'}
+            for article in self.known_articles()
+        ])
+        truncate(KNOWN_ARTICLES_LOG)
+
+        tracking = self.tracking_data()
+        if tracking:
+            write(TRACKING_FILE, tracking)
+
+        write(POSTING_QUEUE_FILE, self.post_jobs())
+
+        print(f"📤 Exported state from {self.db_path} to JSON")
+
+    def _export_articles(self, root, compact, write, truncate, now):
+        """Append new or changed articles to the metadata log, compacting when due"""
+        snapshot_path = os.path.join(root, ARTICLE_METADATA_FILE)
+        log_path = os.path.join(root, ARTICLE_METADATA_LOG)
+
+        exported = {}
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, 'r') as f:
+                snapshot = json.load(f)
+            exported = {a['article_id']: a for a in snapshot.get('articles', [])}
+        log = load_json_lines(log_path)
+        for article in log:
+            exported[article['article_id']] = article
+
+        articles = self.articles()
+        pending = [a for a in articles if exported.get(a['article_id']) != a]
+
+        if compact or not os.path.exists(snapshot_path) or len(log) + len(pending) >= METADATA_COMPACT_AFTER:
+            write(ARTICLE_METADATA_FILE, {
+                'articles': articles,
+                'next_article_id': self.next_article_id(),
+                'last_updated': now,
+                'description': METADATA_DESCRIPTION
+            })
+            truncate(ARTICLE_METADATA_LOG)
+            print(f"🗜️ Compacted {len(articles)} articles into {ARTICLE_METADATA_FILE}")
+            return
+
+        if pending:
+            with open(log_path, 'a') as f:
+                for article in pending:
+                    f.write(json.dumps(article, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            print(f"📝 Appended {len(pending)} articles to {ARTICLE_METADATA_LOG}")
+
+def main():
+    """Command line access for workflows"""
+    commands = ['import', 'export', 'compact', 'next-article-id', 'has-source-url <url>',
+                'get-article <id>', 'articles-in-category <category>']
+    if len(sys.argv) < 2:
+        print(f"Usage: state_store.py <{'|'.join(commands)}>")
+        sys.exit(1)
+
+    command = sys.argv[1]
+    with StateStore() as store:
+        if command == 'import':
+            store.import_json()
+        elif command == 'export':
+            store.export_json()
+        elif command == 'compact':
+            store.export_json(compact=True)
+        elif command == 'next-article-id':
+            print(store.next_article_id())
+        elif command == 'has-source-url':
+            print('true' if store.get_article_by_source_url(sys.argv[2]) else 'false')
+        elif command == 'get-article':
+            article = store.get_article(int(sys.argv[2]))
+            print(json.dumps(article, indent=2) if article else '')
+        elif command == 'articles-in-category':
+            print(json.dumps(store.get_articles_by_category(sys.argv[2]), indent=2))
+        else:
+            print(f"❌ Unknown command: {command}")
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -3,36 +3,16 @@
 Update article metadata after generation
 """
 
-import json
 import sys
-from datetime import datetime
+
+from state_store import StateStore
 
 def update_metadata(filename, title, source_url, article_url, category='Legal Procedures'):
     """Add new article to metadata"""
     
-    # Load metadata
-    with open('config/article_metadata.json', 'r') as f:
-        metadata = json.load(f)
-    
-    # Add new article
-    article_id = metadata['next_article_id']
-    metadata['articles'].append({
-        'article_id': article_id,
-        'filename': filename,
-        'title': title,
-        'source_url': source_url,
-        'generated_date': datetime.now().isoformat(),
-        'live_url': article_url,
-        'category': category
-    })
-    
-    # Increment counter
-    metadata['next_article_id'] = article_id + 1
-    metadata['last_updated'] = datetime.now().isoformat()
-    
-    # Save
-    with open('config/article_metadata.json', 'w') as f:
-        json.dump(metadata, f, indent=2)
+    # Indexed insert into the state store; exported to article_metadata.json before commit
+    store = StateStore()
+    article_id = store.add_article(filename, title, source_url, article_url, category)
     
     print(f'✅ Added article {article_id} to metadata')
     return article_id
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Resume state for streaming video uploads.
+
+One small JSON file per (platform, S3 URL) in DADASSIST_CACHE_DIR records the
+upload session and the last offset the platform confirmed, so a retried
+workflow continues an interrupted upload instead of sending the file again.
+"""
+
+import os
+import json
+import hashlib
+
+CACHE_DIR = os.getenv('DADASSIST_CACHE_DIR', os.path.expanduser('~/.cache/dadassist'))
+
+def upload_state_path(platform, s3_url):
+    key = hashlib.sha256(s3_url.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f'{platform}_upload_{key}.json')
+
+def load_upload_state(platform, s3_url):
+    """Saved state for this upload, or None"""
+    path = upload_state_path(platform, s3_url)
+    if os.path.exists(path):
+        try:
+            with open(path, 'r') as f:
+                state = json.load(f)
+            if state.get('s3_url') == s3_url:
+                return state
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable {platform} upload state: {e}")
+    return None
+
+def save_upload_state(platform, state):
+    path = upload_state_path(platform, state['s3_url'])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_file = path + '.tmp'
+    with open(temp_file, 'w') as f:
+        json.dump(state, f)
+    os.replace(temp_file, path)
+
+def clear_upload_state(platform, s3_url):
+    path = upload_state_path(platform, s3_url)
+    if os.path.exists(path):
+        os.remove(path)
@@ -1,16 +1,78 @@
 #!/usr/bin/env python3
-"""Upload video to YouTube."""
+"""Upload video to YouTube.
+
+The video is streamed from S3 in ranged chunks into a chunked resumable
+upload; the resumable session URI and confirmed offset are saved after every
+chunk so a retried workflow continues where the last one stopped.
+"""
 
 import os
 import sys
-import json
-from datetime import datetime
+import time
+import requests
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaUpload
+
+from state_store import StateStore
+from upload_state import load_upload_state, save_upload_state, clear_upload_state
+
+# Resumable chunks must be a multiple of 256 KB
+UPLOAD_CHUNK_SIZE = int(os.environ.get('YOUTUBE_UPLOAD_CHUNK_MB', '16')) * 1024 * 1024
+RANGE_RETRIES = 3
+# Overridable so uploads can be exercised against a local mock API
+YOUTUBE_API_URL = os.environ.get('YOUTUBE_API_URL')
+YOUTUBE_TOKEN_URI = os.environ.get('YOUTUBE_TOKEN_URI', 'https://oauth2.googleapis.com/token')
+
+class S3RangeUpload(MediaUpload):
+    """Media source that serves each upload chunk with a ranged GET against S3"""
+
+    def __init__(self, s3_url, mimetype='video/mp4', chunksize=UPLOAD_CHUNK_SIZE):
+        super().__init__()
+        self._s3_url = s3_url
+        self._mimetype = mimetype
+        self._chunksize = chunksize
+        self._session = requests.Session()
+        response = self._session.head(s3_url, timeout=30)
+        response.raise_for_status()
+        self._size = int(response.headers['Content-Length'])
+
+    def chunksize(self):
+        return self._chunksize
+
+    def mimetype(self):
+        return self._mimetype
+
+    def size(self):
+        return self._size
+
+    def resumable(self):
+        return True
+
+    def has_stream(self):
+        return False
+
+    def getbytes(self, begin, length):
+        end = min(begin + length, self._size) - 1
+        if end < begin:
+            return b''
+        for attempt in range(1, RANGE_RETRIES + 1):
+            try:
+                response = self._session.get(self._s3_url, headers={'Range': f'bytes={begin}-{end}'}, timeout=300)
+                response.raise_for_status()
+                data = response.content
+                if len(data) != end - begin + 1:
+                    raise IOError(f"S3 returned {len(data)} bytes for range {begin}-{end}")
+                return data
+            except (requests.RequestException, IOError) as e:
+                if attempt == RANGE_RETRIES:
+                    raise
+                print(f"⚠️ S3 range {begin}-{end} failed ({e}), retrying ({attempt}/{RANGE_RETRIES})")
+                time.sleep(2 ** attempt)
 
-def get_youtube_client():
-    """Create YouTube API client from environment variables."""
+def get_credentials():
+    """Create YouTube OAuth credentials from environment variables."""
     client_id = os.environ.get('YOUTUBE_CLIENT_ID')
     client_secret = os.environ.get('YOUTUBE_CLIENT_SECRET')
     refresh_token = os.environ.get('YOUTUBE_REFRESH_TOKEN')
@@ -19,23 +81,39 @@ def get_youtube_client():
         print("❌ Missing YouTube credentials in environment variables")
         sys.exit(1)
     
-    credentials = Credentials(
+    return Credentials(
         None,
         refresh_token=refresh_token,
-        token_uri="https://oauth2.googleapis.com/token",
+        token_uri=YOUTUBE_TOKEN_URI,
         client_id=client_id,
         client_secret=client_secret
     )
-    
-    return build('youtube', 'v3', credentials=credentials)
 
-def upload_to_youtube(s3_url, title, category):
-    """Upload video to YouTube using S3 URL."""
+def query_upload_offset(credentials, resumable_uri, size):
+    """
+    Ask YouTube how much of an interrupted upload it has.
+
+    Returns (offset, None) to continue, (None, response) if the upload had
+    already completed, or (None, None) if the session is gone.
+    """
+    session = AuthorizedSession(credentials)
+    response = session.put(resumable_uri, headers={'Content-Range': f'bytes */{size}', 'Content-Length': '0'}, timeout=60)
+    if response.status_code in (200, 201):
+        return None, response.json()
+    if response.status_code == 308:
+        received = response.headers.get('Range')
+        return (int(received.rsplit('-', 1)[1]) + 1 if received else 0), None
+    return None, None
+
+def upload_to_youtube(s3_url, title, category, local_path=None):
+    """Upload video to YouTube, from a cached local copy if given, otherwise streamed from the S3 URL."""
     print(f"📺 Preparing YouTube upload")
     print(f"📄 Title: {title}")
     print(f"🏷️  Category: {category}")
     
-    youtube = get_youtube_client()
+    credentials = get_credentials()
+    client_options = {'api_endpoint': YOUTUBE_API_URL} if YOUTUBE_API_URL else None
+    youtube = build('youtube', 'v3', credentials=credentials, client_options=client_options)
     
     # Generate description
     description = f"""Learn about {title.lower()} for Australian fathers.
@@ -64,29 +142,43 @@ Category: {category}
         }
     }
     
-    # Download video from S3 temporarily
-    print(f"⬇️  Downloading video from S3...")
-    import requests
-    response = requests.get(s3_url, stream=True, timeout=300)
-    response.raise_for_status()
-    
-    temp_file = '/tmp/video.mp4'
-    with open(temp_file, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
-    
-    print(f"📤 Uploading to YouTube...")
-    
-    # Upload video
-    media = MediaFileUpload(temp_file, chunksize=-1, resumable=True, mimetype='video/mp4')
-    
+    if local_path:
+        print(f"📤 Uploading cached video to YouTube...")
+        media = MediaFileUpload(local_path, chunksize=UPLOAD_CHUNK_SIZE, resumable=True, mimetype='video/mp4')
+    else:
+        print(f"📤 Streaming video from S3 to YouTube...")
+        media = S3RangeUpload(s3_url)
     request = youtube.videos().insert(
         part='snippet,status',
         body=body,
         media_body=media
     )
     
-    response = request.execute()
+    response = None
+    state = load_upload_state('youtube', s3_url)
+    if state and state.get('size') == media.size():
+        offset, response = query_upload_offset(credentials, state['resumable_uri'], media.size())
+        if response:
+            print(f"🔁 Previous upload had already completed")
+        elif offset is not None:
+            print(f"🔁 Resuming upload at byte {offset} of {media.size()}")
+            request.resumable_uri = state['resumable_uri']
+            request.resumable_progress = offset
+        else:
+            print(f"⚠️ Previous upload session expired - starting over")
+    
+    while response is None:
+        status, response = request.next_chunk(num_retries=3)
+        if status:
+            save_upload_state('youtube', {
+                's3_url': s3_url,
+                'size': media.size(),
+                'resumable_uri': request.resumable_uri,
+                'offset': status.resumable_progress
+            })
+            print(f"   ⬆️  {status.progress() * 100:.0f}% uploaded")
+    
+    clear_upload_state('youtube', s3_url)
     
     video_id = response['id']
     video_url = f"https://www.youtube.com/watch?v={video_id}"
@@ -99,34 +191,16 @@ Category: {category}
     with open('youtube_id.txt', 'w') as f:
         f.write(video_id)
     
-    # Clean up temp file
-    os.remove(temp_file)
-    
     return video_id, video_url
 
 def update_processed_urls(article_url, youtube_id, category):
-    """Update processed_urls.json with new entry."""
-    print(f"💾 Updating processed_urls.json")
+    """Record the processed article in the state store."""
+    print(f"💾 Updating processed URLs")
     
-    try:
-        with open('processed_urls.json', 'r') as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        data = []
-    
-    # Add new entry
-    data.append({
-        'url': article_url,
-        'processed_date': datetime.now().isoformat(),
-        'youtube_video_id': youtube_id,
-        'category': category
-    })
-    
-    # Save back
-    with open('processed_urls.json', 'w') as f:
-        json.dump(data, f, indent=2)
-    
-    print(f"✅ Updated processed_urls.json ({len(data)} total videos)")
+    store = StateStore()
+    store.add_processed_url(article_url, youtube_id, category)
+    
+    print(f"✅ Updated processed URLs ({store.count_processed()} total videos)")
 
 if __name__ == "__main__":
     # Read inputs
@@ -2,11 +2,11 @@
 """Video workflow notification script"""
 
 import os
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 
+import email_dispatcher
+import notification_digest
+
 def create_email_content():
     """Create email content from workflow results"""
     
@@ -101,37 +101,39 @@ def create_email_content():
     
     return html
 
+def spool_video_run(status, subject):
+    """Add this run to the notification digest instead of emailing it"""
+    article_url = os.getenv('ARTICLE_URL', '')
+    youtube_url = os.getenv('YOUTUBE_URL', '')
+    facebook_url = os.getenv('FACEBOOK_URL', '')
+    items = [
+        ('Video Title', os.getenv('VIDEO_TITLE') or 'N/A', ''),
+        ('Category', os.getenv('VIDEO_CATEGORY') or 'N/A', ''),
+        ('Article', article_url or 'N/A', article_url),
+        ('YouTube', youtube_url or 'N/A', youtube_url),
+        ('Facebook', facebook_url or 'N/A', facebook_url)
+    ]
+    notification_digest.spool('video', 'success' if status == 'success' else 'failed', subject, items)
+
 def send_email():
     """Send notification email via SES"""
     
     sender = os.getenv('SENDER_EMAIL')
     recipient = os.getenv('NOTIFICATION_EMAIL')
-    ses_username = os.getenv('SES_USERNAME')
-    ses_password = os.getenv('EMAIL_PASSWORD')
     status = os.getenv('WORKFLOW_STATUS', 'unknown')
+    subject = f"{'✅' if status == 'success' else '❌'} DadAssist Weekly Video - {status.upper()}"
     
-    if not all([sender, recipient, ses_username, ses_password]):
-        print("❌ Missing email credentials")
+    if notification_digest.DIGEST_ENABLED:
+        spool_video_run(status, subject)
         return
     
-    subject = f"{'✅' if status == 'success' else '❌'} DadAssist Weekly Video - {status.upper()}"
-    
-    msg = MIMEMultipart('alternative')
-    msg['Subject'] = subject
-    msg['From'] = sender
-    msg['To'] = recipient
+    if not all([sender, recipient]):
+        print("❌ Missing email credentials")
+        return
     
     html_content = create_email_content()
-    msg.attach(MIMEText(html_content, 'html'))
-    
-    try:
-        with smtplib.SMTP('email-smtp.ap-southeast-2.amazonaws.com', 587) as server:
-            server.starttls()
-            server.login(ses_username, ses_password)
-            server.send_message(msg)
+    if email_dispatcher.send_email(subject, html_content, sender, recipient):
         print(f"✅ Email sent to {recipient}")
-    except Exception as e:
-        print(f"❌ Failed to send email: {e}")
 
 if __name__ == '__main__':
     send_email()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark new-article detection as the catalog grows.
+Compares the old list-based membership scan with the hashed known-article index.
+"""
+
+import sys
+import time
+import hashlib
+sys.path.insert(0, 'scripts')
+
+from detect_new_articles import diff_articles
+
+SIZES = [100, 1000, 5000, 10000]
+NEW_PER_RUN = 5
+
+def make_catalog(size):
+    return [{
+        'filename': f'dadassist-article-{i:05d}.html',
+        'title': f'Article {i}',
+        'url': f'https://dadassist.com.au/posts/articles/dadassist-article-{i:05d}.html',
+        'content_hash': hashlib.sha256(str(i).encode()).hexdigest()
+    } for i in range(size)]
+
+def list_based(current_articles, previous_articles):
+    """Detection as originally implemented: list membership per article"""
+    previous_filenames = [article['filename'] for article in previous_articles]
+    return [a for a in current_articles if a['filename'] not in previous_filenames]
+
+def index_based(current_articles, known):
+    return diff_articles(current_articles, known)[0]
+
+def time_it(func, *args, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+print("🧪 Benchmarking article detection")
+print("=" * 72)
+print(f"{'Articles':>10} {'List total':>14} {'Index total':>14} {'List/article':>15} {'Index/article':>15}")
+print("=" * 72)
+
+for size in SIZES:
+    current = make_catalog(size)
+    previous = current[:-NEW_PER_RUN]
+    known = {a['filename']: a['content_hash'] for a in previous}
+
+    assert list_based(current, previous) == index_based(current, known)
+
+    list_time = time_it(list_based, current, previous)
+    index_time = time_it(index_based, current, known)
+
+    print(f"{size:>10} {list_time * 1000:>12.2f}ms {index_time * 1000:>12.2f}ms "
+          f"{list_time / size * 1e6:>13.2f}µs {index_time / size * 1e6:>13.2f}µs")
+
+print("=" * 72)
+print("Index lookups stay constant per article; the list scan grows with the catalog.")
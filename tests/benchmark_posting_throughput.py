@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark the real posting and video upload paths against local mock APIs.
+
+Dry-run mode returns before any HTTP, so this runs the live code paths
+(authentication, rate-limit tracking, Instagram container polling, the
+resumable video uploads) against tests/mock_platform_servers.py with
+configurable latency, error rate and rate limits.
+
+Usage: python tests/benchmark_posting_throughput.py [--articles 30] [--latency 0.05]
+"""
+
+import io
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(__file__))
+from mock_platform_servers import MockPlatforms, PlatformConfig
+
+parser = argparse.ArgumentParser(description='Benchmark posting throughput against mock platform APIs')
+parser.add_argument('--articles', type=int, default=30, help='Articles to post per scenario')
+parser.add_argument('--latency', type=float, default=0.05, help='Mock API latency per request (seconds)')
+parser.add_argument('--concurrency', type=int, default=1, help='Articles posted at once')
+parser.add_argument('--video-mb', type=int, default=8, help='Size of the mock video (MB)')
+args = parser.parse_args()
+
+work_dir = tempfile.mkdtemp(prefix='dadassist-bench-')
+os.environ['DADASSIST_CACHE_DIR'] = os.path.join(work_dir, 'cache')
+os.environ['DADASSIST_STATE_DB'] = os.path.join(work_dir, 'state.db')
+
+# Module-level URLs are read at import, so the mock has to be up before the scripts load
+mock = MockPlatforms().start()
+mock.configure_environment()
+
+repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(repo, 'scripts'))
+sys.path.insert(0, os.path.join(repo, 'scripts', 'platforms'))
+os.chdir(work_dir)
+
+import rate_limits
+import instagram_poster
+import social_media_poster
+import post_facebook_video
+import artifact_cache
+
+instagram_poster.POLL_INITIAL_DELAY = 0.05
+instagram_poster.POLL_MAX_DELAY = 0.2
+
+def make_article(i):
+    return {
+        'title': f'Benchmark Article {i}: Parenting Orders Explained',
+        'filename': f'benchmark-article-{i:04d}.html',
+        'url': f'https://dadassist.com.au/posts/articles/benchmark-article-{i:04d}.html',
+        'description': 'Expert legal guidance for Australian fathers.'
+    }
+
+def reset_state(config):
+    """Fresh mock counters and rate-limit state for a scenario"""
+    mock.config.update(config)
+    with mock.lock:
+        mock.calls = {name: 0 for name in mock.config}
+        mock.errors = {name: 0 for name in mock.config}
+        mock.rate_limited = {name: 0 for name in mock.config}
+    rate_limits._tracker = None
+    if os.path.exists(rate_limits.RATE_LIMITS_FILE):
+        os.remove(rate_limits.RATE_LIMITS_FILE)
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def post_article(article):
+    start = time.perf_counter()
+    result = social_media_poster.post_to_all_platforms(article, dry_run=False)
+    return time.perf_counter() - start, result['posting_results']
+
+def run_scenario(name, config):
+    reset_state(config)
+    articles = [make_article(i) for i in range(args.articles)]
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            outcomes = list(executor.map(post_article, articles))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for latency, _ in outcomes]
+    counts = {}
+    for _, results in outcomes:
+        for result in results:
+            outcome = 'ok' if result['success'] else ('deferred' if result.get('deferred') or result.get('rate_limited') else 'failed')
+            counts.setdefault(result['platform'], {'ok': 0, 'failed': 0, 'deferred': 0})[outcome] += 1
+
+    print(f"\n📊 {name}")
+    print(f"   {len(articles)} articles in {elapsed:.2f}s ({len(articles) / elapsed:.1f} articles/s, "
+          f"{len(articles) * 3 / elapsed:.1f} posts/s)")
+    print(f"   Per article: p50 {percentile(latencies, 50) * 1000:.0f}ms, p95 {percentile(latencies, 95) * 1000:.0f}ms")
+    for platform, platform_counts in counts.items():
+        print(f"   {platform:>10}: {platform_counts['ok']:>4} ok {platform_counts['failed']:>4} failed {platform_counts['deferred']:>4} deferred")
+    print(f"   Mock API calls: {mock.stats()}")
+
+def benchmark_facebook_video():
+    reset_state({'graph': PlatformConfig(latency=args.latency), 's3': PlatformConfig(latency=args.latency)})
+    video = os.urandom(args.video_mb * 1024 * 1024)
+    s3_url = mock.add_object('weekly.mp4', video)
+
+    print(f"\n🎬 Facebook video upload ({args.video_mb} MB, resumable 1 MB chunks)")
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        post_facebook_video.post_video_to_facebook(s3_url, 'Benchmark', 'Benchmark video')
+        streamed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        local_path = artifact_cache.fetch(s3_url)
+        fetched = time.perf_counter() - start
+
+        start = time.perf_counter()
+        post_facebook_video.post_video_to_facebook(s3_url, 'Benchmark', 'Benchmark video', local_path)
+        cached = time.perf_counter() - start
+
+    uploaded = [bytes(u['data']) for u in mock.uploads.values() if u['size'] == len(video)]
+    assert len(uploaded) == 2 and all(data == video for data in uploaded), "uploaded bytes do not match the video"
+    print(f"   Streamed from S3: {streamed:.2f}s ({args.video_mb / streamed:.1f} MB/s)")
+    print(f"   Artifact fetch:   {fetched:.2f}s, then upload from cache: {cached:.2f}s ({args.video_mb / cached:.1f} MB/s)")
+
+def benchmark_youtube_video():
+    try:
+        import upload_youtube
+    except ImportError as e:
+        print(f"\n⏭️  Skipping YouTube upload benchmark ({e})")
+        return
+
+    reset_state({'youtube': PlatformConfig(latency=args.latency), 's3': PlatformConfig(latency=args.latency)})
+    upload_youtube.UPLOAD_CHUNK_SIZE = 1024 * 1024
+    video = os.urandom(args.video_mb * 1024 * 1024)
+    s3_url = mock.add_object('weekly-youtube.mp4', video)
+
+    print(f"\n📺 YouTube resumable upload ({args.video_mb} MB, 1 MB chunks)")
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        upload_youtube.upload_to_youtube(s3_url, 'Benchmark', 'Benchmark')
+        elapsed = time.perf_counter() - start
+    print(f"   Streamed from S3: {elapsed:.2f}s ({args.video_mb / elapsed:.1f} MB/s)")
+
+print("🧪 Posting throughput against mock platform APIs")
+print(f"   latency {args.latency * 1000:.0f}ms, {args.concurrency} article(s) at a time")
+print("=" * 72)
+
+run_scenario('Healthy APIs', {
+    'twitter': PlatformConfig(latency=args.latency),
+    'graph': PlatformConfig(latency=args.latency)
+})
+run_scenario('10% error rate', {
+    'twitter': PlatformConfig(latency=args.latency, error_rate=0.1),
+    'graph': PlatformConfig(latency=args.latency, error_rate=0.1)
+})
+run_scenario('Twitter quota of half the articles', {
+    'twitter': PlatformConfig(latency=args.latency, rate_limit=args.articles // 2),
+    'graph': PlatformConfig(latency=args.latency)
+})
+
+benchmark_facebook_video()
+benchmark_youtube_video()
+
+mock.stop()
+os.chdir(repo)
+shutil.rmtree(work_dir)
+print("\n" + "=" * 72)
+print("✅ Benchmark complete")
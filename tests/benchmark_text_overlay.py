@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Instagram title overlay on 1024x1024 images.
+Compares the old 7x7 offset-grid outline (49 text draws per line) with the
+single-pass stroked text now used by add_text_overlay.
+"""
+
+import sys
+import time
+import random
+import textwrap
+from io import BytesIO
+sys.path.insert(0, 'scripts')
+
+from PIL import Image, ImageChops, ImageDraw, ImageStat
+
+from generate_instagram_image import OUTLINE_WIDTH, add_text_overlay
+
+SIZE = 1024
+REPEAT = 5
+TITLES = [
+    'Property Settlement Guide',
+    'Understanding Parenting Orders in Australian Family Courts',
+    'Child Support Changes Every Separated Father Should Know About This Year'
+]
+
+def make_image():
+    """A noisy 1024x1024 JPEG, like the Nova Canvas output the overlay is applied to"""
+    random.seed(1)
+    image = Image.frombytes('RGB', (SIZE, SIZE), random.randbytes(SIZE * SIZE * 3))
+    output = BytesIO()
+    image.save(output, format='JPEG', quality=95)
+    return output.getvalue()
+
+def grid_overlay(image_data, article_title):
+    """add_text_overlay with the original outline: each line redrawn at every offset in a square grid"""
+    original_text = ImageDraw.ImageDraw.text
+
+    def text(self, xy, line, font=None, fill=None, stroke_width=0, stroke_fill=None, **kwargs):
+        for dx in range(-stroke_width, stroke_width + 1):
+            for dy in range(-stroke_width, stroke_width + 1):
+                if dx != 0 or dy != 0:
+                    original_text(self, (xy[0] + dx, xy[1] + dy), line, font=font, fill=stroke_fill, **kwargs)
+        original_text(self, xy, line, font=font, fill=fill, **kwargs)
+
+    ImageDraw.ImageDraw.text = text
+    try:
+        return add_text_overlay(image_data, article_title)
+    finally:
+        ImageDraw.ImageDraw.text = original_text
+
+def time_it(func, *args):
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def difference(a, b):
+    """Mean absolute pixel difference (0-255) between two rendered images"""
+    diff = ImageChops.difference(Image.open(BytesIO(a)), Image.open(BytesIO(b)))
+    return sum(ImageStat.Stat(diff).mean) / 3
+
+image_data = make_image()
+
+print(f"🧪 Benchmarking title overlay on {SIZE}x{SIZE} images (outline width {OUTLINE_WIDTH})")
+print("=" * 78)
+print(f"{'Title length':>13} {'Lines':>6} {'Offset grid':>13} {'Stroke':>11} {'Speed-up':>10} {'Pixel diff':>12}")
+print("=" * 78)
+
+for title in TITLES:
+    lines = len(textwrap.wrap(title, width=15))
+    grid_time = time_it(grid_overlay, image_data, title)
+    stroke_time = time_it(add_text_overlay, image_data, title)
+    diff = difference(grid_overlay(image_data, title), add_text_overlay(image_data, title))
+    print(f"{len(title):>13} {lines:>6} {grid_time * 1000:>11.1f}ms {stroke_time * 1000:>9.1f}ms "
+          f"{grid_time / stroke_time:>9.1f}x {diff:>12.2f}")
+
+print("=" * 78)
+print("Times are per image, including JPEG decode and encode.")
+print("Pixel diff is the mean absolute difference between the two outlines (0-255).")
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+In-process mock of the platform APIs the posting and video scripts call.
+
+One threaded HTTP server answers for:
+  Twitter v2     GET /2/users/me, POST /2/tweets
+  Graph API      GET /debug_token, GET /{id}, POST /{page}/feed,
+                 POST /{account}/media, GET /{container}, POST /{account}/media_publish,
+                 POST /{page}/videos (resumable upload_phase start/transfer/finish)
+  YouTube        POST /token, POST /upload/youtube/v3/videos, PUT /upload/session/{id}
+  S3             HEAD/GET /s3/{name} with Range and ETag
+
+Each platform has its own latency, error rate and request budget; the budget
+is reported in the platform's real rate-limit headers and, once spent,
+answered with the platform's rate-limit error. Point the scripts at the mock
+with configure_environment().
+"""
+
+import os
+import json
+import time
+import random
+import hashlib
+import threading
+from email import message_from_bytes
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+PAGE_ID = '100000000000001'
+INSTAGRAM_ACCOUNT_ID = '1784000000'
+RATE_LIMIT_WINDOW = 900
+
+class PlatformConfig:
+    def __init__(self, latency=0.0, error_rate=0.0, rate_limit=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+
+class MockPlatforms:
+    def __init__(self, twitter=None, graph=None, youtube=None, s3=None, polls_before_ready=0, seed=0):
+        self.config = {
+            'twitter': twitter or PlatformConfig(),
+            'graph': graph or PlatformConfig(),
+            'youtube': youtube or PlatformConfig(),
+            's3': s3 or PlatformConfig()
+        }
+        self.polls_before_ready = polls_before_ready
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls = {name: 0 for name in self.config}
+        self.errors = {name: 0 for name in self.config}
+        self.rate_limited = {name: 0 for name in self.config}
+        self.window_reset = int(time.time()) + RATE_LIMIT_WINDOW
+        self.objects = {}
+        self.containers = {}
+        self.uploads = {}
+        self.published = []
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def add_object(self, name, data):
+        """Serve data at /s3/{name}; returns its URL"""
+        self.objects[name] = data
+        return f'{self.url}/s3/{name}'
+
+    def configure_environment(self):
+        os.environ.update({
+            'TWITTER_API_URL': self.url,
+            'TWITTER_API_KEY': 'mock', 'TWITTER_API_SECRET': 'mock',
+            'TWITTER_ACCESS_TOKEN': 'mock', 'TWITTER_ACCESS_SECRET': 'mock',
+            'GRAPH_API_URL': self.url,
+            'GRAPH_VIDEO_URL': self.url,
+            'FACEBOOK_PAGE_ID': PAGE_ID, 'FACEBOOK_ACCESS_TOKEN': 'mock',
+            'INSTAGRAM_ACCOUNT_ID': INSTAGRAM_ACCOUNT_ID, 'INSTAGRAM_ACCESS_TOKEN': 'mock',
+            'YOUTUBE_API_URL': self.url,
+            'YOUTUBE_TOKEN_URI': f'{self.url}/token',
+            'YOUTUBE_CLIENT_ID': 'mock', 'YOUTUBE_CLIENT_SECRET': 'mock', 'YOUTUBE_REFRESH_TOKEN': 'mock'
+        })
+
+    def stats(self):
+        with self.lock:
+            return {name: {'calls': self.calls[name], 'errors': self.errors[name], 'rate_limited': self.rate_limited[name]}
+                    for name in self.config}
+
+    def admit(self, platform):
+        """Count a call and decide its fate: 'ok', 'error' or 'rate_limited', plus calls left in the window"""
+        config = self.config[platform]
+        if config.latency:
+            time.sleep(config.latency)
+        with self.lock:
+            now = int(time.time())
+            if now >= self.window_reset:
+                self.window_reset = now + RATE_LIMIT_WINDOW
+                self.calls = {name: 0 for name in self.config}
+            self.calls[platform] += 1
+            remaining = None if config.rate_limit is None else max(0, config.rate_limit - self.calls[platform])
+            if config.rate_limit is not None and self.calls[platform] > config.rate_limit:
+                self.rate_limited[platform] += 1
+                return 'rate_limited', remaining
+            if self.random.random() < config.error_rate:
+                self.errors[platform] += 1
+                return 'error', remaining
+        return 'ok', remaining
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def body(self):
+                length = int(self.headers.get('Content-Length', 0))
+                return self.rfile.read(length) if length else b''
+
+            def form(self):
+                data = self.body()
+                content_type = self.headers.get('Content-Type', '')
+                if content_type.startswith('multipart/form-data'):
+                    message = message_from_bytes(
+                        f'Content-Type: {content_type}\r\n\r\n'.encode() + data, policy=default_policy
+                    )
+                    return {part.get_param('name', header='content-disposition'): part.get_payload(decode=True)
+                            for part in message.iter_parts()}
+                if content_type.startswith('application/json'):
+                    return json.loads(data or b'{}')
+                return {key: values[0] for key, values in parse_qs(data.decode()).items()}
+
+            def send(self, status, data=None, headers=None, raw=None):
+                body = raw if raw is not None else (json.dumps(data).encode() if data is not None else b'')
+                self.send_response(status)
+                if data is not None:
+                    self.send_header('Content-Type', 'application/json')
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if self.command != 'HEAD':
+                    self.wfile.write(body)
+
+            def twitter_headers(self, remaining):
+                limit = mock.config['twitter'].rate_limit
+                if limit is None:
+                    return {}
+                return {'x-rate-limit-limit': str(limit), 'x-rate-limit-remaining': str(remaining),
+                        'x-rate-limit-reset': str(mock.window_reset)}
+
+            def graph_headers(self, remaining):
+                limit = mock.config['graph'].rate_limit
+                if limit is None:
+                    return {}
+                used = int((limit - remaining) / limit * 100)
+                return {'X-App-Usage': json.dumps({'call_count': used, 'total_cputime': 0, 'total_time': 0})}
+
+            def route(self):
+                path = urlparse(self.path).path.strip('/')
+                if path.startswith('2/'):
+                    return self.twitter(path)
+                if path.startswith('s3/'):
+                    return self.s3(path[3:])
+                if path == 'token' or path.startswith('upload/'):
+                    return self.youtube(path)
+                return self.graph(path)
+
+            do_GET = do_POST = do_PUT = do_HEAD = route
+
+            def twitter(self, path):
+                fate, remaining = mock.admit('twitter')
+                headers = self.twitter_headers(remaining)
+                self.body()
+                if fate == 'rate_limited':
+                    return self.send(429, {'title': 'Too Many Requests', 'detail': 'Too Many Requests'}, headers)
+                if fate == 'error':
+                    return self.send(503, {'title': 'Service Unavailable', 'detail': 'Mock failure'}, headers)
+                if path == '2/users/me':
+                    return self.send(200, {'data': {'id': '1', 'name': 'DadAssist', 'username': 'dad_assist'}}, headers)
+                if path == '2/tweets' and self.command == 'POST':
+                    tweet_id = str(int(time.time() * 1e6) + mock.random.randint(0, 999))
+                    return self.send(201, {'data': {'id': tweet_id, 'text': ''}}, headers)
+                self.send(404, {'title': 'Not Found'})
+
+            def graph(self, path):
+                fate, remaining = mock.admit('graph')
+                headers = self.graph_headers(remaining)
+                form = self.form() if self.command == 'POST' else {}
+                if fate == 'rate_limited':
+                    return self.send(400, {'error': {'message': 'Application request limit reached', 'code': 4}}, headers)
+                if fate == 'error':
+                    return self.send(500, {'error': {'message': 'An unexpected error has occurred', 'code': 2}}, headers)
+
+                if path == 'debug_token':
+                    return self.send(200, {'data': {'is_valid': True, 'expires_at': 0}}, headers)
+                if path == f'{PAGE_ID}/feed':
+                    return self.send(200, {'id': f'{PAGE_ID}_{mock.random.randint(1, 10 ** 9)}'}, headers)
+                if path == f'{PAGE_ID}/videos':
+                    return self.video_upload(form, headers)
+                if path == f'{INSTAGRAM_ACCOUNT_ID}/media':
+                    with mock.lock:
+                        creation_id = f'container_{len(mock.containers) + 1}'
+                        mock.containers[creation_id] = 0
+                    return self.send(200, {'id': creation_id}, headers)
+                if path == f'{INSTAGRAM_ACCOUNT_ID}/media_publish':
+                    creation_id = form.get('creation_id')
+                    with mock.lock:
+                        if mock.containers.get(creation_id, -1) < mock.polls_before_ready:
+                            return self.send(400, {'error': {'message': 'Media ID is not available', 'code': 9007}}, headers)
+                        mock.published.append(creation_id)
+                    return self.send(200, {'id': f'post_{creation_id}'}, headers)
+                if path in mock.containers:
+                    with mock.lock:
+                        mock.containers[path] += 1
+                        ready = mock.containers[path] > mock.polls_before_ready
+                    return self.send(200, {'id': path, 'status_code': 'FINISHED' if ready else 'IN_PROGRESS'}, headers)
+                if path in (PAGE_ID, INSTAGRAM_ACCOUNT_ID):
+                    return self.send(200, {'id': path, 'name': 'DadAssist', 'username': 'dadassist'}, headers)
+                self.send(404, {'error': {'message': 'Unknown path', 'code': 803}})
+
+            def video_upload(self, form, headers):
+                phase = form.get('upload_phase')
+                if isinstance(phase, bytes):
+                    phase = phase.decode()
+                chunk_size = 1024 * 1024
+                with mock.lock:
+                    if phase == 'start':
+                        session_id = f'session_{len(mock.uploads) + 1}'
+                        mock.uploads[session_id] = {'size': int(form['file_size']), 'data': bytearray()}
+                        end = min(chunk_size, int(form['file_size']))
+                        return self.send(200, {'upload_session_id': session_id, 'video_id': f'video_{session_id}',
+                                               'start_offset': '0', 'end_offset': str(end)}, headers)
+                    upload = mock.uploads.get(self.field(form, 'upload_session_id'))
+                    if upload is None:
+                        return self.send(400, {'error': {'message': 'Invalid upload session', 'code': 6000}})
+                    if phase == 'transfer':
+                        if int(self.field(form, 'start_offset')) != len(upload['data']):
+                            return self.send(400, {'error': {'message': 'Offset mismatch', 'code': 6001}})
+                        upload['data'].extend(form['video_file_chunk'])
+                        start = len(upload['data'])
+                        end = min(start + chunk_size, upload['size'])
+                        return self.send(200, {'start_offset': str(start), 'end_offset': str(end)}, headers)
+                    if phase == 'finish':
+                        return self.send(200, {'success': len(upload['data']) == upload['size']}, headers)
+                self.send(400, {'error': {'message': 'Unknown upload phase', 'code': 100}})
+
+            def field(self, form, name):
+                value = form.get(name)
+                return value.decode() if isinstance(value, bytes) else value
+
+            def youtube(self, path):
+                fate, _ = mock.admit('youtube')
+                data = self.body()
+                if path == 'token':
+                    return self.send(200, {'access_token': 'mock-access-token', 'expires_in': 3600, 'token_type': 'Bearer'})
+                if fate == 'rate_limited':
+                    return self.send(403, {'error': {'code': 403, 'message': 'quotaExceeded', 'errors': [{'reason': 'quotaExceeded'}]}})
+                if fate == 'error':
+                    return self.send(503, {'error': {'code': 503, 'message': 'Backend Error'}})
+                if path == 'upload/youtube/v3/videos' and self.command == 'POST':
+                    with mock.lock:
+                        session_id = str(len(mock.uploads) + 1)
+                        mock.uploads[session_id] = {'size': None, 'data': bytearray()}
+                    return self.send(200, {}, {'Location': f'{mock.url}/upload/session/{session_id}'})
+                if path.startswith('upload/session/') and self.command == 'PUT':
+                    return self.resumable_put(path.rsplit('/', 1)[1], data)
+                self.send(404, {'error': {'code': 404, 'message': 'Not Found'}})
+
+            def resumable_put(self, session_id, data):
+                upload = mock.uploads.get(session_id)
+                if upload is None:
+                    return self.send(404, {'error': {'code': 404, 'message': 'Upload session not found'}})
+                content_range = self.headers.get('Content-Range', '')
+                total = content_range.rsplit('/', 1)[-1]
+                if total != '*':
+                    upload['size'] = int(total)
+                if data:
+                    start = int(content_range.split(' ')[1].split('-')[0])
+                    if start != len(upload['data']):
+                        return self.send(400, {'error': {'code': 400, 'message': 'Offset mismatch'}})
+                    upload['data'].extend(data)
+                if upload['size'] is not None and len(upload['data']) == upload['size']:
+                    return self.send(200, {'id': f'yt{session_id}', 'status': {'uploadStatus': 'uploaded'}})
+                headers = {'Range': f"bytes=0-{len(upload['data']) - 1}"} if upload['data'] else {}
+                self.send(308, None, headers)
+
+            def s3(self, name):
+                fate, _ = mock.admit('s3')
+                data = mock.objects.get(name)
+                if data is None:
+                    return self.send(404, raw=b'NoSuchKey')
+                if fate == 'error':
+                    return self.send(503, raw=b'SlowDown')
+                headers = {'ETag': f'"{hashlib.md5(data).hexdigest()}"', 'Accept-Ranges': 'bytes'}
+                requested = self.headers.get('Range')
+                if requested:
+                    start, _, end = requested[len('bytes='):].partition('-')
+                    start, end = int(start), int(end) if end else len(data) - 1
+                    headers['Content-Range'] = f'bytes {start}-{end}/{len(data)}'
+                    return self.send(206, headers=headers, raw=data[start:end + 1])
+                self.send(200, headers=headers, raw=data)
+
+        return Handler
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test the Instagram container flow against a local Graph API stand-in.
+Containers report IN_PROGRESS for a few polls before FINISHED, so this
+exercises backoff polling, publish-on-ready, batch publishing and
+cancellation without touching the real API.
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+POLLS_BEFORE_READY = 3
+ACCOUNT_ID = '1784000000'
+
+containers = {}
+published = []
+lock = threading.Lock()
+
+class GraphStandIn(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlparse(self.path).path.strip('/')
+        if path == 'debug_token':
+            return self.send_json(200, {'data': {'is_valid': True, 'expires_at': 0}})
+        if path == ACCOUNT_ID:
+            return self.send_json(200, {'id': ACCOUNT_ID, 'username': 'dadassist_test'})
+        with lock:
+            if path not in containers:
+                return self.send_json(404, {'error': {'message': 'Unknown container'}})
+            containers[path] += 1
+            status = 'FINISHED' if containers[path] > POLLS_BEFORE_READY else 'IN_PROGRESS'
+        self.send_json(200, {'status_code': status, 'id': path})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        form = parse_qs(self.rfile.read(length).decode())
+        path = urlparse(self.path).path.strip('/')
+        with lock:
+            if path == f'{ACCOUNT_ID}/media':
+                creation_id = f'container_{len(containers) + 1}'
+                containers[creation_id] = 0
+                return self.send_json(200, {'id': creation_id})
+            if path == f'{ACCOUNT_ID}/media_publish':
+                creation_id = form['creation_id'][0]
+                if containers.get(creation_id, 0) <= POLLS_BEFORE_READY:
+                    return self.send_json(400, {'error': {'message': 'Media not ready'}})
+                published.append(creation_id)
+                return self.send_json(200, {'id': f'post_{creation_id}'})
+        self.send_json(404, {'error': {'message': 'Unknown endpoint'}})
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), GraphStandIn)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+os.environ['GRAPH_API_URL'] = f'http://127.0.0.1:{server.server_address[1]}'
+os.environ['INSTAGRAM_ACCESS_TOKEN'] = 'local-test-token'
+os.environ['INSTAGRAM_ACCOUNT_ID'] = ACCOUNT_ID
+os.environ['DADASSIST_CACHE_DIR'] = os.path.join('/tmp', f'dadassist-test-{os.getpid()}')
+sys.path.insert(0, 'scripts/platforms')
+
+import instagram_poster
+from instagram_poster import InstagramPoster
+
+# Keep the backoff short so the test runs quickly
+instagram_poster.POLL_INITIAL_DELAY = 0.05
+instagram_poster.POLL_MAX_DELAY = 0.2
+
+print("🧪 Instagram container flow against local Graph API stand-in")
+print("=" * 60)
+
+poster = InstagramPoster(dry_run=False)
+assert poster.authenticate(), "authentication failed"
+
+post = {'content': 'Test caption #DadAssist', 'character_count': 23, 'hashtags': ['#DadAssist']}
+
+print("\n1. Single post: create, poll, publish")
+start = time.perf_counter()
+result = poster.create_image_post(post, 'https://example.com/image.jpg')
+assert result['success'], result
+assert result['post_id'] == 'post_container_1', result
+print(f"✅ Published {result['post_id']} in {time.perf_counter() - start:.2f}s")
+
+print("\n2. Batch: create three containers up front, publish each when ready")
+start = time.perf_counter()
+results = poster.create_image_posts([(post, f'https://example.com/image{i}.jpg') for i in range(3)])
+assert all(r['success'] for r in results), results
+ids = [r['post_id'] for r in results]
+assert ids == sorted(ids, key=lambda i: int(i.rsplit('_', 1)[1])), ids
+print(f"✅ Batch published {', '.join(ids)} in {time.perf_counter() - start:.2f}s")
+
+print("\n3. Cancellation stops polling")
+cancelled_poster = InstagramPoster(dry_run=False)
+container = cancelled_poster.create_container(post)
+cancelled_poster.cancelled.set()
+result = cancelled_poster.publish_when_ready(container['creation_id'])
+assert not result['success'] and result['error'] == 'Cancelled', result
+assert container['creation_id'] not in published
+print("✅ Cancelled container was not published")
+
+server.shutdown()
+print("\n" + "=" * 60)
+print("✅ All Instagram stand-in checks passed")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+DadAssist Article Catalog
+Maintains posts/index.json, a machine-readable feed of every published article,
+so detection and selection jobs can diff the catalog instead of scraping index.html.
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime
+
+from static_compression import minify_html, write_sidecars
+
+CATALOG_PATH = '/var/www/dadassist/posts/index.json'
+INDEX_PATH = '/var/www/dadassist/posts/index.html'
+
+CATEGORY_NAMES = {
+    'childsupport': 'Child Support',
+    'parenting': 'Parenting & Custody',
+    'procedure': 'Legal Procedures',
+    'property': 'Property Settlement',
+    'familyviolence': 'Family Violence',
+    'conflict': 'Conflict Resolution'
+}
+
+def content_hash(content):
+    """
+    Stable hash of an article as published.
+
+    Hashes the minified page, so the generator's raw HTML and the file
+    publish_static wrote to disk give the same hash.
+    """
+    if isinstance(content, bytes):
+        content = content.decode('utf-8')
+    return hashlib.sha256(minify_html(content).encode('utf-8')).hexdigest()
+
+def seed_from_index(index_path=INDEX_PATH, articles_dir=None):
+    """Build catalog entries from the existing index.html (first run only)"""
+    from bs4 import BeautifulSoup
+
+    with open(index_path, 'r') as f:
+        soup = BeautifulSoup(f.read(), 'html.parser')
+
+    articles_dir = articles_dir or os.path.join(os.path.dirname(index_path), 'articles')
+    entries = {}
+
+    for link in soup.find_all('a', href=lambda x: x and x.startswith('articles/')):
+        filename = link['href'].replace('articles/', '')
+        description_div = link.find_next_sibling('div', class_='resource-description')
+        section = link.find_parent(attrs={'data-category': True})
+
+        article_path = os.path.join(articles_dir, filename)
+        if os.path.exists(article_path):
+            with open(article_path, 'r', encoding='utf-8') as f:
+                article_hash = content_hash(f.read())
+            updated = datetime.fromtimestamp(os.path.getmtime(article_path)).isoformat()
+        else:
+            article_hash = ''
+            updated = datetime.now().isoformat()
+
+        entries[filename] = {
+            'filename': filename,
+            'title': link.get_text().strip(),
+            'description': description_div.get_text().strip() if description_div else '',
+            'category': CATEGORY_NAMES.get(section['data-category'], '') if section else '',
+            'updated': updated,
+            'content_hash': article_hash
+        }
+
+    print(f'🌱 Seeded catalog with {len(entries)} articles from {index_path}')
+    return entries
+
+def load_catalog(catalog_path=CATALOG_PATH):
+    """Load catalog entries keyed by filename, seeding from index.html if missing"""
+    if os.path.exists(catalog_path):
+        with open(catalog_path, 'r') as f:
+            catalog = json.load(f)
+        return {entry['filename']: entry for entry in catalog.get('articles', [])}
+
+    if os.path.exists(INDEX_PATH):
+        return seed_from_index(INDEX_PATH)
+    return {}
+
+def write_catalog(entries, catalog_path=CATALOG_PATH):
+    """Write the catalog and its compressed sidecars, copying into the web root with sudo"""
+    catalog = {
+        'generated': datetime.now().isoformat(),
+        'article_count': len(entries),
+        'articles': sorted(entries.values(), key=lambda e: e['filename'])
+    }
+    data = json.dumps(catalog, separators=(',', ':'))
+
+    temp_path = '/tmp/index_temp.json'
+    with open(temp_path, 'w') as f:
+        f.write(data)
+    sidecars = write_sidecars(temp_path, data)
+
+    for source_path in [temp_path] + sidecars:
+        target_path = source_path.replace(temp_path, catalog_path)
+        os.system(f'sudo cp {source_path} {target_path}')
+        os.system(f'sudo chown www-data:www-data {target_path}')
+        os.system(f'sudo chmod 644 {target_path}')
+
+def update_catalog(filename, title, description, category, html_content, catalog_path=CATALOG_PATH):
+    """Add or update one article in the catalog; unchanged articles are not rewritten"""
+    try:
+        entries = load_catalog(catalog_path)
+        entry = {
+            'filename': filename,
+            'title': title,
+            'description': description,
+            'category': category,
+            'content_hash': content_hash(html_content)
+        }
+
+        # Everything but the timestamp, so any metadata edit reaches the feed
+        existing = entries.get(filename)
+        if existing and {k: v for k, v in existing.items() if k != 'updated'} == entry:
+            print(f'⏭️ Catalog already current for {filename}')
+            return True
+
+        entry['updated'] = datetime.now().isoformat()
+        entries[filename] = entry
+        write_catalog(entries, catalog_path)
+        print(f'✅ Updated catalog feed ({len(entries)} articles)')
+        return True
+
+    except Exception as e:
+        print(f'❌ Error updating catalog: {e}')
+        return False
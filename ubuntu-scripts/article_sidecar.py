@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+DadAssist Article Sidecars
+Writes a compact text + metadata JSON file next to each published article
+(articles/<name>.json) so the video pipeline can read the article text
+without downloading and parsing the published HTML.
+"""
+
+import os
+import re
+import json
+from datetime import datetime
+from html.parser import HTMLParser
+
+# Block-level tags that end a line of text
+_BLOCK_TAGS = {'p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'ul', 'ol', 'br', 'tr', 'blockquote'}
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in _BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+def html_to_text(html_content):
+    """Convert article HTML into plain text with one block per paragraph"""
+    extractor = _TextExtractor()
+    extractor.feed(html_content)
+    extractor.close()
+
+    # convert_charrefs already decoded entities; unescaping again would turn &amp;lt; into <
+    text = ''.join(extractor.parts)
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r'\n\s*\n+', '\n\n', text)
+    return text.strip()
+
+def sidecar_path(article_path):
+    """Path of the sidecar for an article path or URL"""
+    return os.path.splitext(article_path)[0] + '.json'
+
+def write_article_sidecar(article_path, title, category, article_content, content_hash):
+    """Write the text sidecar for a published article"""
+    text = html_to_text(article_content)
+    sidecar = {
+        'title': title,
+        'category': category,
+        'content': text,
+        'content_hash': content_hash,
+        'word_count': len(text.split()),
+        'char_count': len(text),
+        'generated': datetime.now().isoformat()
+    }
+
+    path = sidecar_path(article_path)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(sidecar, f, ensure_ascii=False)
+
+    print(f'📄 Text sidecar written: {path}')
+    return path
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+DadAssist Bedrock Batch Inference
+Writes model requests to a JSONL file, runs them as one Bedrock batch job
+(or through a local stand-in that processes the same file) and reads the
+outputs back keyed by record ID.
+
+Record format matches Bedrock model invocation jobs:
+  input:  {"recordId": "...", "modelInput": {...}}
+  output: {"recordId": "...", "modelInput": {...}, "modelOutput": {...}} or {..., "error": {...}}
+"""
+
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+
+DEFAULT_MODEL_ID = 'anthropic.claude-3-haiku-20240307-v1:0'
+BATCH_BUCKET = 'dadassist-video-work'
+BATCH_PREFIX = 'bedrock-batch'
+
+# Bedrock rejects batch jobs below this many records; smaller batches run locally
+MIN_BATCH_RECORDS = 100
+
+def build_request(prompt, max_tokens=2000):
+    """Build an Anthropic messages request body"""
+    return {
+        'anthropic_version': 'bedrock-2023-05-31',
+        'max_tokens': max_tokens,
+        'messages': [{'role': 'user', 'content': prompt}]
+    }
+
+def write_batch_input(requests_by_id, input_path):
+    """Write {record_id: request body} to a batch input JSONL file"""
+    os.makedirs(os.path.dirname(input_path) or '.', exist_ok=True)
+    with open(input_path, 'w') as f:
+        for record_id, body in requests_by_id.items():
+            f.write(json.dumps({'recordId': record_id, 'modelInput': body}) + '\n')
+    print(f"📝 Wrote {len(requests_by_id)} batch requests to {input_path}")
+    return input_path
+
+def read_batch_output(output_path):
+    """Read a batch output JSONL file into {record_id: text or None}"""
+    results = {}
+    with open(output_path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            output = record.get('modelOutput')
+            if output and output.get('content'):
+                results[record['recordId']] = output['content'][0]['text']
+            else:
+                print(f"⚠️ Batch record {record['recordId']} failed: {record.get('error', 'no output')}")
+                results[record['recordId']] = None
+    return results
+
+class LocalBatchRunner:
+    """Local stand-in for a Bedrock batch job: processes the input file with concurrent invoke_model calls"""
+
+    def __init__(self, bedrock=None, model_id=DEFAULT_MODEL_ID, region_name='us-east-1', max_workers=4):
+        self.bedrock = bedrock or boto3.client('bedrock-runtime', region_name=region_name)
+        self.model_id = model_id
+        self.max_workers = max_workers
+
+    def _process(self, record):
+        try:
+            response = self.bedrock.invoke_model(
+                modelId=self.model_id,
+                body=json.dumps(record['modelInput'])
+            )
+            record['modelOutput'] = json.loads(response['body'].read())
+        except Exception as e:
+            record['error'] = {'errorMessage': str(e)}
+        return record
+
+    def run(self, input_path):
+        """Process input_path and return the path of the output file"""
+        with open(input_path, 'r') as f:
+            records = [json.loads(line) for line in f if line.strip()]
+
+        print(f"🏠 Running {len(records)} batch records locally ({self.max_workers} workers)")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            processed = list(executor.map(self._process, records))
+
+        output_path = input_path + '.out'
+        with open(output_path, 'w') as f:
+            for record in processed:
+                f.write(json.dumps(record) + '\n')
+        return output_path
+
+class BedrockBatchRunner:
+    """Submits the input file as a Bedrock model invocation job and waits for the output"""
+
+    def __init__(self, role_arn=None, model_id=DEFAULT_MODEL_ID, region_name='us-east-1',
+                 bucket=BATCH_BUCKET, prefix=BATCH_PREFIX, poll_seconds=60):
+        self.role_arn = role_arn or os.getenv('BEDROCK_BATCH_ROLE_ARN')
+        self.model_id = model_id
+        self.bucket = bucket
+        self.prefix = prefix
+        self.poll_seconds = poll_seconds
+        self.bedrock = boto3.client('bedrock', region_name=region_name)
+        self.s3 = boto3.client('s3', region_name=region_name)
+
+    def run(self, input_path):
+        """Upload, submit, wait for completion and download the output; returns the local output path"""
+        if not self.role_arn:
+            raise ValueError('BEDROCK_BATCH_ROLE_ARN is required for Bedrock batch jobs')
+
+        job_name = f"dadassist-batch-{time.strftime('%Y%m%d-%H%M%S')}"
+        input_name = os.path.basename(input_path)
+        input_key = f"{self.prefix}/{job_name}/input/{input_name}"
+        output_prefix = f"{self.prefix}/{job_name}/output/"
+
+        self.s3.upload_file(input_path, self.bucket, input_key)
+        print(f"☁️ Uploaded batch input to s3://{self.bucket}/{input_key}")
+
+        job = self.bedrock.create_model_invocation_job(
+            jobName=job_name,
+            roleArn=self.role_arn,
+            modelId=self.model_id,
+            inputDataConfig={'s3InputDataConfig': {'s3Uri': f"s3://{self.bucket}/{input_key}"}},
+            outputDataConfig={'s3OutputDataConfig': {'s3Uri': f"s3://{self.bucket}/{output_prefix}"}}
+        )
+        job_arn = job['jobArn']
+        print(f"🚀 Submitted Bedrock batch job: {job_arn}")
+
+        while True:
+            status = self.bedrock.get_model_invocation_job(jobIdentifier=job_arn)['status']
+            print(f"⏳ Batch job status: {status}")
+            if status in ('Completed', 'PartiallyCompleted'):
+                break
+            if status in ('Failed', 'Stopped', 'Expired'):
+                raise RuntimeError(f'Bedrock batch job {job_arn} ended with status {status}')
+            time.sleep(self.poll_seconds)
+
+        # Output lands under <output prefix>/<job id>/<input file>.out
+        job_id = job_arn.split('/')[-1]
+        output_key = f"{output_prefix}{job_id}/{input_name}.out"
+        output_path = input_path + '.out'
+        self.s3.download_file(self.bucket, output_key, output_path)
+        print(f"📥 Downloaded batch output to {output_path}")
+        return output_path
+
+def run_batch(requests_by_key, work_dir, runner=None, **runner_kwargs):
+    """
+    Run {key: request body} as a single batch and return {key: text or None}.
+
+    Batches too small for Bedrock, or runs without a configured batch role,
+    use the local stand-in unless a runner is passed explicitly.
+    """
+    if runner is None:
+        if len(requests_by_key) >= MIN_BATCH_RECORDS and os.getenv('BEDROCK_BATCH_ROLE_ARN'):
+            runner = BedrockBatchRunner(**runner_kwargs)
+        else:
+            runner = LocalBatchRunner(**runner_kwargs)
+
+    # Bedrock record IDs are 11-character alphanumeric strings
+    keys_by_record = {f"REC{i:08d}": key for i, key in enumerate(requests_by_key)}
+    requests_by_id = {record_id: requests_by_key[key] for record_id, key in keys_by_record.items()}
+
+    input_path = write_batch_input(requests_by_id, os.path.join(work_dir, 'batch_input.jsonl'))
+    output_path = runner.run(input_path)
+    results = read_batch_output(output_path)
+
+    return {key: results.get(record_id) for record_id, key in keys_by_record.items()}
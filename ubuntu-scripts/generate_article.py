@@ -6,6 +6,11 @@ import os
 from datetime import datetime
 import boto3
 import json
+from content_summarizer import condense_content, bedrock_invoker
+from static_compression import minify_html, publish_static, write_sidecars
+from bedrock_batch import build_request, run_batch
+from article_catalog import update_catalog, content_hash
+from article_sidecar import write_article_sidecar
 
 class ArticleGenerator:
     def __init__(self):
@@ -16,11 +21,26 @@ class ArticleGenerator:
         except Exception as e:
             print(f"Warning: Could not initialize Bedrock client: {e}")
             self.bedrock = None
+        
+        # Upper bound on source material sent in a single prompt
+        self.max_source_tokens = 6000
 
-    def generate_article_content(self, scraped_content, title, category):
-        prompt = f'''Create a comprehensive DadAssist article for Australian fathers.
+    def condense_source(self, scraped_content):
+        """Condense long scraped content into a bounded-size prompt input"""
+        if not self.bedrock:
+            return condense_content(scraped_content, max_tokens=self.max_source_tokens)
+        return condense_content(
+            scraped_content,
+            invoke=bedrock_invoker(self.bedrock, self.model_id),
+            max_tokens=self.max_source_tokens
+        )
 
-Use this source content: {scraped_content}
+    def build_article_prompt(self, scraped_content, title, category):
+        """Build the article generation prompt"""
+        source_content = self.condense_source(scraped_content)
+        return f'''Create a comprehensive DadAssist article for Australian fathers.
+
+Use this source content: {source_content}
 
 CRITICAL: Generate ONLY the HTML content that goes inside the article div. Use proper HTML tags:
 - <p> for paragraphs
@@ -36,20 +56,13 @@ Category: {category}
 
 Generate comprehensive, father-focused content with proper HTML formatting.'''
 
+    def generate_article_content(self, scraped_content, title, category):
         if self.bedrock:
             try:
+                prompt = self.build_article_prompt(scraped_content, title, category)
                 response = self.bedrock.invoke_model(
                     modelId=self.model_id,
-                    body=json.dumps({
-                        'anthropic_version': 'bedrock-2023-05-31',
-                        'max_tokens': 4000,
-                        'messages': [
-                            {
-                                'role': 'user',
-                                'content': prompt
-                            }
-                        ]
-                    })
+                    body=json.dumps(build_request(prompt, max_tokens=4000))
                 )
                 
                 response_body = json.loads(response['body'].read())
@@ -320,14 +333,18 @@ Generate comprehensive, father-focused content with proper HTML formatting.'''
                 if ul_end > 0:
                     index_content = index_content[:ul_end] + new_entry + index_content[ul_end:]
                     
-                    # Write to temp file
+                    # Write minified index and precompressed sidecars to temp files
+                    index_content = minify_html(index_content)
                     with open('/tmp/index_temp.html', 'w') as f:
                         f.write(index_content)
+                    sidecars = write_sidecars('/tmp/index_temp.html', index_content)
                     
                     # Copy with sudo
-                    os.system('sudo cp /tmp/index_temp.html /var/www/dadassist/posts/index.html')
-                    os.system('sudo chown www-data:www-data /var/www/dadassist/posts/index.html')
-                    os.system('sudo chmod 644 /var/www/dadassist/posts/index.html')
+                    for temp_path in ['/tmp/index_temp.html'] + sidecars:
+                        target_path = temp_path.replace('/tmp/index_temp.html', index_path)
+                        os.system(f'sudo cp {temp_path} {target_path}')
+                        os.system(f'sudo chown www-data:www-data {target_path}')
+                        os.system(f'sudo chmod 644 {target_path}')
                     
                     print(f'✅ Updated index with article in {category} section')
                     return True
@@ -351,6 +368,10 @@ Generate comprehensive, father-focused content with proper HTML formatting.'''
         if not article_content:
             return None, None
         
+        return self.publish_article(title, article_content, category, filename)
+
+    def publish_article(self, title, article_content, category, filename=None):
+        """Wrap generated content in the article template, deploy it and update the index"""
         # Use provided filename or generate from title
         if filename:
             if not filename.endswith('.html'):
@@ -369,8 +390,10 @@ Generate comprehensive, father-focused content with proper HTML formatting.'''
         # Deploy article
         output_path = f"/var/www/dadassist/posts/articles/{filename}"
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # Minified HTML plus .gz/.br sidecars; unchanged pages are left untouched
+            publish_static(output_path, html_content)
+            # Text sidecar lets the video pipeline skip re-scraping this page
+            write_article_sidecar(output_path, title, category, article_content, content_hash(html_content))
             article_url = f"https://dadassist.com.au/posts/articles/{filename}"
             print(f'✅ Article deployed to: {output_path}')
         except Exception as e:
@@ -394,6 +417,11 @@ Generate comprehensive, father-focused content with proper HTML formatting.'''
         
         index_updated = self.update_index(title, filename, category, description)
         
+        # Keep the machine-readable catalog feed (posts/index.json) in step with the index;
+        # skipped when the index update failed so the two never list different articles
+        if index_updated:
+            update_catalog(filename, title, description, category, html_content)
+        
         if index_updated:
             print(f'🎉 Article generation complete!')
             print(f'🌐 Live URL: {article_url}')
@@ -402,17 +430,63 @@ Generate comprehensive, father-focused content with proper HTML formatting.'''
             print(f'⚠️ Article deployed but index update failed')
             return article_url, filename
 
+    def generate_articles_batch(self, articles, work_dir='/tmp/article_batch', runner=None):
+        """
+        Generate many articles as a single Bedrock batch job.
+
+        articles is a list of dicts with content, title, category and optional
+        filename. Outputs are fanned back out through publish_article; records
+        that fail in the batch fall back to the formatted source content.
+        """
+        print(f'📦 Batch generating {len(articles)} articles')
+        os.makedirs(work_dir, exist_ok=True)
+        
+        requests_by_key = {}
+        for i, article in enumerate(articles):
+            prompt = self.build_article_prompt(article['content'], article['title'], article['category'])
+            requests_by_key[i] = build_request(prompt, max_tokens=4000)
+        
+        outputs = run_batch(requests_by_key, work_dir, runner=runner,
+                            model_id=self.model_id, region_name='ap-southeast-2')
+        
+        results = []
+        for i, article in enumerate(articles):
+            article_content = outputs.get(i) or self.format_scraped_content(article['content'])
+            results.append(self.publish_article(
+                article['title'], article_content, article['category'], article.get('filename')
+            ))
+        
+        published = sum(1 for url, _ in results if url)
+        print(f'📦 Batch complete: {published}/{len(articles)} articles published')
+        return results
+
 def main():
     parser = argparse.ArgumentParser(description='Generate DadAssist article from scraped content')
-    parser.add_argument('--content', required=True, help='Scraped legal content')
-    parser.add_argument('--title', required=True, help='Article title')
-    parser.add_argument('--category', required=True, help='Article category')
+    parser.add_argument('--content', help='Scraped legal content')
+    parser.add_argument('--title', help='Article title')
+    parser.add_argument('--category', help='Article category')
     parser.add_argument('--filename', required=False, help='Filename to use (optional)')
+    parser.add_argument('--batch', required=False,
+                        help='JSON file listing articles (content, title, category, filename) to generate as one batch job')
     
     args = parser.parse_args()
     
     generator = ArticleGenerator()
     
+    if args.batch:
+        with open(args.batch, 'r') as f:
+            articles = json.load(f)
+        results = generator.generate_articles_batch(articles)
+        failed = [a['title'] for a, (url, _) in zip(articles, results) if not url]
+        if failed:
+            print(f"ERROR: {len(failed)} articles failed: {', '.join(failed)}")
+            sys.exit(1)
+        print(f"SUCCESS: {len(results)} articles")
+        return
+    
+    if not (args.content and args.title and args.category):
+        parser.error('--content, --title and --category are required unless --batch is used')
+    
     # Pass filename to generator if provided
     if args.filename:
         result = generator.generate_complete_article(args.content, args.title, args.category, args.filename)
@@ -11,6 +11,8 @@ import boto3
 import json
 from datetime import datetime
 from bs4 import BeautifulSoup
+from content_summarizer import condense_content, bedrock_invoker
+from bedrock_batch import build_request, run_batch
 
 def create_pexels_video_background(slide_data, audio_data, work_dir, article_name):
     """Create FFmpeg filter for timed video segments"""
@@ -86,11 +88,17 @@ def select_best_matching_videos(slide_data, library_videos):
         for slide in slide_data:
             all_text += slide.get('content', '') + " "
         
+        # Use Bedrock to analyze and select videos
+        bedrock = boto3.client('bedrock-runtime', region_name='us-east-1')
+        
+        # Condense slide text to a bounded size instead of cutting mid-sentence
+        content_summary = condense_content(all_text, invoke=bedrock_invoker(bedrock), max_tokens=375)
+        
         # Create Bedrock prompt for video selection
         prompt = f"""
         Analyze this family law article content and select the 10 best matching videos in optimal sequence:
         
-        Content: {all_text[:1500]}
+        Content: {content_summary}
         
         Available videos and their themes:
         {chr(10).join([f"{video}: {', '.join(keywords)}" for video, keywords in video_metadata.items()])}
@@ -104,9 +112,6 @@ def select_best_matching_videos(slide_data, library_videos):
         Return only a JSON array of filenames: ["video1.mp4", "video2.mp4", ...]
         """
         
-        # Use Bedrock to analyze and select videos
-        bedrock = boto3.client('bedrock-runtime', region_name='us-east-1')
-        
         response = bedrock.invoke_model(
             modelId='anthropic.claude-3-haiku-20240307-v1:0',
             body=json.dumps({
@@ -1308,22 +1313,19 @@ Keep each bullet point under 60 characters and focus on actionable advice.
         print(f"  ❌ Error creating branded slides: {e}")
         return None
 
-def enhance_script_with_bedrock(article_data):
-    """Use Bedrock to create engaging voiceover script from article content"""
+def build_script_prompt(article_data, bedrock):
+    """Build the video script prompt, condensing long article content first"""
     
-    print(f"🤖 Step 3: Enhancing script with Bedrock")
+    # Condense long articles with parallel map-reduce summarisation
+    article_content = condense_content(article_data['content'], invoke=bedrock_invoker(bedrock), max_tokens=750)
+    print(f"  🧩 Article content: {len(article_data['content'])} → {len(article_content)} characters")
     
-    try:
-        # Initialize Bedrock client
-        print("  🔧 Initializing Bedrock client...")
-        bedrock = boto3.client('bedrock-runtime', region_name='us-east-1')
-        
-        # Create prompt for video script enhancement
-        prompt = f"""
+    # Create prompt for video script enhancement
+    prompt = f"""
 Transform this legal article into an engaging 2-3 minute video script for Australian fathers.
 
 Article Title: {article_data['title']}
-Article Content: {article_data['content'][:3000]}...
+Article Content: {article_content}
 
 Requirements:
 1. Create a conversational, supportive tone
@@ -1343,6 +1345,61 @@ Format as JSON with sections:
   "conclusion": "Call to action and wrap-up (30 seconds)"
 }}
 """
+    
+    return prompt
+
+def parse_script_response(enhanced_script):
+    """Parse Bedrock script output into sections, splitting raw text if it is not JSON"""
+    
+    # Try to parse as JSON
+    try:
+        script_json = json.loads(enhanced_script)
+        print("  ✅ Successfully parsed script as JSON")
+        
+        # Validate required sections
+        required_sections = ['hook', 'section1', 'section2', 'section3', 'conclusion']
+        missing_sections = [s for s in required_sections if s not in script_json]
+        
+        if missing_sections:
+            print(f"  ⚠️  Missing sections: {missing_sections}")
+        else:
+            print("  ✅ All required sections present")
+        
+        return {
+            'enhanced_script': script_json,
+            'raw_response': enhanced_script,
+            'sections': list(script_json.keys()),
+            'total_sections': len(script_json)
+        }
+        
+    except json.JSONDecodeError:
+        print("  ⚠️  Response not valid JSON, using as raw text")
+        # Fallback: split into sections manually
+        sections = enhanced_script.split('\n\n')
+        return {
+            'enhanced_script': {
+                'hook': sections[0] if len(sections) > 0 else enhanced_script[:200],
+                'section1': sections[1] if len(sections) > 1 else enhanced_script[200:400],
+                'section2': sections[2] if len(sections) > 2 else enhanced_script[400:600],
+                'section3': sections[3] if len(sections) > 3 else enhanced_script[600:800],
+                'conclusion': sections[4] if len(sections) > 4 else enhanced_script[800:]
+            },
+            'raw_response': enhanced_script,
+            'sections': ['hook', 'section1', 'section2', 'section3', 'conclusion'],
+            'total_sections': 5
+        }
+
+def enhance_script_with_bedrock(article_data):
+    """Use Bedrock to create engaging voiceover script from article content"""
+    
+    print(f"🤖 Step 3: Enhancing script with Bedrock")
+    
+    try:
+        # Initialize Bedrock client
+        print("  🔧 Initializing Bedrock client...")
+        bedrock = boto3.client('bedrock-runtime', region_name='us-east-1')
+        
+        prompt = build_script_prompt(article_data, bedrock)
 
         print(f"  📝 Prompt length: {len(prompt)} characters")
         
@@ -1379,48 +1436,49 @@ Format as JSON with sections:
             f.write(enhanced_script)
         print(f"  💾 Saved full Bedrock output to: {bedrock_output_file}")
         
-        # Try to parse as JSON
-        try:
-            script_json = json.loads(enhanced_script)
-            print("  ✅ Successfully parsed script as JSON")
-            
-            # Validate required sections
-            required_sections = ['hook', 'section1', 'section2', 'section3', 'conclusion']
-            missing_sections = [s for s in required_sections if s not in script_json]
-            
-            if missing_sections:
-                print(f"  ⚠️  Missing sections: {missing_sections}")
-            else:
-                print("  ✅ All required sections present")
-            
-            return {
-                'enhanced_script': script_json,
-                'raw_response': enhanced_script,
-                'sections': list(script_json.keys()),
-                'total_sections': len(script_json)
-            }
-            
-        except json.JSONDecodeError:
-            print("  ⚠️  Response not valid JSON, using as raw text")
-            # Fallback: split into sections manually
-            sections = enhanced_script.split('\n\n')
-            return {
-                'enhanced_script': {
-                    'hook': sections[0] if len(sections) > 0 else enhanced_script[:200],
-                    'section1': sections[1] if len(sections) > 1 else enhanced_script[200:400],
-                    'section2': sections[2] if len(sections) > 2 else enhanced_script[400:600],
-                    'section3': sections[3] if len(sections) > 3 else enhanced_script[600:800],
-                    'conclusion': sections[4] if len(sections) > 4 else enhanced_script[800:]
-                },
-                'raw_response': enhanced_script,
-                'sections': ['hook', 'section1', 'section2', 'section3', 'conclusion'],
-                'total_sections': 5
-            }
+        return parse_script_response(enhanced_script)
         
     except Exception as e:
         print(f"  ❌ Error calling Bedrock: {e}")
         return None
 
+def generate_scripts_batch(article_urls, output_dir, runner=None):
+    """Generate video scripts for many articles as a single Bedrock batch job"""
+    
+    print(f"📦 Batch generating scripts for {len(article_urls)} articles")
+    os.makedirs(output_dir, exist_ok=True)
+    bedrock = boto3.client('bedrock-runtime', region_name='us-east-1')
+    
+    articles = {}
+    requests_by_key = {}
+    for url in article_urls:
+        article_data = fetch_article_content(url)
+        if not article_data:
+            continue
+        article_name = url.split("/")[-1].replace(".html", "")
+        articles[article_name] = article_data
+        requests_by_key[article_name] = build_request(build_script_prompt(article_data, bedrock), max_tokens=2000)
+    
+    outputs = run_batch(requests_by_key, output_dir, runner=runner)
+    
+    # Fan outputs back into one script file per article
+    script_files = {}
+    for article_name, enhanced_script in outputs.items():
+        if not enhanced_script:
+            print(f"  ❌ No script generated for {article_name}")
+            continue
+        script_data = parse_script_response(enhanced_script)
+        script_data['article_title'] = articles[article_name]['title']
+        script_data['article_url'] = articles[article_name]['url']
+        
+        script_file = os.path.join(output_dir, f"{article_name}_script.json")
+        with open(script_file, 'w') as f:
+            json.dump(script_data, f, indent=2)
+        script_files[article_name] = script_file
+    
+    print(f"📦 Batch complete: {len(script_files)}/{len(article_urls)} scripts written to {output_dir}")
+    return script_files
+
 def generate_audio_with_polly(script_data, work_dir):
     """Generate audio files using Amazon Polly with Arthur voice"""
     
@@ -1507,11 +1565,54 @@ def generate_audio_with_polly(script_data, work_dir):
         print(f"  ❌ Error generating audio with Polly: {e}")
         return None
 
+ARTICLES_DIR = "/var/www/dadassist/posts/articles"
+
+def load_article_sidecar(url):
+    """Load the publisher's text sidecar for an article, locally or over HTTP"""
+    
+    sidecar_name = url.split("/")[-1].replace(".html", ".json")
+    local_path = os.path.join(ARTICLES_DIR, sidecar_name)
+    
+    try:
+        if os.path.exists(local_path):
+            with open(local_path, 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+            print(f"  📄 Using local text sidecar: {local_path}")
+        else:
+            response = requests.get(url.rsplit("/", 1)[0] + "/" + sidecar_name, timeout=10)
+            if response.status_code != 200:
+                return None
+            sidecar = response.json()
+            print(f"  📄 Using published text sidecar: {sidecar_name}")
+    except Exception as e:
+        print(f"  ⚠️  Could not read text sidecar: {e}")
+        return None
+    
+    content_text = sidecar.get('content', '')
+    if not content_text:
+        return None
+    
+    return {
+        'title': sidecar.get('title') or "DadAssist Legal Article",
+        'content': content_text,
+        'url': url,
+        'category': sidecar.get('category', ''),
+        'word_count': len(content_text.split()),
+        'char_count': len(content_text)
+    }
+
 def fetch_article_content(url):
     """Fetch and extract article content from DadAssist URL"""
     
     print(f"📥 Step 2: Fetching article content from {url}")
     
+    # Prefer the text sidecar written at publish time over scraping the HTML
+    article_data = load_article_sidecar(url)
+    if article_data:
+        print(f"  📝 Title: {article_data['title']}")
+        print(f"  📊 Extracted {article_data['char_count']} characters")
+        return article_data
+    
     try:
         # Download the HTML page
         print("  🌐 Downloading HTML...")
@@ -1592,6 +1693,17 @@ def main():
         print("Usage: python3 generate_video.py 'https://dadassist.com.au/posts/articles/article-name.html'")
         return None
     
+    # Batch mode: regenerate scripts for a list of article URLs in one Bedrock job
+    if sys.argv[1] == '--batch-scripts':
+        if len(sys.argv) < 3:
+            print("Usage: python3 generate_video.py --batch-scripts urls.txt [output_dir]")
+            return None
+        with open(sys.argv[2], 'r') as f:
+            article_urls = [line.strip() for line in f if line.strip()]
+        output_dir = sys.argv[3] if len(sys.argv) > 3 else f"/tmp/video_scripts_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        script_files = generate_scripts_batch(article_urls, output_dir)
+        return output_dir if script_files else None
+    
     article_url = sys.argv[1]
     print(f"📝 Input URL: {article_url}")
     
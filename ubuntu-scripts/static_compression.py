@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+DadAssist Static Compression
+Minifies published HTML and writes gzip/brotli sidecar files (page.html.gz, page.html.br)
+so the web server can serve precompressed bytes (nginx gzip_static / brotli_static).
+"""
+
+import os
+import re
+import gzip
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SIDECAR_SUFFIXES = ('.gz', '.br') if brotli is not None else ('.gz',)
+
+# Tags whose contents must be left untouched by minification
+_PRESERVED_BLOCK = re.compile(r'(<(pre|textarea|script)\b.*?</\2\s*>)', re.IGNORECASE | re.DOTALL)
+_STYLE_BLOCK = re.compile(r'(<style\b[^>]*>)(.*?)(</style\s*>)', re.IGNORECASE | re.DOTALL)
+_COMMENT = re.compile(r'<!--(?!\[if).*?-->', re.DOTALL)
+
+def _collapse_whitespace(text):
+    """Collapse whitespace runs, keeping a single newline where one existed"""
+    return re.sub(r'\s+', lambda m: '\n' if '\n' in m.group() else ' ', text)
+
+def _minify_css(css):
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};])\s*', r'\1', css).strip()
+
+def minify_html(html):
+    """Conservatively minify HTML without changing how it renders"""
+    parts = _PRESERVED_BLOCK.split(html)
+    minified = []
+
+    # split() yields [text, block, tag_name, text, block, tag_name, ...]
+    for i in range(0, len(parts), 3):
+        text = _COMMENT.sub('', parts[i])
+        text = _STYLE_BLOCK.sub(lambda m: m.group(1) + _minify_css(m.group(2)) + m.group(3), text)
+        minified.append(_collapse_whitespace(text))
+        if i + 1 < len(parts):
+            minified.append(parts[i + 1])
+
+    return ''.join(minified).strip() + '\n'
+
+def build_sidecars(data):
+    """Return {suffix: compressed bytes} for every available encoding"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    sidecars = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        sidecars['.br'] = brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)
+    return sidecars
+
+def sidecars_current(path):
+    """Check whether every sidecar for path exists and is at least as new as path"""
+    if not os.path.exists(path):
+        return False
+
+    source_mtime = os.path.getmtime(path)
+    for suffix in SIDECAR_SUFFIXES:
+        sidecar = path + suffix
+        if not os.path.exists(sidecar) or os.path.getmtime(sidecar) < source_mtime:
+            return False
+    return True
+
+def write_sidecars(path, data):
+    """Write compressed sidecars for path, returning the sidecar paths written"""
+    written = []
+    for suffix, compressed in build_sidecars(data).items():
+        sidecar = path + suffix
+        with open(sidecar, 'wb') as f:
+            f.write(compressed)
+        written.append(sidecar)
+    return written
+
+def publish_static(path, content):
+    """
+    Write minified HTML plus compressed sidecars to path.
+
+    Unchanged pages are skipped entirely so repeated publishes only touch
+    the files that actually changed. Returns True if anything was written.
+    """
+    minified = minify_html(content).encode('utf-8')
+
+    if os.path.exists(path) and sidecars_current(path):
+        with open(path, 'rb') as f:
+            if f.read() == minified:
+                print(f'⏭️ Unchanged, skipping: {path}')
+                return False
+
+    with open(path, 'wb') as f:
+        f.write(minified)
+    sidecars = write_sidecars(path, minified)
+
+    saved = len(content.encode('utf-8')) - len(minified)
+    print(f'🗜️ Published {path} ({saved} bytes minified, sidecars: {", ".join(os.path.basename(s) for s in sidecars)})')
+    return True
+
+def precompress_tree(root, extensions=('.html', '.css', '.js', '.json', '.svg', '.txt')):
+    """Backfill sidecars for an existing site, skipping files whose sidecars are current"""
+    updated = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if not name.endswith(extensions):
+                continue
+            path = os.path.join(dirpath, name)
+            if sidecars_current(path):
+                continue
+            with open(path, 'rb') as f:
+                write_sidecars(path, f.read())
+            updated += 1
+    print(f'✅ Precompressed {updated} files under {root}')
+    return updated
+
+if __name__ == '__main__':
+    import sys
+    precompress_tree(sys.argv[1] if len(sys.argv) > 1 else '/var/www/dadassist')